@@ -2,33 +2,36 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
-
-from autogen import GroupChat, GroupChatManager
-from autogen.agentchat import AssistantAgent, UserProxyAgent, register_function
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from application.dtos.agent_app_request import AgentAppRequest
 from application.enums.llm_provider import LLMProvider
 from application.interfaces.llm_interface import LLMInterface
 from application.factories.llm_provider_factory import LLMProviderFactory
 
-from infrastructure.agents.webscraper.webscraper_agent import WebScraperAgent
-from infrastructure.llms_providers.llm_studio.llm_studio import LLMStudio
-from infrastructure.llms_providers.gemini.gemini import Gemini
+from infrastructure.llms_providers.cached.cached_llm import CachedLLM
+from infrastructure.llms_providers.cached.services.response_cache import get_shared_response_cache
+from config.settings import LLM_CACHE_ENABLED
 
-from infrastructure.autogen_agents.planner_agent import PlannerAgentFactory
-from infrastructure.autogen_adapters.agent_autogen_wrapper import AgentAutoGenWrapper
-from infrastructure.agents.wikipedia.wikipedia_agent import WikipediaAgent
-from infrastructure.agents.email.email_agent import EmailAgent
+# autogen, los SDK de cada proveedor y los agentes (numpy, bs4...) se importan
+# dentro de los métodos que los usan: importar este módulo no debe cargarlos.
+# Ver benchmarks/profile_imports.py.
+if TYPE_CHECKING:
+    from autogen import GroupChatManager
+    from autogen.agentchat import AssistantAgent, UserProxyAgent
+    from infrastructure.autogen_adapters.agent_autogen_wrapper import AgentAutoGenWrapper
 
 logger = logging.getLogger(__name__)
 
+# Llamadas a herramienta del flujo del planner: web_scrape → price_analyze → send_email
+_WORKFLOW_TOOL_CALLS = 3
+
 
 class DependencyInjector:
     """
     Inyector de dependencias:
-      • Cachea proveedores LLM.
-      • Crea y cachea un único set de wrappers (Wikipedia, Email).
+      • Cachea proveedores LLM (envueltos en CachedLLM si LLM_CACHE_ENABLED).
+      • Crea y cachea un único set de wrappers (Scraper, Precios, Email).
       • Construye planner y GroupChatManager con coherencia de instancias.
     """
 
@@ -37,21 +40,36 @@ class DependencyInjector:
     _wrapper_cache: Optional[List[AgentAutoGenWrapper]] = None
 
     # ─────── HELPERS LLM PROVIDER ───────
+    # Cada helper importa su proveedor: solo se carga el SDK del que se pide
     @staticmethod
     def _llm_studio() -> LLMInterface:
+        from infrastructure.llms_providers.llm_studio.llm_studio import LLMStudio
         return LLMStudio()
 
     @staticmethod
     def _gemini() -> LLMInterface:
+        from infrastructure.llms_providers.gemini.gemini import Gemini
         return Gemini()
 
+    @staticmethod
+    def _router() -> LLMInterface:
+        from infrastructure.llms_providers.router.llm_router import build_router
+        return build_router()
+
+    @staticmethod
+    def _provider_factory() -> LLMProviderFactory:
+        return LLMProviderFactory({
+            LLMProvider.LLM_STUDIO: DependencyInjector._llm_studio,
+            LLMProvider.GEMINI:     DependencyInjector._gemini,
+            LLMProvider.ROUTER:     DependencyInjector._router,
+        })
+
     @staticmethod
     def get_llm_provider(llm_type: LLMProvider) -> LLMInterface:
         if llm_type not in DependencyInjector._provider_cache:
-            provider = LLMProviderFactory(
-                llm_studio_provider=DependencyInjector._llm_studio(),
-                gemini_provider=DependencyInjector._gemini(),
-            ).get_provider(llm_type)
+            provider = DependencyInjector._provider_factory().get_provider(llm_type)
+            if LLM_CACHE_ENABLED:
+                provider = CachedLLM(provider)
             DependencyInjector._provider_cache[llm_type] = provider
             logger.info("Proveedor LLM «%s» inicializado.", llm_type.value)
         return DependencyInjector._provider_cache[llm_type]
@@ -59,6 +77,8 @@ class DependencyInjector:
     # ─────── USER PROXY ───────
     @staticmethod
     def _user_agent() -> UserProxyAgent:
+        from autogen.agentchat import UserProxyAgent
+
         return UserProxyAgent(
             name="usuario",
             human_input_mode="ALWAYS",
@@ -69,9 +89,16 @@ class DependencyInjector:
     @staticmethod
     def _build_wrappers() -> List[AgentAutoGenWrapper]:
         if DependencyInjector._wrapper_cache is None:
+            from infrastructure.autogen_adapters.agent_autogen_wrapper import AgentAutoGenWrapper
+            from infrastructure.agents.webscraper.webscraper_agent import WebScraperAgent
+            from infrastructure.agents.price_analyzer.price_analyzer_agent import PriceAnalyzerAgent
+            from infrastructure.agents.email.email_agent import EmailAgent
+            # from infrastructure.agents.wikipedia.wikipedia_agent import WikipediaAgent
+
             DependencyInjector._wrapper_cache = [
                 # AgentAutoGenWrapper("wikipedia", WikipediaAgent, WikipediaAgent()),
                 AgentAutoGenWrapper("scraper", WebScraperAgent, WebScraperAgent()),
+                AgentAutoGenWrapper("prices",  PriceAnalyzerAgent, PriceAnalyzerAgent()),
                 AgentAutoGenWrapper("email",     EmailAgent,     EmailAgent()),
             ]
         return DependencyInjector._wrapper_cache
@@ -79,6 +106,8 @@ class DependencyInjector:
     # ─────── PLANNER ───────
     @staticmethod
     def _planner_agent(llm_type: LLMProvider) -> AssistantAgent:
+        from infrastructure.autogen_agents.planner_agent import PlannerAgentFactory
+
         provider   = DependencyInjector.get_llm_provider(llm_type)
         wrappers   = DependencyInjector._build_wrappers() 
         function_list = [fn for w in wrappers for fn in w.get_function_list()]
@@ -87,6 +116,10 @@ class DependencyInjector:
     # ─────── GROUP CHAT MANAGER ───────
     @staticmethod
     def _group_chat_manager(llm_type: LLMProvider) -> GroupChatManager:
+        from autogen import GroupChat, GroupChatManager
+        from autogen.agentchat import register_function
+        from infrastructure.autogen_adapters.mappers.function_execution_mapper import FunctionExecutionMapper
+
         provider = DependencyInjector.get_llm_provider(llm_type)
         planner  = DependencyInjector._planner_agent(llm_type)
         wrappers = DependencyInjector._build_wrappers()   
@@ -104,14 +137,11 @@ class DependencyInjector:
             agent_cls = wrapper.get_agent().__class__
 
             def _executor(w: AgentAutoGenWrapper):
-                def exec_fn(**kwargs: Any) -> Dict[str, str]:
+                def exec_fn(**kwargs: Any) -> str:
                     dto  = AgentAppRequest(content=kwargs)
                     resp = w.run(dto)
-                    return {
-                        "content": resp.content,
-                        "status":  resp.status.name,
-                        "message": resp.message,
-                    }
+                    # {"content", "status", "message"} en JSON: el lote de productos se escribe sin copiarlo
+                    return FunctionExecutionMapper.to_tool_result(resp)
                 return exec_fn
 
             register_function(
@@ -122,10 +152,14 @@ class DependencyInjector:
                 executor    = wrapper,
             )
 
+        # En round robin cada llamada ocupa un turno del planner y uno por wrapper;
+        # se suman el mensaje inicial del usuario y el TERMINATE final.
+        max_round = 1 + _WORKFLOW_TOOL_CALLS * (len(wrappers) + 1) + 1
+
         gchat = GroupChat(
             agents  = [planner] + wrappers,
             messages=[],
-            max_round=7,
+            max_round=max_round,
             speaker_selection_method="round_robin",
             allow_repeat_speaker=False,
             select_speaker_auto_llm_config=llm_cfg,
@@ -139,8 +173,10 @@ class DependencyInjector:
         Devuelve:
           • 'user'    → UserProxyAgent
           • 'manager' → GroupChatManager
+          • 'cache'   → caché de respuestas para initiate_chat (None si está desactivada)
         """
         return {
             "user":    DependencyInjector._user_agent(),
             "manager": DependencyInjector._group_chat_manager(llm_type),
+            "cache":   get_shared_response_cache() if LLM_CACHE_ENABLED else None,
         }
@@ -1,16 +1,35 @@
+from typing import Optional
+
 from application.enums.status_code import StatusCode
 
 class LLMAppResponse:
     """
     DTO que representa la respuesta generada por el LLM.
-    
+
     Attributes:
         generated_text (str): Texto generado por el LLM.
         status (StatusCode): Estado de la respuesta basado en el Enum StatusCode.
         message (str): Mensaje opcional que describe el estado.
+        prompt_tokens (int): Tokens de entrada según el proveedor (0 si no los informa).
+        completion_tokens (int): Tokens generados.
+        ttft (float, optional): Segundos hasta el primer token (solo en streaming).
+        latency (float, optional): Segundos desde el envío hasta la respuesta completa.
+        model (str): Modelo que respondió, tal como lo identifica el proveedor.
+        cached (bool): True si la respuesta sale de la caché y no del modelo.
     """
 
-    def __init__(self, generated_text: str, status: StatusCode, message: str = "OK"):
+    def __init__(
+        self,
+        generated_text: str,
+        status: StatusCode,
+        message: str = "OK",
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        ttft: Optional[float] = None,
+        latency: Optional[float] = None,
+        model: str = "",
+        cached: bool = False,
+    ):
         """
         Inicializa la respuesta del LLM, validando el tipo de estado.
 
@@ -18,7 +37,23 @@ class LLMAppResponse:
             generated_text (str): Texto generado por el LLM.
             status (StatusCode): Estado de la respuesta, debe ser una instancia de StatusCode (SUCCESS o ERROR).
             message (str, optional): Mensaje descriptivo del estado. Por defecto es "OK".
+            prompt_tokens (int, optional): Tokens de entrada.
+            completion_tokens (int, optional): Tokens generados.
+            ttft (float, optional): Segundos hasta el primer token.
+            latency (float, optional): Segundos hasta la respuesta completa.
+            model (str, optional): Id del modelo que respondió.
+            cached (bool, optional): Respuesta servida desde caché.
         """
         self.generated_text = generated_text
         self.status = status  # Se almacena como su valor numérico (1 o -1)
         self.message = message  # Mensaje de estado
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.ttft = ttft
+        self.latency = latency
+        self.model = model
+        self.cached = cached
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
@@ -0,0 +1,92 @@
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from application.dtos.llm_app_response import LLMAppResponse
+from application.enums.status_code import StatusCode
+
+
+@dataclass
+class ModelUsage:
+    """Consumo acumulado de un modelo dentro de un resumen."""
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+
+
+@dataclass
+class LLMUsageSummary:
+    """
+    Tokens y tiempos de todas las llamadas al LLM de una ejecución (p. ej. un chat de autogen).
+
+    Las respuestas servidas desde caché cuentan en `cached_calls` pero no suman
+    tokens ni latencia: no le costaron nada al modelo.
+
+    Attributes:
+        calls (int): Llamadas respondidas por el modelo.
+        cached_calls (int): Llamadas resueltas desde la caché.
+        errors (int): Llamadas fallidas.
+        prompt_tokens (int): Tokens de entrada de todas las llamadas.
+        completion_tokens (int): Tokens generados.
+        latency (float): Suma de latencias (s) de las llamadas.
+        max_latency (float): Latencia de la llamada más lenta (s).
+        max_prompt_tokens (int): Prompt más largo (para detectar prompts que crecen sin control).
+        ttft (float, optional): Tiempo hasta el primer token de la primera llamada en streaming.
+        models (dict): Consumo por id de modelo.
+    """
+    calls: int = 0
+    cached_calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    max_latency: float = 0.0
+    max_prompt_tokens: int = 0
+    ttft: Optional[float] = None
+    models: Dict[str, ModelUsage] = field(default_factory=dict)
+
+    def add(self, response: LLMAppResponse) -> None:
+        """Suma una respuesta al resumen."""
+        if response.status != StatusCode.SUCCESS:
+            self.errors += 1
+            return
+        if response.cached:
+            self.cached_calls += 1
+            return
+
+        latency = response.latency or 0.0
+        self.calls += 1
+        self.prompt_tokens += response.prompt_tokens
+        self.completion_tokens += response.completion_tokens
+        self.latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.max_prompt_tokens = max(self.max_prompt_tokens, response.prompt_tokens)
+        if self.ttft is None:
+            self.ttft = response.ttft
+
+        model = self.models.setdefault(response.model or "desconocido", ModelUsage())
+        model.calls += 1
+        model.prompt_tokens += response.prompt_tokens
+        model.completion_tokens += response.completion_tokens
+        model.latency += latency
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency / self.calls if self.calls else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokens generados por segundo de latencia."""
+        return self.completion_tokens / self.latency if self.latency else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "total_tokens": self.total_tokens,
+            "mean_latency": self.mean_latency,
+            "tokens_per_second": self.tokens_per_second,
+        }
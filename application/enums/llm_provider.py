@@ -7,6 +7,8 @@ class LLMProvider(Enum):
     Attributes:
         LLM_STUDIO (str): Representa el proveedor LLM Studio ("llm_studio").
         GEMINI (str): Representa el proveedor Gemini ("llm_gemini").
+        ROUTER (str): Router sobre varios proveedores con conmutación por error ("llm_router").
     """
     LLM_STUDIO = "llm_studio"
     GEMINI = "llm_gemini"
+    ROUTER = "llm_router"
@@ -1,44 +1,65 @@
 # Archivo: factories/llm_factory.py
 
+from typing import Callable, Dict
+
 from application.interfaces.llm_interface import LLMInterface
 from application.enums.llm_provider import LLMProvider
 
+# Función sin argumentos que importa y construye un proveedor
+ProviderBuilder = Callable[[], LLMInterface]
+
+
 class LLMProviderFactory:
     """
-    Factoría para seleccionar el proveedor de LLM.
+    Factoría (registro perezoso) para seleccionar el proveedor de LLM.
 
-    Esta clase se encarga de recibir dos instancias que implementan la interfaz LLMInterface
-    (por ejemplo, un proveedor para LLM Studio y otro para Gemini) y, en función del tipo de LLM
-    solicitado, retorna la instancia correspondiente.
+    En lugar de instancias recibe, para cada tipo de LLM, una función que lo
+    construye. Solo se ejecuta la del proveedor solicitado: así no se importa
+    ni se inicializa el SDK de un proveedor que no se usa (p. ej. google-genai
+    en un despliegue solo con LLM Studio, o Gemini sin API key).
 
     Uso:
-        factory = LLMProviderFactory(llm_studio_instance, gemini_instance)
-        llm_provider = factory.get_provider("llm_studio")
+        factory = LLMProviderFactory({
+            LLMProvider.LLM_STUDIO: build_llm_studio,
+            LLMProvider.GEMINI: build_gemini,
+        })
+        llm_provider = factory.get_provider(LLMProvider.LLM_STUDIO)
     """
-    def __init__(self, llm_studio_provider: LLMInterface, gemini_provider: LLMInterface):
+    def __init__(self, builders: Dict[LLMProvider, ProviderBuilder]):
         """
-        Inicializa la factoría con las instancias de los proveedores de LLM.
+        Inicializa la factoría con las funciones que construyen cada proveedor.
 
         Args:
-            llm_studio (LLMInterface): Instancia que implementa el proveedor LLM para LLM Studio.
-            llm_gemini (LLMInterface): Instancia que implementa el proveedor LLM para Gemini.
+            builders (Dict[LLMProvider, ProviderBuilder]): Constructor de cada tipo de LLM.
+                Debe incluir LLMProvider.LLM_STUDIO, que es el proveedor por defecto.
+        """
+        if LLMProvider.LLM_STUDIO not in builders:
+            raise ValueError("LLMProviderFactory necesita un constructor para LLM_STUDIO")
+        self.builders = dict(builders)
+
+    def register(self, llm_type: LLMProvider, builder: ProviderBuilder) -> None:
         """
-        self.providers = {
-            LLMProvider.LLM_STUDIO: llm_studio_provider,
-            LLMProvider.GEMINI: gemini_provider
-        }
-    
+        Añade (o sustituye) el constructor de un tipo de LLM.
+
+        Args:
+            llm_type (LLMProvider): Tipo de LLM.
+            builder (ProviderBuilder): Función que crea el proveedor.
+        """
+        self.builders[llm_type] = builder
+
     def get_provider(self, llm_type: LLMProvider) -> LLMInterface:
         """
-        Retorna la instancia del proveedor de LLM solicitado.
+        Construye y retorna el proveedor de LLM solicitado.
 
-        Este método selecciona la instancia correspondiente al identificador 'llm_type'
+        Cada llamada crea una instancia nueva; cachearla es cosa de quien llama
+        (DependencyInjector).
 
         Args:
-            llm_type (str): Identificador del proveedor LLM deseado (por ejemplo, "llm_studio" o "llm_gemini").
+            llm_type (LLMProvider): Identificador del proveedor LLM deseado (por ejemplo, LLMProvider.GEMINI).
 
         Returns:
             LLMInterface: Instancia del proveedor LLM seleccionado.
         """
         # Si no se encuentra el tipo solicitado, se usa "llm_studio" por defecto.
-        return self.providers.get(llm_type, self.providers[LLMProvider.LLM_STUDIO])
+        builder = self.builders.get(llm_type, self.builders[LLMProvider.LLM_STUDIO])
+        return builder()
@@ -1,6 +1,11 @@
+import asyncio
+import concurrent.futures
 from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
 from application.dtos.llm_app_request import LLMAppRequest
 from application.dtos.llm_app_response import LLMAppResponse
+from application.enums.status_code import StatusCode
 
 class LLMInterface(ABC):
     """
@@ -16,8 +21,17 @@ class LLMInterface(ABC):
 
     Métodos abstractos:
         - send_data(request: LLMAppRequest) -> LLMAppResponse: Envia datos a un LLM y devuelve la respuesta.
+
+    Métodos con implementación por defecto (los proveedores pueden dar una nativa):
+        - async_send_data(request) -> LLMAppResponse: Versión asíncrona de send_data.
+        - send_batch(requests, max_concurrency) -> List[LLMAppResponse]: Varias peticiones
+          en paralelo, con las respuestas en el mismo orden y un error por elemento.
+        - aclose(): Cierra los clientes asíncronos abiertos en el bucle de eventos actual.
     """
 
+    # Peticiones simultáneas de send_batch si no se indica otra cosa
+    batch_concurrency: int = 4
+
     @abstractmethod
     def send_data(self, request: LLMAppRequest) -> LLMAppResponse:
         """
@@ -62,3 +76,72 @@ class LLMInterface(ABC):
             str: API key (ej. "1234")
         """
         pass
+
+    async def async_send_data(self, request: LLMAppRequest) -> LLMAppResponse:
+        """
+        Versión asíncrona de send_data.
+
+        Por defecto ejecuta send_data en un hilo del executor para no bloquear el
+        bucle de eventos; los proveedores con cliente asíncrono la sobrescriben.
+
+        Args:
+            request (LLMAppRequest): Solicitud para el modelo.
+
+        Returns:
+            LLMAppResponse: Respuesta del modelo (o de error).
+        """
+        return await asyncio.to_thread(self.send_data, request)
+
+    async def aclose(self) -> None:
+        """
+        Cierra los clientes asíncronos que el proveedor abrió en el bucle de eventos actual.
+
+        Por defecto no hay nada que cerrar; los proveedores con clientes por bucle la sobrescriben.
+        """
+        pass
+
+    async def async_send_batch(
+        self, requests: Sequence[LLMAppRequest], max_concurrency: Optional[int] = None
+    ) -> List[LLMAppResponse]:
+        """
+        Envía `requests` con como mucho `max_concurrency` en vuelo a la vez.
+
+        Returns:
+            List[LLMAppResponse]: Una respuesta por petición y en el mismo orden;
+            una excepción en un elemento se devuelve como respuesta ERROR de ese elemento.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.batch_concurrency))
+
+        async def one(request: LLMAppRequest) -> LLMAppResponse:
+            async with semaphore:
+                try:
+                    return await self.async_send_data(request)
+                except Exception as exc:
+                    return LLMAppResponse(generated_text="", status=StatusCode.ERROR, message=f"Error interno: {exc}")
+
+        return list(await asyncio.gather(*(one(request) for request in requests)))
+
+    def send_batch(
+        self, requests: Sequence[LLMAppRequest], max_concurrency: Optional[int] = None
+    ) -> List[LLMAppResponse]:
+        """
+        Versión bloqueante de async_send_batch para código síncrono.
+
+        Si el hilo ya tiene un bucle de eventos en marcha, el lote se ejecuta
+        en un hilo aparte con su propio bucle. Al terminar se cierran los
+        clientes asíncronos abiertos en ese bucle (aclose).
+        """
+        async def run() -> List[LLMAppResponse]:
+            try:
+                return await self.async_send_batch(requests, max_concurrency)
+            finally:
+                # El bucle de asyncio.run muere con el lote: sus clientes se cierran antes
+                await self.aclose()
+
+        coroutine = run()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
@@ -1,10 +1,43 @@
-from buffer.shared_buffer import get_last_json 
-from autogen.agentchat import UserProxyAgent, GroupChat
+from __future__ import annotations
 
+import logging
+from typing import TYPE_CHECKING, Optional
 
-def run_autogen_chat(user: UserProxyAgent, manager: GroupChat, user_prompt: str):
+from buffer.shared_buffer import get_last_json, set_last_json
+from application.dtos.llm_usage_summary import LLMUsageSummary
+
+if TYPE_CHECKING:  # solo para anotaciones: autogen se carga al construir el chat
+    from autogen.agentchat import UserProxyAgent, GroupChat
+
+logger = logging.getLogger(__name__)
+
+
+def run_autogen_chat(
+    user: UserProxyAgent,
+    manager: GroupChat,
+    user_prompt: str,
+    cache=None,
+    usage: Optional[LLMUsageSummary] = None,
+):
     """
     Lanza la conversación Autogen y devuelve el ChatResult original.
+
+    `cache` (protocolo de caché de autogen) se aplica a todas las llamadas al
+    modelo de la conversación, incluidas las del planner dentro del group chat.
+
+    Si se pasa `usage`, se le suman los tokens, latencias y modelos de todas
+    esas llamadas.
     """
-    user.initiate_chat(manager, message=user_prompt)
+    from infrastructure.autogen_adapters.services.usage_tracker import track_usage
+
+    usage = usage if usage is not None else LLMUsageSummary()
+    # Sin resultados de chats anteriores: las herramientas (p. ej. el resumen del
+    # EmailAgent) solo deben ver lo que produzca esta conversación
+    set_last_json(None)
+    with track_usage(usage):
+        user.initiate_chat(manager, message=user_prompt, cache=cache)
+    logger.info(
+        "Chat: %d llamadas al LLM (%d de caché), %d tokens de prompt, %d generados, %.2fs de modelo",
+        usage.calls, usage.cached_calls, usage.prompt_tokens, usage.completion_tokens, usage.latency,
+    )
     return  get_last_json()  # Devolvemos el último JSON del buffer compartido
@@ -0,0 +1,230 @@
+# benchmarks/bench_chat.py
+"""
+Benchmark de extremo a extremo de `run_autogen_chat` sin modelo real: el planner
+habla con el servidor LLM falso (llamadas guionizadas), el scraper con una tienda
+local y el correo con un SMTP local. Para cada nivel de concurrencia se mide:
+
+    chats/s | latencia p50 / p95 / máx (s) | peticiones al LLM por chat |
+    tiempo de modelo por chat (s) | resto por chat (s) = orquestación + herramientas |
+    máximo de peticiones simultáneas que recibió el LLM | correos entregados
+
+El "tiempo de modelo" es el que el servidor falso simula (latencia + tokens / velocidad);
+lo que queda de la latencia del chat es coste de autogen, de los agentes y de la red local.
+Con `--latency 0 --tokens-per-second 1e9` se mide solo la orquestación.
+
+Cada chat concurrente corre en su propio proceso: los wrappers de los agentes se
+comparten dentro de un proceso (DependencyInjector) y el resultado se lee de un
+buffer global, así que dos chats del mismo proceso no pueden solaparse. Cada
+proceso hace un chat de calentamiento (importar autogen, crear los agentes) que
+no se mide.
+
+Un chat cuenta como "ok" si terminó con éxito, y el nivel no da más "ok" que
+veces se pidió cada paso del guion ni que correos llegaron al SMTP local:
+un chat que corta antes de tiempo (p. ej. por el límite de rondas) no cuenta.
+
+Uso:
+    python -m benchmarks.bench_chat
+    python -m benchmarks.bench_chat --concurrency 1 4 8 --chats 40 --latency 0.3 --tokens-per-second 40
+    python -m benchmarks.bench_chat --with-prices --products 200
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.fake_llm_server import FakeLLMServer
+from benchmarks.local_shop import LocalShop
+from benchmarks.local_smtp import LocalSmtpServer
+from benchmarks.woocommerce_fixture import SHOP_SELECTORS, catalogue_html
+
+PROMPT = "Compara los precios de la tienda y envíame un resumen a bench@example.com"
+
+
+def build_script(shop_url: str, with_prices: bool) -> List[dict]:
+    """Guion del planner: web_scrape → [price_analyze →] send_email (y TERMINATE al agotarse)."""
+    script = [{"name": "web_scrape", "arguments": {"shops": [{"url": shop_url, **SHOP_SELECTORS}]}}]
+    if with_prices:
+        script.append({"name": "price_analyze", "arguments": {}})
+    script.append({
+        "name": "send_email",
+        "arguments": {
+            "to": "bench@example.com",
+            "subject": "Resumen de precios",
+            "body": '[{"description": "Juego de magia n.º 0", "price": "5,00 €", "sku": "MAG-000000"}]',
+        },
+    })
+    return script
+
+
+def benchmark_env(llm: FakeLLMServer, smtp: LocalSmtpServer, workdir: str) -> Dict[str, str]:
+    """Variables de entorno que apuntan la aplicación a los servidores locales y a ficheros temporales."""
+    return {
+        "LLM_STUDIO_API_URL": llm.base_url,
+        "LLM_CACHE_ENABLED": "0",
+        "SMTP_SERVER": smtp.host,
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_STARTTLS": "0",
+        "EMAIL_DIGEST_DEFAULT": "0",
+        "EMAIL_OUTBOX_PATH": os.path.join(workdir, "email_outbox.sqlite"),
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_responses.sqlite"),
+        "SCRAPER_CACHE_PATH": os.path.join(workdir, "webscraper_pages.sqlite"),
+        "SCRAPER_SNAPSHOT_PATH": os.path.join(workdir, "webscraper_snapshots.sqlite"),
+    }
+
+
+# ─────── PROCESO DE CADA CHAT CONCURRENTE ───────
+def _run_chat() -> Tuple[float, float, bool]:
+    """Un chat completo: (s para crear agentes, s de run_autogen_chat, terminó con éxito)."""
+    from application.dependency_injection import DependencyInjector
+    from application.enums.llm_provider import LLMProvider
+    from application.use_cases.autogen_runtime import run_autogen_chat
+
+    started = time.perf_counter()
+    deps = DependencyInjector.get_autogen_user_and_manager(LLMProvider.LLM_STUDIO)
+    built = time.perf_counter()
+    result = run_autogen_chat(deps["user"], deps["manager"], PROMPT, cache=deps["cache"])
+    finished = time.perf_counter()
+    ok = isinstance(result, dict) and result.get("status") == "SUCCESS"
+    return built - started, finished - built, ok
+
+
+def _worker(env: Dict[str, str], tasks, results, ready) -> None:
+    import io
+    import logging
+    import warnings
+    from contextlib import redirect_stdout
+
+    os.environ.update(env)
+    logging.basicConfig(level=logging.ERROR, format="%(message)s")
+    logging.getLogger("autogen.oai.client").setLevel(logging.CRITICAL)
+    # Cada chat vuelve a registrar las funciones en los wrappers compartidos
+    warnings.filterwarnings("ignore", message="Function '.*' is being overridden")
+
+    # autogen y los agentes escriben la conversación en stdout: se descarta (pero se sigue formateando)
+    with redirect_stdout(io.StringIO()) as sink:
+        try:
+            _run_chat()  # calentamiento
+            _drain_outbox()  # su correo no debe contar en el nivel medido
+        finally:
+            ready.wait()
+        while tasks.get() is not None:
+            sink.seek(0)
+            sink.truncate()
+            try:
+                results.put(_run_chat())
+            except Exception as exc:
+                results.put((0.0, 0.0, False))
+                print(f"chat fallido: {exc}", file=sys.stderr)
+        _drain_outbox()
+    from infrastructure.agents.email.services.outbox_dispatcher import get_shared_dispatcher
+    get_shared_dispatcher().stop(timeout=1.0)
+
+
+def _drain_outbox(timeout: float = 10.0) -> None:
+    """Espera a que el outbox entregue lo encolado (sus workers mueren con el proceso)."""
+    from infrastructure.agents.email.dtos.outbox_message_dto import OUTBOX_QUEUED, OUTBOX_SENDING
+    from infrastructure.agents.email.services.outbox_dispatcher import get_shared_dispatcher
+
+    dispatcher = get_shared_dispatcher()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        counts = dispatcher.outbox.counts()
+        if not counts[OUTBOX_QUEUED] and not counts[OUTBOX_SENDING]:
+            break
+        dispatcher.notify()
+        time.sleep(0.05)
+
+
+def run_level(env: Dict[str, str], llm: FakeLLMServer, smtp: LocalSmtpServer, steps: int,
+              concurrency: int, chats: int) -> dict:
+    """Lanza `chats` conversaciones con `concurrency` procesos y devuelve las métricas."""
+    context = multiprocessing.get_context("spawn")
+    tasks, results = context.Queue(), context.Queue()
+    ready = context.Barrier(concurrency + 1)
+    workers = [context.Process(target=_worker, args=(env, tasks, results, ready), daemon=True)
+               for _ in range(concurrency)]
+    for worker in workers:
+        worker.start()
+
+    ready.wait()  # todos calentados (y sus correos entregados)
+    before = llm.counters
+    emails_before = len(smtp.messages)
+    started = time.perf_counter()
+    for _ in range(chats):
+        tasks.put(1)
+    for _ in workers:
+        tasks.put(None)
+    measured = [results.get() for _ in range(chats)]
+    wall = time.perf_counter() - started
+    after = llm.counters
+    for worker in workers:
+        worker.join()  # cada worker vacía su outbox antes de salir
+    emails = len(smtp.messages) - emails_before
+
+    # Veces que el planner pidió cada paso del guion (el TERMINATE final no llega a pedirse:
+    # la respuesta de send_email ya lo incluye)
+    requested = [after["steps"].get(step, 0) - before["steps"].get(step, 0) for step in range(steps)]
+    succeeded = sum(1 for _, _, ok in measured if ok)
+
+    latencies = sorted(chat for _, chat, _ in measured)
+    requests = after["requests"] - before["requests"]
+    model_time = after["model_time"] - before["model_time"]
+    return {
+        "concurrency": concurrency,
+        "chats": chats,
+        "ok": min(succeeded, emails, *requested),
+        "emails": emails,
+        "wall": wall,
+        "throughput": chats / wall,
+        "build": statistics.mean(build for build, _, _ in measured),
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "max": latencies[-1],
+        "llm_requests": requests / chats,
+        "model_time": model_time / chats,
+        "overhead": statistics.mean(latencies) - model_time / chats,
+        "llm_max_concurrency": after["max_concurrency"],
+    }
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de extremo a extremo de run_autogen_chat con un LLM falso.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4], help="chats simultáneos (uno por proceso)")
+    parser.add_argument("--chats", type=int, default=12, help="chats medidos por nivel de concurrencia")
+    parser.add_argument("--latency", type=float, default=0.2, help="segundos hasta el primer token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--products", type=int, default=50, help="productos de la tienda local")
+    parser.add_argument("--with-prices", action="store_true", help="incluir price_analyze en el guion")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench-chat-") as workdir, \
+            LocalShop({"/catalogo.html": catalogue_html(args.products)}) as shop, \
+            LocalSmtpServer() as smtp:
+        script = build_script(shop.url("/catalogo.html"), args.with_prices)
+        with FakeLLMServer(script, args.latency, args.tokens_per_second) as llm:
+            env = benchmark_env(llm, smtp, workdir)
+            print(f"LLM falso: latencia {args.latency}s, {args.tokens_per_second:g} tokens/s; "
+                  f"guion: {' → '.join(step['name'] for step in script)} → TERMINATE")
+            print(f"{'conc.':>5} {'chats':>6} {'ok':>4} {'chats/s':>8} {'p50':>6} {'p95':>6} {'máx':>6} "
+                  f"{'crear':>6} {'LLM/chat':>8} {'modelo':>7} {'resto':>6} {'conc. LLM':>9} {'correos':>7}")
+            for concurrency in args.concurrency:
+                r = run_level(env, llm, smtp, len(script), concurrency, args.chats)
+                print(f"{r['concurrency']:>5} {r['chats']:>6} {r['ok']:>4} {r['throughput']:>8.2f} "
+                      f"{r['p50']:>6.2f} {r['p95']:>6.2f} {r['max']:>6.2f} {r['build']:>6.2f} "
+                      f"{r['llm_requests']:>8.1f} {r['model_time']:>7.2f} {r['overhead']:>6.2f} "
+                      f"{r['llm_max_concurrency']:>9} {r['emails']:>7}")
+        # Un correo por chat, contando los de calentamiento (uno por proceso)
+        print(f"correos recibidos por el SMTP local: {len(smtp.messages)}")
+
+
+if __name__ == "__main__":
+    main()
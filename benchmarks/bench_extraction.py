@@ -0,0 +1,88 @@
+# benchmarks/bench_extraction.py
+"""
+Benchmark de extracción de productos: bucle original (find_parent por SKU)
+frente al extractor de una sola pasada, de 100 a 50.000 productos.
+
+Uso:
+    python -m benchmarks.bench_extraction
+    python -m benchmarks.bench_extraction --sizes 100 1000 --backends lxml html.parser
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from bs4 import BeautifulSoup
+
+from benchmarks.woocommerce_fixture import SHOP_SELECTORS, catalogue_html
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import ShopRequestEntry
+from infrastructure.agents.webscraper.parsers.parser_factory import available_backends
+from infrastructure.agents.webscraper.services.product_extractor import ProductExtractor
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 50_000]
+
+
+def legacy_extract(entry: ShopRequestEntry, html: str) -> int:
+    """Réplica del bucle original de WebScraperAgent.run (html.parser + find_parent)."""
+    soup = BeautifulSoup(html, "html.parser")
+    count = 0
+    for prod in soup.find_all(entry.selector_sku["tag"], attrs={entry.selector_sku["attribute"]: True}):
+        meta_wrapper = prod.find_parent(class_="meta-wrapper")
+        if not meta_wrapper:
+            continue
+        price_elem = meta_wrapper.select_one(entry.selector_price)
+        desc_elem = meta_wrapper.select_one(entry.selector_description)
+        _ = price_elem.get_text(strip=True) if price_elem else ""
+        _ = desc_elem.get_text(strip=True) if desc_elem else ""
+        count += 1
+    return count
+
+
+def _best_of(fn: Callable[[], int], repeat: int) -> tuple:
+    best, count = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", nargs="+", default=None, help="Por defecto, todos los instalados")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy", action="store_true", help="No medir el bucle original")
+    parser.add_argument(
+        "--slow-limit", type=int, default=10_000,
+        help="Por encima de este tamaño se omiten el bucle original y los backends BeautifulSoup (0 = sin límite)",
+    )
+    args = parser.parse_args(argv)
+
+    entry = ShopRequestEntry(url="http://benchmark.local/", **SHOP_SELECTORS)
+    backends = available_backends()
+    if args.backends:
+        backends = {name: b for name, b in backends.items() if name in args.backends}
+
+    print(f"{'productos':>10} | {'método':<24} | {'segundos':>9} | {'productos/s':>12}")
+    print("-" * 66)
+    for size in args.sizes:
+        html = catalogue_html(size)
+        rows = []
+        slow_allowed = not args.slow_limit or size <= args.slow_limit
+        if not args.skip_legacy and slow_allowed:
+            rows.append(("original (html.parser)", *_best_of(lambda: legacy_extract(entry, html), args.repeat)))
+        for name, backend in backends.items():
+            if not slow_allowed and (name.startswith("bs4") or name == "html.parser"):
+                continue
+            extractor = ProductExtractor(backend)
+            rows.append((f"una pasada ({name})", *_best_of(lambda: sum(1 for _ in extractor.extract(entry, html)), args.repeat)))
+
+        for label, seconds, count in rows:
+            assert count == size, f"{label}: {count} productos extraídos de {size}"
+            print(f"{size:>10} | {label:<24} | {seconds:>9.3f} | {size / seconds:>12,.0f}")
+        print("-" * 66)
+
+
+if __name__ == "__main__":
+    main()
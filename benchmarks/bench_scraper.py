@@ -0,0 +1,243 @@
+# benchmarks/bench_scraper.py
+"""
+Benchmark del scraper de extremo a extremo, sin red: la página grabada de una
+categoría WooCommerce, replicada a 10, 1.000 y 50.000 productos, se sirve desde
+una tienda HTTP local y se mide por backend de parseo:
+
+    descarga (s) | parseo (s) | extracción (s) | pico de memoria (MB) | productos/s
+
+Cada medición corre en un proceso nuevo para que el pico de memoria sea el suyo.
+Los resultados se comparan con una línea base guardada y se marcan las regresiones
+(código de salida 1 si hay alguna).
+
+Uso:
+    python -m benchmarks.bench_scraper
+    python -m benchmarks.bench_scraper --sizes 10 1000 --backends lxml selectolax
+    python -m benchmarks.bench_scraper --save-baseline
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.local_shop import LocalShop
+from benchmarks.woocommerce_fixture import RECORDED_SELECTORS, recorded_catalogue_html
+from infrastructure.agents.webscraper.parsers.parser_factory import available_backends
+
+try:
+    import resource
+except ImportError:  # Windows: se recurre a tracemalloc (sólo memoria de Python)
+    resource = None
+
+DEFAULT_SIZES = [10, 1_000, 50_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "bench_scraper.json")
+
+# Métricas en las que un valor mayor es peor (productos/s se compara al revés)
+_COST_METRICS = ("fetch_s", "parse_s", "extract_s", "peak_mb")
+
+
+# ─────── MEDICIÓN (proceso hijo) ───────
+def _proc_status_mb(field: str) -> Optional[float]:
+    """Campo de /proc/self/status (VmRSS, VmHWM) en MB; None fuera de Linux."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _rss_mb() -> float:
+    current = _proc_status_mb("VmRSS")
+    return current if current is not None else _max_rss_mb()
+
+
+def _max_rss_mb() -> float:
+    # VmHWM es el pico de este proceso; ru_maxrss en Linux conserva el del padre tras exec
+    peak = _proc_status_mb("VmHWM")
+    if peak is not None:
+        return peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss va en bytes en macOS y en KB en el resto
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _best(fn, repeat: int):
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def _measure(url: str, backend_name: str, repeat: int) -> Dict[str, float]:
+    """Descarga, parsea y extrae `url` con `backend_name`; se ejecuta en un proceso hijo."""
+    import tracemalloc
+
+    from infrastructure.agents.webscraper.dtos.webscraper_request_dto import ShopRequestEntry
+    from infrastructure.agents.webscraper.services.page_stream import open_page_stream, sniff_encoding
+    from infrastructure.agents.webscraper.services.product_extractor import ProductExtractor
+    from infrastructure.http.http_transport import HttpTransport
+
+    entry = ShopRequestEntry(url=url, **RECORDED_SELECTORS)
+    extractor = ProductExtractor(available_backends()[backend_name])
+    selectors = extractor.compiled_for(entry)
+    transport = HttpTransport()
+
+    if resource is None:
+        tracemalloc.start()
+    start_mb = _rss_mb() if resource is not None else 0.0
+
+    def fetch() -> str:
+        with open_page_stream(transport, url) as stream:
+            body = b"".join(stream)
+            return body.decode(sniff_encoding(body, stream.encoding), errors="replace")
+
+    def extract(document) -> int:
+        count = 0
+        for container in extractor.containers(selectors, document):
+            if extractor.product(selectors, container) is not None:
+                count += 1
+        return count
+
+    fetch_s, html = _best(fetch, repeat)
+    parse_s, document = _best(lambda: extractor.parse(html), repeat)
+    extract_s, count = _best(lambda: extract(document), repeat)
+
+    if resource is not None:
+        peak_mb = _max_rss_mb() - start_mb
+    else:
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    transport.close()
+
+    return {
+        "products": count,
+        "fetch_s": fetch_s,
+        "parse_s": parse_s,
+        "extract_s": extract_s,
+        "peak_mb": max(0.0, peak_mb),
+        "products_per_s": count / (fetch_s + parse_s + extract_s),
+    }
+
+
+# ─────── LÍNEA BASE ───────
+def _load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def _save_baseline(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    merged = _load_baseline(path)
+    merged.update(results)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "machine": {"python": platform.python_version(), "platform": platform.platform()},
+                "results": merged,
+            },
+            f, indent=2, sort_keys=True,
+        )
+        f.write("\n")
+
+
+def _regressions(
+    current: Dict[str, float],
+    base: Optional[Dict[str, float]],
+    tolerance: float,
+    min_seconds: float,
+    min_mb: float,
+) -> List[str]:
+    """Métricas de `current` que empeoran más de `tolerance` respecto a `base`."""
+    if not base:
+        return []
+    flagged = []
+    for metric in _COST_METRICS:
+        old, new = base.get(metric), current[metric]
+        if old is None:
+            continue
+        floor = min_mb if metric == "peak_mb" else min_seconds
+        if new > old * (1 + tolerance) and new - old > floor:
+            flagged.append(f"{metric} {old:.3f}→{new:.3f}")
+    old_rate = base.get("products_per_s")
+    if old_rate and current["products_per_s"] < old_rate / (1 + tolerance) and not flagged:
+        flagged.append(f"products_per_s {old_rate:,.0f}→{current['products_per_s']:,.0f}")
+    return flagged
+
+
+# ─────── CLI ───────
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", nargs="+", default=None, help="Por defecto, todos los instalados")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--slow-limit", type=int, default=10_000,
+        help="Por encima de este tamaño se omiten los backends BeautifulSoup (0 = sin límite)",
+    )
+    parser.add_argument("--no-gzip", action="store_true", help="Servir las páginas sin comprimir")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Fichero JSON de la línea base")
+    parser.add_argument("--save-baseline", action="store_true", help="Guardar los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Empeoramiento relativo admitido (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Diferencia mínima de tiempo para marcar regresión")
+    parser.add_argument("--min-mb", type=float, default=5.0, help="Diferencia mínima de memoria para marcar regresión")
+    args = parser.parse_args(argv)
+
+    backends = list(available_backends())
+    if args.backends:
+        backends = [name for name in backends if name in args.backends]
+    baseline = {} if args.save_baseline else _load_baseline(args.baseline)
+
+    pages = {f"/catalogo-{size}.html": recorded_catalogue_html(size) for size in args.sizes}
+    results: Dict[str, Dict[str, float]] = {}
+    regressions = 0
+    ctx = multiprocessing.get_context("spawn")
+
+    header = (
+        f"{'productos':>10} | {'backend':<12} | {'descarga s':>10} | {'parseo s':>9} | "
+        f"{'extracción s':>12} | {'pico MB':>8} | {'productos/s':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    with LocalShop(pages, compress=not args.no_gzip) as shop, ctx.Pool(1, maxtasksperchild=1) as pool:
+        for size in args.sizes:
+            slow_allowed = not args.slow_limit or size <= args.slow_limit
+            for name in backends:
+                if not slow_allowed and (name.startswith("bs4") or name == "html.parser"):
+                    continue
+                row = pool.apply(_measure, (shop.url(f"/catalogo-{size}.html"), name, args.repeat))
+                assert row["products"] == size, f"{name}: {row['products']} productos extraídos de {size}"
+
+                key = f"{size}/{name}"
+                results[key] = row
+                flagged = _regressions(row, baseline.get(key), args.tolerance, args.min_seconds, args.min_mb)
+                regressions += bool(flagged)
+                print(
+                    f"{size:>10} | {name:<12} | {row['fetch_s']:>10.4f} | {row['parse_s']:>9.4f} | "
+                    f"{row['extract_s']:>12.4f} | {row['peak_mb']:>8.1f} | {row['products_per_s']:>12,.0f}"
+                    + (f"  ← REGRESIÓN: {', '.join(flagged)}" if flagged else "")
+                )
+            print("-" * len(header))
+
+    if args.save_baseline:
+        _save_baseline(args.baseline, results)
+        print(f"Línea base guardada en {args.baseline}")
+    elif not baseline:
+        print(f"Sin línea base en {args.baseline} (usa --save-baseline para crearla)")
+    elif regressions:
+        print(f"{regressions} mediciones con regresión respecto a {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
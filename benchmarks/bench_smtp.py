@@ -0,0 +1,84 @@
+# benchmarks/bench_smtp.py
+"""
+Envío de alertas a muchos destinatarios: una conexión por correo frente al pool SMTP.
+
+Usa el servidor SMTP local con latencia simulada en la conexión y en el login
+(lo que cuestan el handshake TLS y la autenticación con un relay remoto).
+
+Uso:
+    python -m benchmarks.bench_smtp [--emails 50] [--workers 4] [--connect-delay 0.05] [--login-delay 0.05]
+"""
+
+import argparse
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+
+from application.enums.status_code import StatusCode
+from benchmarks.local_smtp import LocalSmtpServer
+from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
+from infrastructure.agents.email.services.smtp_pool import SmtpConnectionPool
+from infrastructure.agents.email.services.smtp_service import SmtpService
+
+
+def _requests(count: int):
+    return [
+        EmailRequestDTO(to=f"user{i}@example.com", subject=f"Alerta {i}", body="Bajada de precio detectada.")
+        for i in range(count)
+    ]
+
+
+def send_unpooled(server: LocalSmtpServer, requests, workers: int) -> float:
+    """Como antes del pool: conexión + login por cada correo."""
+    def send(request: EmailRequestDTO) -> None:
+        msg = EmailMessage()
+        msg.set_content(request.body)
+        msg["Subject"], msg["From"], msg["To"] = request.subject, "bench@example.com", request.to
+        with smtplib.SMTP(server.host, server.port) as smtp:
+            smtp.login("user", "pass")
+            smtp.send_message(msg)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(send, requests))
+    return time.perf_counter() - started
+
+
+def send_pooled(server: LocalSmtpServer, requests, workers: int) -> float:
+    pool = SmtpConnectionPool(server.host, server.port, "user", "pass", starttls=False, max_size=workers)
+    service = SmtpService(pool)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        responses = list(executor.map(service.send_email, requests))
+    elapsed = time.perf_counter() - started
+    failed = [r.message for r in responses if r.status != StatusCode.SUCCESS]
+    if failed:
+        raise RuntimeError(f"{len(failed)} envíos fallidos: {failed[0]}")
+    print(f"  pool: {pool.stats()}")
+    pool.close()
+    return elapsed
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark del pool de conexiones SMTP.")
+    parser.add_argument("--emails", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--connect-delay", type=float, default=0.05)
+    parser.add_argument("--login-delay", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    requests = _requests(args.emails)
+    for label, run in (("una conexión por correo", send_unpooled), ("pool", send_pooled)):
+        with LocalSmtpServer(args.connect_delay, args.login_delay) as server:
+            elapsed = run(server, requests, args.workers)
+            counters = server.counters
+            print(
+                f"{label:<24} {elapsed:6.2f}s  {args.emails / elapsed:7.1f} correos/s  "
+                f"{counters['connections']} conexiones, {counters['logins']} logins, "
+                f"{len(server.messages)} recibidos"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# benchmarks/fake_llm_server.py
+"""
+Servidor LLM local compatible con OpenAI (`/v1/chat/completions`), en lugar de
+LM Studio o Gemini, para probar la orquestación sin depender del modelo.
+
+✔  Reproduce un guion de llamadas del planner (web_scrape → send_email → TERMINATE
+   por defecto). El paso se deduce de la propia conversación (cuántas llamadas
+   a herramienta trae ya), así que atiende conversaciones concurrentes sin estado.
+✔  Responde con `function_call` o `tool_calls` según la petición use `functions` o `tools`,
+   con y sin streaming (SSE, con `usage` si se pide `include_usage`).
+✔  Latencia configurable: espera hasta el primer token y velocidad de generación
+   (tokens/s); cuenta tokens aproximados (4 caracteres ≈ 1 token).
+✔  Contadores de peticiones, concurrencia máxima y tiempo de "modelo" simulado.
+✔  Se arranca en un puerto libre de 127.0.0.1 y se usa como context manager,
+   o desde la línea de comandos para apuntar la aplicación real a él:
+
+    python -m benchmarks.fake_llm_server --port 1234 --latency 0.3 --tokens-per-second 40
+    LLM_STUDIO_API_URL=http://127.0.0.1:1234/v1 python -m presentation.cli_app
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+TERMINATE = '{"content": "TERMINATE"}'
+
+# Guion por defecto; las URL y selectores los sustituye quien lo use (ver bench_chat)
+DEFAULT_SCRIPT: List[dict] = [
+    {
+        "name": "web_scrape",
+        "arguments": {
+            "shops": [{
+                "url": "http://127.0.0.1:8000/catalogo.html",
+                "selector_price": "span.price",
+                "selector_description": "h3.product-title",
+                "selector_sku": {"tag": "span", "attribute": "data-sku"},
+            }]
+        },
+    },
+    {
+        "name": "send_email",
+        "arguments": {
+            "to": "bench@example.com",
+            "subject": "Resumen de precios",
+            "body": json.dumps([{"description": "Producto", "price": "9,99 €", "sku": "SKU-1"}]),
+        },
+    },
+]
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+def completed_steps(messages: List[dict]) -> int:
+    """Llamadas a herramienta que ya hizo el asistente en la conversación."""
+    steps = 0
+    for message in messages:
+        if message.get("role") != "assistant":
+            continue
+        if message.get("function_call"):
+            steps += 1
+        steps += len(message.get("tool_calls") or [])
+    return steps
+
+
+class _FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_FakeLLMServer"
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/v1/models":
+            self.send_error(404)
+            return
+        self._send_json({"object": "list", "data": [{"id": self.server.model, "object": "model"}]})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self.send_error(404)
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self.send_error(400, "JSON no válido")
+            return
+
+        self.server.enter()
+        try:
+            self._complete(payload)
+        finally:
+            self.server.leave()
+
+    # ─────── RESPUESTA ───────
+    def _complete(self, payload: dict) -> None:
+        messages = payload.get("messages") or []
+        step = completed_steps(messages)
+        call = self.server.script[step] if step < len(self.server.script) else None
+        use_tools = bool(payload.get("tools"))
+        model = payload.get("model") or self.server.model
+
+        if call is None:
+            text, generated = TERMINATE, TERMINATE
+        else:
+            text, generated = None, json.dumps(call["arguments"], ensure_ascii=False)
+        usage = {
+            "prompt_tokens": sum(estimate_tokens(str(m.get("content") or "")) for m in messages),
+            "completion_tokens": estimate_tokens(generated),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        generation_time = usage["completion_tokens"] / self.server.tokens_per_second
+        self.server.record(step, self.server.latency + generation_time)
+
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "created": int(time.time()), "model": model}
+        if payload.get("stream"):
+            include_usage = (payload.get("stream_options") or {}).get("include_usage", False)
+            self._stream(base, call, text, generated, use_tools, generation_time, usage if include_usage else None)
+            return
+
+        time.sleep(self.server.latency + generation_time)
+        message = {"role": "assistant", "content": text}
+        finish_reason = "stop"
+        if call is not None:
+            finish_reason = "tool_calls" if use_tools else "function_call"
+            function = {"name": call["name"], "arguments": generated}
+            if use_tools:
+                message["tool_calls"] = [{"id": f"call_{uuid.uuid4().hex[:12]}", "type": "function", "function": function}]
+            else:
+                message["function_call"] = function
+        self._send_json({
+            **base,
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": usage,
+        })
+
+    def _stream(self, base: dict, call: Optional[dict], text: Optional[str], generated: str,
+                use_tools: bool, generation_time: float, usage: Optional[dict]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        base = {**base, "object": "chat.completion.chunk"}
+        time.sleep(self.server.latency)
+
+        # Trozos de ~4 tokens repartidos en el tiempo de generación
+        pieces = [generated[i:i + 16] for i in range(0, len(generated), 16)] or [""]
+        pause = generation_time / len(pieces)
+        call_id = f"call_{uuid.uuid4().hex[:12]}"
+        for i, piece in enumerate(pieces):
+            if call is None:
+                delta = {"content": piece}
+            elif use_tools:
+                function = {"arguments": piece}
+                tool_call = {"index": 0, "function": function}
+                if i == 0:
+                    function["name"] = call["name"]
+                    tool_call.update(id=call_id, type="function")
+                delta = {"tool_calls": [tool_call]}
+            else:
+                delta = {"function_call": {"arguments": piece, **({"name": call["name"]} if i == 0 else {})}}
+            if i == 0:
+                delta["role"] = "assistant"
+            self._event({**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]})
+            time.sleep(pause)
+
+        finish_reason = "stop" if call is None else ("tool_calls" if use_tools else "function_call")
+        self._event({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}]})
+        if usage is not None:
+            self._event({**base, "choices": [], "usage": usage})
+        self._chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    # ─────── HELPERS ───────
+    def _send_json(self, data: dict) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _event(self, data: dict) -> None:
+        self._chunk(b"data: " + json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n\n")
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _FakeLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, script: List[dict], latency: float, tokens_per_second: float, model: str):
+        super().__init__(address, _FakeLLMHandler)
+        self.script = script
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.model = model
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.counters = {"requests": 0, "max_concurrency": 0, "model_time": 0.0, "steps": {}}
+
+    def enter(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self.counters["max_concurrency"] = max(self.counters["max_concurrency"], self._in_flight)
+
+    def leave(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def record(self, step: int, model_time: float) -> None:
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["model_time"] += model_time
+            self.counters["steps"][step] = self.counters["steps"].get(step, 0) + 1
+
+
+class FakeLLMServer:
+    """
+    Servidor OpenAI-compatible con respuestas guionizadas.
+
+    Uso:
+        with FakeLLMServer(script, latency=0.2, tokens_per_second=50) as llm:
+            os.environ["LLM_STUDIO_API_URL"] = llm.base_url
+    """
+
+    def __init__(
+        self,
+        script: Optional[List[dict]] = None,
+        latency: float = 0.2,
+        tokens_per_second: float = 50.0,
+        model: str = "fake-planner",
+        port: int = 0,
+    ):
+        """
+        Args:
+            script (list, optional): Llamadas `{"name", "arguments"}` en orden; agotado el guion se responde TERMINATE.
+            latency (float): Segundos hasta el primer token.
+            tokens_per_second (float): Velocidad de generación simulada.
+            model (str): Id de modelo que anuncia `/v1/models`.
+            port (int): Puerto en 127.0.0.1 (0 = uno libre).
+        """
+        if tokens_per_second <= 0:
+            raise ValueError("tokens_per_second debe ser positivo")
+        self._server = _FakeLLMServer(
+            ("127.0.0.1", port), DEFAULT_SCRIPT if script is None else script, latency, tokens_per_second, model,
+        )
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-llm", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def counters(self) -> dict:
+        with self._server._lock:
+            return {**self._server.counters, "steps": dict(self._server.counters["steps"])}
+
+    def start(self) -> "FakeLLMServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor LLM local con llamadas del planner guionizadas.")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--latency", type=float, default=0.2, help="segundos hasta el primer token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--model", default="fake-planner")
+    parser.add_argument("--script", help="fichero JSON con la lista de llamadas {name, arguments}")
+    args = parser.parse_args(argv)
+
+    script = None
+    if args.script:
+        with open(args.script, encoding="utf-8") as fh:
+            script = json.load(fh)
+    server = FakeLLMServer(script, args.latency, args.tokens_per_second, args.model, args.port)
+    print(f"Servidor LLM falso en {server.base_url} (Ctrl+C para salir)")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
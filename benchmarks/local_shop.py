@@ -0,0 +1,87 @@
+# benchmarks/local_shop.py
+"""
+Tienda HTTP local que sirve páginas en memoria, en lugar de las tiendas reales.
+
+✔  HTTP/1.1 con keep-alive y un hilo por conexión, como un servidor de producción.
+✔  Comprime con gzip si el cliente lo acepta (las páginas se comprimen una sola vez).
+✔  Se arranca en un puerto libre de 127.0.0.1 y se usa como context manager.
+"""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+
+class _ShopHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_ShopServer"
+
+    def do_GET(self) -> None:
+        page = self.server.pages.get(self.path.split("?", 1)[0])
+        if page is None:
+            self.send_error(404)
+            return
+        raw, compressed = page
+        use_gzip = compressed is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        body = compressed if use_gzip else raw
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _ShopServer(ThreadingHTTPServer):
+    daemon_threads = True
+    pages: Dict[str, Tuple[bytes, Optional[bytes]]]
+
+
+class LocalShop:
+    """
+    Servidor local con páginas fijas.
+
+    Uso:
+        with LocalShop({"/catalogo.html": html}) as shop:
+            shop.url("/catalogo.html")
+    """
+
+    def __init__(self, pages: Dict[str, str], compress: bool = True):
+        """
+        Args:
+            pages (dict): Ruta → HTML de la página.
+            compress (bool): Servir con gzip a los clientes que lo acepten.
+        """
+        self._server = _ShopServer(("127.0.0.1", 0), _ShopHandler)
+        self._server.pages = {}
+        for path, html in pages.items():
+            raw = html.encode("utf-8")
+            self._server.pages[path] = (raw, gzip.compress(raw, 6) if compress else None)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-shop", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def start(self) -> "LocalShop":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalShop":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
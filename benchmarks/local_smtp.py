@@ -0,0 +1,171 @@
+# benchmarks/local_smtp.py
+"""
+Servidor SMTP local en memoria, en lugar del relay real (Mailtrap...).
+
+✔  Habla lo justo del protocolo: EHLO/HELO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA,
+   RSET, NOOP y QUIT, con un hilo por conexión.
+✔  Latencia configurable en la apertura y en el login para simular el coste del
+   handshake TLS y la autenticación de un relay remoto.
+✔  Guarda los mensajes recibidos y permite cortar las conexiones abiertas
+   (`drop_connections`) para probar la reconexión.
+✔  Se arranca en un puerto libre de 127.0.0.1 y se usa como context manager.
+"""
+
+import socket
+import socketserver
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    server: "_SmtpServer"
+
+    def handle(self) -> None:
+        self.server.track(self.connection)
+        try:
+            time.sleep(self.server.connect_delay)
+            self._reply("220 localhost ESMTP local")
+            sender, recipients = None, []
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command, _, argument = line.decode("utf-8", "replace").strip().partition(" ")
+                verb = command.upper()
+
+                if verb in ("EHLO", "HELO"):
+                    self._reply("250-localhost", "250-AUTH PLAIN LOGIN", "250 8BITMIME" if verb == "EHLO" else "250 OK")
+                elif verb == "AUTH":
+                    mechanism = argument.split(" ", 1)[0].upper()
+                    if mechanism == "LOGIN":
+                        for prompt in ("334 VXNlcm5hbWU6", "334 UGFzc3dvcmQ6"):
+                            self._reply(prompt)
+                            self.rfile.readline()
+                    elif " " not in argument:
+                        self._reply("334 ")
+                        self.rfile.readline()
+                    time.sleep(self.server.login_delay)
+                    self.server.count("logins")
+                    self._reply("235 2.7.0 Authentication successful")
+                elif verb == "MAIL":
+                    sender, recipients = argument, []
+                    self._reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(argument)
+                    self._reply("250 OK")
+                elif verb == "DATA":
+                    self._reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = []
+                    for raw in iter(self.rfile.readline, b""):
+                        if raw in (b".\r\n", b".\n"):
+                            break
+                        data.append(raw)
+                    self.server.store(sender, recipients, b"".join(data))
+                    sender, recipients = None, []
+                    self._reply("250 OK: queued")
+                elif verb == "RSET":
+                    sender, recipients = None, []
+                    self._reply("250 OK")
+                elif verb == "NOOP":
+                    self.server.count("noops")
+                    self._reply("250 OK")
+                elif verb == "QUIT":
+                    self._reply("221 Bye")
+                    return
+                else:
+                    self._reply("502 Command not implemented")
+        except OSError:
+            return
+        finally:
+            self.server.untrack(self.connection)
+
+    def _reply(self, *lines: str) -> None:
+        self.wfile.write("".join(line + "\r\n" for line in lines).encode("utf-8"))
+
+
+class _SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, connect_delay: float, login_delay: float):
+        super().__init__(address, _SmtpHandler)
+        self.connect_delay = connect_delay
+        self.login_delay = login_delay
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self.counters = {"connections": 0, "logins": 0, "noops": 0}
+        self._sockets = set()
+        self._lock = threading.Lock()
+
+    def track(self, sock: socket.socket) -> None:
+        with self._lock:
+            self._sockets.add(sock)
+            self.counters["connections"] += 1
+
+    def untrack(self, sock: socket.socket) -> None:
+        with self._lock:
+            self._sockets.discard(sock)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def store(self, sender: Optional[str], recipients: List[str], data: bytes) -> None:
+        with self._lock:
+            self.messages.append((sender or "", recipients, data))
+
+    def drop_all(self) -> None:
+        with self._lock:
+            sockets = list(self._sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class LocalSmtpServer:
+    """
+    Servidor SMTP de pruebas en 127.0.0.1.
+
+    Uso:
+        with LocalSmtpServer(login_delay=0.05) as smtp:
+            SmtpConnectionPool(smtp.host, smtp.port, "user", "pass", starttls=False)
+    """
+
+    def __init__(self, connect_delay: float = 0.0, login_delay: float = 0.0):
+        """
+        Args:
+            connect_delay (float): Segundos antes del saludo 220 (conexión + TLS).
+            login_delay (float): Segundos que tarda en aceptar el AUTH.
+        """
+        self._server = _SmtpServer(("127.0.0.1", 0), connect_delay, login_delay)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1"
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def messages(self) -> List[Tuple[str, List[str], bytes]]:
+        return list(self._server.messages)
+
+    @property
+    def counters(self) -> dict:
+        return dict(self._server.counters)
+
+    def drop_connections(self) -> None:
+        """Corta todas las conexiones abiertas, como un relay que cierra las inactivas."""
+        self._server.drop_all()
+
+    def __enter__(self) -> "LocalSmtpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,133 @@
+# benchmarks/profile_imports.py
+"""
+Coste de arranque: qué se importa (y cuánto tarda) para llegar a cada punto de entrada.
+
+Cada escenario corre en un intérprete nuevo con `python -X importtime`, así que
+ninguno se beneficia de lo que importó el anterior. Para cada uno se muestra:
+
+    tiempo (s) | módulos cargados | ¿autogen? | ¿google.genai? | importaciones más caras
+
+El escenario "eager" reproduce lo que importaba el inyector antes de hacerse
+perezoso (autogen, ambos proveedores y todos los agentes) y sirve de referencia.
+
+Uso:
+    python -m benchmarks.profile_imports
+    python -m benchmarks.profile_imports --runs 5 --top 8
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import textwrap
+from typing import Dict, List, Tuple
+
+# Lo que cargaba application.dependency_injection al importarse, antes del registro perezoso
+_EAGER_IMPORTS = """
+from autogen import GroupChat, GroupChatManager
+from autogen.agentchat import AssistantAgent, UserProxyAgent, register_function
+from infrastructure.llms_providers.llm_studio.llm_studio import LLMStudio
+from infrastructure.llms_providers.gemini.gemini import Gemini
+from infrastructure.autogen_agents.planner_agent import PlannerAgentFactory
+from infrastructure.autogen_adapters.agent_autogen_wrapper import AgentAutoGenWrapper
+from infrastructure.agents.webscraper.webscraper_agent import WebScraperAgent
+from infrastructure.agents.wikipedia.wikipedia_agent import WikipediaAgent
+from infrastructure.agents.email.email_agent import EmailAgent
+from infrastructure.agents.price_analyzer.price_analyzer_agent import PriceAnalyzerAgent
+import application.dependency_injection
+"""
+
+_LLM_STUDIO_PROVIDER = """
+from application.dependency_injection import DependencyInjector
+from application.enums.llm_provider import LLMProvider
+DependencyInjector.get_llm_provider(LLMProvider.LLM_STUDIO)
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "eager (antes)": _EAGER_IMPORTS,
+    "import dependency_injection": "import application.dependency_injection",
+    "proveedor llm_studio": _LLM_STUDIO_PROVIDER,
+    "import presentation.api": "import presentation.api",
+}
+
+# El código de cada escenario va entre estas dos líneas; la última imprime el resultado
+_PROLOGUE = "import time as _t; _t0 = _t.perf_counter()\n"
+_EPILOGUE = textwrap.dedent(
+    """
+    import sys as _s
+    print("@@", _t.perf_counter() - _t0, len(_s.modules),
+          int("autogen" in _s.modules), int("google.genai" in _s.modules))
+    """
+)
+
+
+def run_scenario(code: str) -> Tuple[float, int, bool, bool, List[Tuple[int, str]]]:
+    """
+    Ejecuta `code` en un proceso nuevo.
+
+    Returns:
+        (segundos, módulos cargados, autogen cargado, google.genai cargado,
+         [(µs acumulados, módulo)] de las importaciones de primer nivel)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROLOGUE + textwrap.dedent(code) + _EPILOGUE],
+        capture_output=True, text=True, env=env,
+    )
+    result = next((line for line in proc.stdout.splitlines() if line.startswith("@@")), None)
+    if proc.returncode != 0 or result is None:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "sin salida")
+
+    _, seconds, modules, autogen, genai = result.split()
+    return float(seconds), int(modules), autogen == "1", genai == "1", _top_level_imports(proc.stderr)
+
+
+def startup_modules() -> set:
+    """Módulos que el intérprete importa antes de ejecutar nada (site, encodings...)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+    return {module for _, module in _top_level_imports(proc.stderr)}
+
+
+def _top_level_imports(stderr: str) -> List[Tuple[int, str]]:
+    """Importaciones de primer nivel de la salida de -X importtime: `import time: self | cumulative | name`."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # cabecera
+        name = parts[2][1:]  # quita el espacio separador; el resto de sangría indica anidamiento
+        if not name.startswith(" "):
+            imports.append((int(parts[1]), name.strip()))
+    return sorted(imports, reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="ejecuciones por escenario (se toma la mediana)")
+    parser.add_argument("--top", type=int, default=5, help="importaciones más caras que se listan")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    args = parser.parse_args()
+
+    startup = startup_modules()
+    print(f"{'escenario':<30} {'tiempo (s)':>10} {'módulos':>8} {'autogen':>8} {'genai':>6}")
+    print("─" * 66)
+    for name in args.scenarios:
+        try:
+            runs = [run_scenario(SCENARIOS[name]) for _ in range(args.runs)]
+        except RuntimeError as exc:
+            print(f"{name:<30} ERROR: {exc}")
+            continue
+        seconds = statistics.median(run[0] for run in runs)
+        _, modules, autogen, genai, imports = runs[-1]
+        print(f"{name:<30} {seconds:>10.3f} {modules:>8} {'sí' if autogen else 'no':>8} {'sí' if genai else 'no':>6}")
+        imports = [(cumulative, module) for cumulative, module in imports if module not in startup]
+        for cumulative, module in imports[:args.top]:
+            print(f"    {cumulative / 1e6:>7.3f}s  {module}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# benchmarks/wikipedia_dump_fixture.py
+"""
+Volcado multistream de Wikipedia en miniatura para probar el backend "dump" sin red.
+
+✔  `write_multistream_dump`: escribe un `.xml.bz2` con el mismo formato que los
+   volcados oficiales (cabecera en el primer flujo, N páginas por flujo, cierre
+   en el último) y, opcionalmente, su índice `offset:page_id:título`.
+✔  `FIXTURE_PAGES`: artículos de ejemplo con redirecciones (también encadenadas).
+✔  `synthetic_pages`: artículos de relleno para volcados de cualquier tamaño.
+
+Uso (genera el volcado, lo indexa y mide las búsquedas):
+    python -m benchmarks.wikipedia_dump_fixture [DIRECTORIO] [--pages N]
+"""
+
+import argparse
+import bz2
+import os
+import random
+import tempfile
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+# (título, wikitexto, destino de la redirección o None)
+DumpPage = Tuple[str, str, Optional[str]]
+
+FIXTURE_PAGES: List[DumpPage] = [
+    ("Italy", "'''Italy''' is a country in [[Europe]]. Its capital is [[Rome]].\n\n"
+              "== History ==\nThe history of Italy is long. {{cite web|url=x}} Roman Empire.\n", None),
+    ("France", "'''France''' is a country in Western Europe.\n\n== Economy ==\nFrance has a large economy.\n", None),
+    ("United Kingdom", "The '''United Kingdom''' is an island country & a [[monarchy]].\n", None),
+    ("UK", "#REDIRECT [[United Kingdom]]", "United Kingdom"),
+    ("Britain", "#REDIRECT [[UK]]", "UK"),
+    ("Rome", "'''Rome''' is the capital of [[Italy]].\n", None),
+    ("Roma", "#REDIRECT [[Rome#History]]", "Rome#History"),
+]
+
+_HEADER = (
+    '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/" version="0.10" xml:lang="en">\n'
+    "  <siteinfo>\n    <sitename>Wikipedia</sitename>\n    <dbname>enwiki</dbname>\n  </siteinfo>\n"
+)
+
+_PAGE = (
+    "  <page>\n    <title>{title}</title>\n    <ns>0</ns>\n    <id>{page_id}</id>\n{redirect}"
+    "    <revision>\n      <id>{revid}</id>\n      <model>wikitext</model>\n      <format>text/x-wiki</format>\n"
+    '      <text bytes="{size}" xml:space="preserve">{text}</text>\n    </revision>\n  </page>\n'
+)
+
+
+def synthetic_pages(count: int, seed: int = 0) -> Iterator[DumpPage]:
+    """`count` artículos de relleno ("Article 0", "Article 1"...) de tamaño variable."""
+    rng = random.Random(seed)
+    words = ["lorem", "ipsum", "[[dolor]]", "sit", "amet", "{{cite}}", "'''consectetur'''", "adipiscing"]
+    for i in range(count):
+        body = " ".join(rng.choice(words) for _ in range(rng.randint(50, 400)))
+        yield f"Article {i}", f"'''Article {i}''' {body}\n\n== Section ==\n{body}\n", None
+
+
+def write_multistream_dump(
+    path: str,
+    pages: Iterable[DumpPage],
+    pages_per_stream: int = 100,
+    index_path: Optional[str] = None,
+) -> int:
+    """
+    Escribe `pages` como volcado multistream en `path`.
+
+    Args:
+        index_path (str, optional): Si se indica, escribe también el índice oficial
+            (`offset:page_id:título`, comprimido con bz2 si acaba en .bz2).
+
+    Returns:
+        int: Número de páginas escritas.
+    """
+    index_lines = []
+    written = 0
+    with open(path, "wb") as out:
+        out.write(bz2.compress(_HEADER.encode("utf-8")))
+        block: List[str] = []
+        block_titles: List[Tuple[int, str]] = []
+
+        def flush():
+            offset = out.tell()
+            out.write(bz2.compress("".join(block).encode("utf-8")))
+            index_lines.extend(f"{offset}:{page_id}:{title}\n" for page_id, title in block_titles)
+            block.clear()
+            block_titles.clear()
+
+        for page_id, (title, text, redirect) in enumerate(pages, start=10):
+            block.append(_PAGE.format(
+                title=escape(title),
+                page_id=page_id,
+                revid=1000 + page_id,
+                redirect=f"    <redirect title={quoteattr(redirect)} />\n" if redirect else "",
+                size=len(text.encode("utf-8")),
+                text=escape(text),
+            ))
+            block_titles.append((page_id, title))
+            written += 1
+            if len(block) == pages_per_stream:
+                flush()
+        if block:
+            flush()
+        out.write(bz2.compress(b"</mediawiki>\n"))
+
+    if index_path:
+        opener = bz2.open if index_path.endswith(".bz2") else open
+        with opener(index_path, "wt", encoding="utf-8") as fp:
+            fp.writelines(index_lines)
+    return written
+
+
+def main(argv=None) -> None:
+    from infrastructure.agents.wikipedia.services.dump_index import DumpIndex
+    from infrastructure.agents.wikipedia.services.dump_indexer import build_index
+    from infrastructure.agents.wikipedia.services.wikipedia_dump_reader import WikipediaDumpReader
+
+    parser = argparse.ArgumentParser(description="Genera un volcado de prueba y mide las búsquedas.")
+    parser.add_argument("directory", nargs="?", help="Directorio de salida (por defecto, uno temporal)")
+    parser.add_argument("--pages", type=int, default=20000, help="Artículos de relleno además de los de ejemplo")
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    directory = args.directory or tempfile.mkdtemp(prefix="wikidump-")
+    os.makedirs(directory, exist_ok=True)
+    dump = os.path.join(directory, "fixture-pages-articles-multistream.xml.bz2")
+    index_file = os.path.join(directory, "fixture-pages-articles-multistream-index.txt.bz2")
+    db = os.path.join(directory, "fixture-index.sqlite")
+
+    pages = [*FIXTURE_PAGES, *synthetic_pages(args.pages)]
+    write_multistream_dump(dump, pages, index_path=index_file)
+    print(f"Volcado: {dump} ({os.path.getsize(dump) / 1e6:.1f} MB, {len(pages)} páginas)")
+
+    for label, source in (("volcado", None), ("índice oficial", index_file)):
+        started = time.perf_counter()
+        count = build_index(dump, db, source)
+        print(f"Indexado desde {label}: {count} títulos en {time.perf_counter() - started:.2f}s")
+
+    reader = WikipediaDumpReader(dump, DumpIndex(db))
+    print({title: (page.title, page.revid) for title, page in reader.fetch_pages(["italy", "Britain", "Roma", "Nope"]).items()})
+
+    titles = [random.choice(pages)[0] for _ in range(args.lookups)]
+    started = time.perf_counter()
+    for title in titles:
+        reader.fetch_pages([title])
+    elapsed = time.perf_counter() - started
+    print(f"{args.lookups} búsquedas sueltas: {elapsed * 1000 / args.lookups:.2f} ms/búsqueda")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/woocommerce_fixture.py
+"""
+Generador de páginas de catálogo con la estructura de una tienda WooCommerce,
+usado por los benchmarks del scraper.
+
+✔  `catalogue_html`: página sintética con el marcado mínimo de un producto.
+✔  `recorded_catalogue_html`: página grabada de una categoría real (12 productos,
+   cabecera, scripts, paginación...) replicada hasta el número de productos pedido.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+# Selectores equivalentes a los que envía el planner para thefansofmagicstore.com
+SHOP_SELECTORS = {
+    "selector_price": "ins .woocommerce-Price-amount bdi",
+    "selector_description": "h3.heading-title.product-name a",
+    "selector_sku": {"tag": "a", "attribute": "data-product_sku"},
+    "selector_container": ".meta-wrapper",
+}
+
+_PRODUCT = (
+    '<li class="product type-product status-publish instock product_cat-magia has-post-thumbnail">'
+    '<div class="product-wrapper">'
+    '<div class="thumbnail-wrapper"><a href="/producto/{slug}/">'
+    '<img src="/wp-content/uploads/{slug}.jpg" alt="{name}" width="300" height="300"></a></div>'
+    '<div class="meta-wrapper">'
+    '<h3 class="heading-title product-name"><a href="/producto/{slug}/">{name}</a></h3>'
+    '<span class="price"><del aria-hidden="true"><span class="woocommerce-Price-amount amount">'
+    '<bdi>{old},00&nbsp;<span class="woocommerce-Price-currencySymbol">&euro;</span></bdi></span></del>'
+    '<ins><span class="woocommerce-Price-amount amount">'
+    '<bdi>{price}&nbsp;<span class="woocommerce-Price-currencySymbol">&euro;</span></bdi></span></ins></span>'
+    '<div class="product-group-button"><div class="loop-add-to-cart">'
+    '<a href="?add-to-cart={pid}" data-quantity="1" class="button product_type_simple add_to_cart_button ajax_add_to_cart" '
+    'data-product_id="{pid}" data-product_sku="{sku}" rel="nofollow">A&ntilde;adir al carrito</a>'
+    '</div></div></div></div></li>'
+)
+
+
+def product_html(i: int) -> str:
+    return _PRODUCT.format(
+        slug=f"juego-de-magia-{i}",
+        name=f"Juego de magia n.º {i}",
+        old=(i % 90) + 10,
+        price=f"{(i % 90) + 5},{i % 100:02d}",
+        pid=1000 + i,
+        sku=f"MAG-{i:06d}",
+    )
+
+
+def catalogue_html(products: int, depth: int = 6, next_page: str = "") -> str:
+    """
+    Construye una página de catálogo con `products` productos.
+
+    Args:
+        products (int): Número de productos de la página.
+        depth (int): Niveles de <div> anidados alrededor del listado (simula temas con DOM profundo).
+        next_page (str): URL de la página siguiente; vacío si es la última.
+    """
+    opening = "".join(f'<div class="wrap-level-{d}">' for d in range(depth))
+    closing = "</div>" * depth
+    items = "".join(product_html(i) for i in range(products))
+    pagination = (
+        f'<nav class="woocommerce-pagination"><ul class="page-numbers">'
+        f'<li><a class="next page-numbers" href="{next_page}">&rarr;</a></li></ul></nav>'
+        if next_page else ""
+    )
+    return (
+        '<!DOCTYPE html><html lang="es"><head><meta charset="UTF-8"><title>Tienda</title></head>'
+        f'<body class="archive post-type-archive-product">{opening}'
+        f'<ul class="products columns-4">{items}</ul>{pagination}'
+        f'{closing}</body></html>'
+    )
+
+
+# ─────── PÁGINA GRABADA ───────
+RECORDED_PAGE = os.path.join(os.path.dirname(__file__), "fixtures", "woocommerce_category_page.html")
+
+# Selectores para la página grabada: productos en oferta (<ins>) y a precio normal
+RECORDED_SELECTORS = {
+    "selector_price": ".price ins bdi, .price > .woocommerce-Price-amount bdi",
+    "selector_description": "h3.heading-title.product-name a",
+    "selector_sku": {"tag": "a", "attribute": "data-product_sku"},
+    "selector_container": ".meta-wrapper",
+}
+
+_ITEM_RE = re.compile(r'<li class="product .*?</li>', re.S)
+_SKU_RE = re.compile(r'data-product_sku="([^"]*)"')
+
+
+@lru_cache(maxsize=1)
+def _recorded_parts() -> tuple:
+    """(cabecera, productos, cola) de la página grabada."""
+    with open(RECORDED_PAGE, encoding="utf-8") as f:
+        page = f.read()
+    items = _ITEM_RE.findall(page)
+    head = page[:page.index(items[0])]
+    tail = page[page.index(items[-1]) + len(items[-1]):]
+    return head, tuple(items), tail
+
+
+def recorded_catalogue_html(products: int) -> str:
+    """
+    Página grabada con `products` productos: los de la grabación se repiten en
+    ciclo y, a partir de la primera vuelta, su SKU lleva el sufijo "-<vuelta>"
+    para que todos sean distintos.
+    """
+    head, items, tail = _recorded_parts()
+    body = []
+    for i in range(products):
+        item = items[i % len(items)]
+        lap = i // len(items)
+        if lap:
+            item = _SKU_RE.sub(lambda m: f'data-product_sku="{m.group(1)}-{lap}"', item)
+        body.append(item)
+    return head + "\n".join(body) + tail
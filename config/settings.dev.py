@@ -1,3 +1,4 @@
+import json
 import os
 
 # Configuración para LLM Studio
@@ -9,13 +10,45 @@ LLM_STUDIO_HEADERS = {
     "Content-Type": "application/json",
     "Authorization": f"Bearer {LLM_STUDIO_API_KEY}"
 }
+# "chat" → /chat/completions (con streaming SSE); "completions" → endpoint de completions heredado
+LLM_STUDIO_API_MODE = os.getenv("LLM_STUDIO_API_MODE", "chat")
+LLM_STUDIO_STREAM = os.getenv("LLM_STUDIO_STREAM", "1") == "1"
+LLM_STUDIO_MAX_TOKENS = int(os.getenv("LLM_STUDIO_MAX_TOKENS", "512"))
+LLM_STUDIO_TEMPERATURE = float(os.environ["LLM_STUDIO_TEMPERATURE"]) if os.getenv("LLM_STUDIO_TEMPERATURE") else None
+# Timeouts (segundos): conexión y lectura (en streaming, espera máxima entre dos eventos)
+LLM_STUDIO_CONNECT_TIMEOUT = float(os.getenv("LLM_STUDIO_CONNECT_TIMEOUT", "5"))
+LLM_STUDIO_READ_TIMEOUT = float(os.getenv("LLM_STUDIO_READ_TIMEOUT", "60"))
+LLM_STUDIO_POOL_MAXSIZE = int(os.getenv("LLM_STUDIO_POOL_MAXSIZE", "4"))
+# Peticiones simultáneas por defecto en send_batch (un servidor local suele atender pocas a la vez)
+LLM_STUDIO_BATCH_CONCURRENCY = int(os.getenv("LLM_STUDIO_BATCH_CONCURRENCY", "4"))
 
 # Configuración para Gemini
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_BATCH_CONCURRENCY = int(os.getenv("GEMINI_BATCH_CONCURRENCY", "8"))
 
 # Obtiene la ruta base del proyecto (un nivel por encima de la carpeta config)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Caché de respuestas de LLM (proveedores y planner): memoria LRU + SQLite, con TTL (segundos)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(BASE_DIR, "cache", "llm_responses.sqlite"))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "256"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+
+# Router de proveedores (llm_type "llm_router"): proveedores, salud y hedging
+LLM_ROUTER_BACKENDS = json.loads(os.getenv("LLM_ROUTER_BACKENDS", '[{"type": "llm_studio"}, {"type": "gemini"}]'))
+LLM_ROUTER_HEDGE = os.getenv("LLM_ROUTER_HEDGE", "0") == "1"
+LLM_ROUTER_HEDGE_PERCENTILE = float(os.getenv("LLM_ROUTER_HEDGE_PERCENTILE", "0.95"))
+LLM_ROUTER_HEDGE_MIN_DELAY = float(os.getenv("LLM_ROUTER_HEDGE_MIN_DELAY", "1"))        # segundos
+LLM_ROUTER_HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_ROUTER_HEDGE_DEFAULT_DELAY", "10"))  # sin datos suficientes
+LLM_ROUTER_MAX_ERROR_RATE = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", "0.5"))
+LLM_ROUTER_MIN_SAMPLES = int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "5"))
+LLM_ROUTER_WINDOW = int(os.getenv("LLM_ROUTER_WINDOW", "50"))                     # llamadas recordadas por proveedor
+LLM_ROUTER_FAILURE_THRESHOLD = int(os.getenv("LLM_ROUTER_FAILURE_THRESHOLD", "3"))  # errores seguidos → cuarentena
+LLM_ROUTER_COOLDOWN = float(os.getenv("LLM_ROUTER_COOLDOWN", "30"))
+LLM_ROUTER_MAX_WORKERS = int(os.getenv("LLM_ROUTER_MAX_WORKERS", "16"))
+
 # Ruta para los ficheros de audio generados
 AUDIO_OUTPUT_FOLDER = os.path.join(BASE_DIR, "presentation", "front_app", "generated_audio")
 
@@ -35,4 +68,84 @@ SMTP_PORT = int(os.getenv("SMTP_PORT", "2525"))
 SMTP_USERNAME = os.getenv("SMTP_USERNAME", "0b8912a4ed76be")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "226639342b6cff")
 SMTP_FROM_EMAIL = os.getenv("SMTP_FROM_EMAIL", "AutoGenIA <autogenia@example.com>")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") == "1"
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+# Pool de conexiones SMTP: conexiones abiertas, cierre por inactividad y NOOP antes de reutilizar (segundos)
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_POOL_IDLE_TIMEOUT = float(os.getenv("SMTP_POOL_IDLE_TIMEOUT", "60"))
+SMTP_POOL_CHECK_AFTER = float(os.getenv("SMTP_POOL_CHECK_AFTER", "5"))
+
+# Bandeja de salida de correo: el agente encola y responde al momento; los workers entregan en segundo plano
+EMAIL_OUTBOX_ENABLED = os.getenv("EMAIL_OUTBOX_ENABLED", "1") == "1"
+EMAIL_OUTBOX_PATH = os.getenv("EMAIL_OUTBOX_PATH", os.path.join(BASE_DIR, "cache", "email_outbox.sqlite"))
+EMAIL_OUTBOX_WORKERS = int(os.getenv("EMAIL_OUTBOX_WORKERS", "2"))
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "10"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+EMAIL_OUTBOX_BACKOFF_BASE = float(os.getenv("EMAIL_OUTBOX_BACKOFF_BASE", "5"))     # segundos, se duplica por intento
+EMAIL_OUTBOX_BACKOFF_MAX = float(os.getenv("EMAIL_OUTBOX_BACKOFF_MAX", "600"))
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", "2"))
+# Correos reservados ("sending") más antiguos que esto se consideran abandonados (se revisa con esta misma frecuencia)
+# La reserva se renueva antes de cada envío: basta con que supere un envío lento (≈ 2 × SMTP_TIMEOUT con reconexión)
+EMAIL_OUTBOX_SENDING_TIMEOUT = float(os.getenv("EMAIL_OUTBOX_SENDING_TIMEOUT", "300"))
+# Modo resumen: avisos acumulados por destinatario y enviados en un único correo al cerrar la ventana (segundos)
+EMAIL_DIGEST_DEFAULT = os.getenv("EMAIL_DIGEST_DEFAULT", "0") == "1"
+EMAIL_DIGEST_WINDOW = float(os.getenv("EMAIL_DIGEST_WINDOW", "900"))
+EMAIL_DIGEST_MAX_PRODUCTS = int(os.getenv("EMAIL_DIGEST_MAX_PRODUCTS", "200"))
+
+# Configuración del agente de Wikipedia
+WIKIPEDIA_API_URL = os.getenv("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+WIKIPEDIA_TIMEOUT = float(os.getenv("WIKIPEDIA_TIMEOUT", "10"))
+# Títulos por consulta a la API (50 es el máximo de MediaWiki para usuarios sin bot flag)
+WIKIPEDIA_BATCH_SIZE = int(os.getenv("WIKIPEDIA_BATCH_SIZE", "50"))
+# Presupuesto de caracteres por artículo devuelto (0 = sin límite) y modo por defecto ("wikitext" o "extract")
+WIKIPEDIA_MAX_CHARS = int(os.getenv("WIKIPEDIA_MAX_CHARS", "1500"))
+WIKIPEDIA_DEFAULT_MODE = os.getenv("WIKIPEDIA_DEFAULT_MODE", "wikitext")
+# Recuperación de pasajes (argumento "question"): tamaño de pasaje, pasajes devueltos e índices BM25 en memoria
+WIKIPEDIA_PASSAGE_CHARS = int(os.getenv("WIKIPEDIA_PASSAGE_CHARS", "600"))
+WIKIPEDIA_PASSAGES_TOP_K = int(os.getenv("WIKIPEDIA_PASSAGES_TOP_K", "3"))
+WIKIPEDIA_PASSAGE_INDEX_CACHE = int(os.getenv("WIKIPEDIA_PASSAGE_INDEX_CACHE", "64"))
+# Caché en disco de artículos limpios; pasado el TTL se revalida el revid (consulta sin contenido)
+WIKIPEDIA_CACHE_ENABLED = os.getenv("WIKIPEDIA_CACHE_ENABLED", "1") == "1"
+WIKIPEDIA_CACHE_PATH = os.getenv("WIKIPEDIA_CACHE_PATH", os.path.join(BASE_DIR, "cache", "wikipedia_articles.sqlite"))
+WIKIPEDIA_CACHE_MAX_BYTES = int(os.getenv("WIKIPEDIA_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+WIKIPEDIA_CACHE_TTL = float(os.getenv("WIKIPEDIA_CACHE_TTL", "3600"))
+# Origen de los artículos: "api" (en línea) o "dump" (volcado multistream local, sin red)
+WIKIPEDIA_BACKEND = os.getenv("WIKIPEDIA_BACKEND", "api")
+WIKIPEDIA_DUMP_PATH = os.getenv("WIKIPEDIA_DUMP_PATH", "")  # *-pages-articles-multistream.xml.bz2
+WIKIPEDIA_DUMP_INDEX_PATH = os.getenv("WIKIPEDIA_DUMP_INDEX_PATH", os.path.join(BASE_DIR, "cache", "wikipedia_dump_index.sqlite"))
+WIKIPEDIA_DUMP_BLOCK_CACHE = int(os.getenv("WIKIPEDIA_DUMP_BLOCK_CACHE", "32"))  # flujos descomprimidos en memoria
+
+# Configuración del scraper web
+SCRAPER_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "15"))
+SCRAPER_MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", "8"))
+SCRAPER_MAX_PER_HOST = int(os.getenv("SCRAPER_MAX_PER_HOST", "2"))
+
+# Transporte HTTP compartido (pools keep-alive por host)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "0"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+
+# Caché en disco de páginas del scraper (GET condicional + LRU)
+SCRAPER_CACHE_ENABLED = os.getenv("SCRAPER_CACHE_ENABLED", "1") == "1"
+SCRAPER_CACHE_PATH = os.getenv("SCRAPER_CACHE_PATH", os.path.join(BASE_DIR, "cache", "webscraper_pages.sqlite"))
+SCRAPER_CACHE_MAX_BYTES = int(os.getenv("SCRAPER_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+SCRAPER_CACHE_TTL = float(os.getenv("SCRAPER_CACHE_TTL", "300"))
+# TTL por dominio en segundos, p.ej. '{"thefansofmagicstore.com": 3600}'
+SCRAPER_CACHE_DOMAIN_TTLS = json.loads(os.getenv("SCRAPER_CACHE_DOMAIN_TTLS", "{}"))
+
+# Backend de parseo HTML: "auto", "selectolax", "lxml", "bs4:lxml" o "html.parser"
+SCRAPER_PARSER_BACKEND = os.getenv("SCRAPER_PARSER_BACKEND", "auto")
+
+# Rastreo por streaming: productos por tienda, páginas seguidas y primera ventana de parseo (bytes)
+SCRAPER_MAX_RESULTS = int(os.getenv("SCRAPER_MAX_RESULTS", "4"))
+SCRAPER_MAX_PAGES = int(os.getenv("SCRAPER_MAX_PAGES", "20"))
+SCRAPER_STREAM_WINDOW = int(os.getenv("SCRAPER_STREAM_WINDOW", str(64 * 1024)))
+
+# Modo incremental (mode="diff"): instantáneas de productos por tienda
+SCRAPER_SNAPSHOT_PATH = os.getenv("SCRAPER_SNAPSHOT_PATH", os.path.join(BASE_DIR, "cache", "webscraper_snapshots.sqlite"))
 
+# Análisis de precios (price_analyze)
+PRICE_ANALYZER_OUTLIER_FACTOR = float(os.getenv("PRICE_ANALYZER_OUTLIER_FACTOR", "1.5"))
+PRICE_ANALYZER_DECIMAL = os.getenv("PRICE_ANALYZER_DECIMAL", "auto")  # "auto", "," o "."
+PRICE_ANALYZER_MAX_ITEMS = int(os.getenv("PRICE_ANALYZER_MAX_ITEMS", "20"))
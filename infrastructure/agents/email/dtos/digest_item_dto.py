@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass
+class DigestItem:
+    """
+    Aviso acumulado en el resumen de un destinatario, pendiente de enviarse.
+
+    Attributes:
+        subject (str): Asunto del correo original.
+        body (str): Cuerpo del correo original.
+        products (List[dict]): Productos del resultado asociado ({"description", "price", "sku", "shop"}).
+        created_at (float): Momento (epoch) en que se añadió.
+    """
+    subject: str
+    body: str
+    products: List[dict] = field(default_factory=list)
+    created_at: float = 0.0
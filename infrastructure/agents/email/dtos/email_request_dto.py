@@ -11,7 +11,9 @@ class EmailRequestDTO:
         to (str): Dirección de correo del destinatario.
         subject (str): Asunto del correo.
         body (str): Contenido principal del mensaje.
+        digest (bool): Acumular en el resumen del destinatario en lugar de enviarlo ya.
     """
     to: str
     subject: str
-    body: str
\ No newline at end of file
+    body: str
+    digest: bool = False
@@ -11,7 +11,9 @@ class EmailResponseDTO:
         status (StatusCode): Estado del envío (éxito o fallo).
         message (str): Mensaje descriptivo del resultado.
         delivered_to (str): Dirección a la que se intentó enviar (opcional).
+        message_id (str): Id en la bandeja de salida si el correo se encoló (opcional).
     """
     status: StatusCode
     message: str = "OK"
-    delivered_to: str = ""
\ No newline at end of file
+    delivered_to: str = ""
+    message_id: str = ""
\ No newline at end of file
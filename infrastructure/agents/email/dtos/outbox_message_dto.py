@@ -0,0 +1,42 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+# Estados de un correo en la bandeja de salida
+OUTBOX_QUEUED = "queued"    # pendiente (o esperando al siguiente reintento)
+OUTBOX_SENDING = "sending"  # reservado por un worker
+OUTBOX_SENT = "sent"
+OUTBOX_FAILED = "failed"    # error permanente o reintentos agotados
+
+@dataclass
+class OutboxMessage:
+    """
+    Correo guardado en la bandeja de salida.
+
+    Attributes:
+        id (str): Identificador devuelto al encolar.
+        to (str): Destinatario.
+        subject (str): Asunto.
+        body (str): Cuerpo del mensaje.
+        status (str): OUTBOX_QUEUED, OUTBOX_SENDING, OUTBOX_SENT u OUTBOX_FAILED.
+        attempts (int): Intentos de entrega realizados.
+        next_attempt_at (float): Momento (epoch) a partir del cual se puede volver a intentar.
+        last_error (str, optional): Último error de entrega.
+        created_at (float): Momento en que se encoló.
+        sent_at (float, optional): Momento de la entrega.
+    """
+    id: str
+    to: str
+    subject: str
+    body: str
+    status: str
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    last_error: Optional[str] = None
+    created_at: float = 0.0
+    sent_at: Optional[float] = None
+
+    def to_dict(self, include_body: bool = False) -> dict:
+        data = asdict(self)
+        if not include_body:
+            data.pop("body")
+        return data
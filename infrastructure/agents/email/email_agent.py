@@ -1,10 +1,19 @@
 # email_agent.py
+import time
+from typing import Optional
+
 from application.interfaces.agent_interface import AgentInterface
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
 from infrastructure.agents.email.mappers.email_mapper import EmailMapper
 from infrastructure.agents.email.services.smtp_service import SmtpService
 from infrastructure.agents.email.dtos.email_response_dto import EmailResponseDTO
+from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
+from infrastructure.agents.email.dtos.outbox_message_dto import OutboxMessage
+from infrastructure.agents.email.services.outbox_dispatcher import get_shared_dispatcher, get_shared_outbox
+from infrastructure.agents.email.services.email_digest import products_from_result
+from buffer.shared_buffer import get_last_json
+from config.settings import EMAIL_OUTBOX_ENABLED, EMAIL_DIGEST_WINDOW
 from application.enums.status_code import StatusCode        # ← enum real
 # test_email_direct.py
 import smtplib
@@ -12,6 +21,10 @@ from email.message import EmailMessage
 
 
 class EmailAgent(AgentInterface):
+    def __init__(self):
+        # Un único servicio (y su pool de conexiones SMTP) para todos los envíos
+        self._smtp_service = SmtpService()
+
     @classmethod
     def get_function_name(cls) -> str:
         return "send_email"
@@ -32,6 +45,10 @@ class EmailAgent(AgentInterface):
                         "to": {"type": "string"},
                         "subject": {"type": "string"},
                         "body": {"type": "string"},
+                        "digest": {
+                            "type": "boolean",
+                            "description": "Acumular el aviso en un resumen periódico para el destinatario en lugar de enviarlo ya",
+                        },
                     },
                     "required": ["to", "subject", "body"],
                     # "additionalProperties": False          # ⬅️ esto impide 'search', 'kwargs', etc.
@@ -52,11 +69,16 @@ class EmailAgent(AgentInterface):
             print(f"   Subject: {email_request.subject}")
             print(f"   Body: {email_request.body}")
 
-            # Enviamos el correo usando el servicio SMTP
-            smtp_service = SmtpService()
-            email_response = smtp_service.send_email(email_request)
+            # Modo resumen: se acumula y se envía un único correo al cerrar la ventana.
+            # Con bandeja de salida se encola y se responde al momento; si no, envío directo
+            if email_request.digest:
+                email_response = self._add_to_digest(email_request)
+            elif EMAIL_OUTBOX_ENABLED:
+                email_response = self._enqueue(email_request)
+            else:
+                email_response = self._smtp_service.send_email(email_request)
 
-            print("[EmailAgent] Respuesta del servicio SMTP:")
+            print("[EmailAgent] Respuesta del servicio de correo:")
             print(f"   Status: {email_response.status}")
             print(f"   Message: {email_response.message}")
 
@@ -73,3 +95,32 @@ class EmailAgent(AgentInterface):
             return EmailMapper.map_response(
                 EmailResponseDTO(status=StatusCode.ERROR, message=f"Error interno: {str(e)}")
             )
+
+    def status(self, message_id: str) -> Optional[OutboxMessage]:
+        """Estado de entrega de un correo encolado (None si el id no existe)."""
+        return get_shared_outbox().get(message_id)
+
+    @staticmethod
+    def _add_to_digest(request: EmailRequestDTO) -> EmailResponseDTO:
+        dispatcher = get_shared_dispatcher()
+        products = products_from_result(get_last_json())
+        due_at = dispatcher.outbox.add_to_digest(request, products, EMAIL_DIGEST_WINDOW)
+        dispatcher.notify()
+        minutes = max(0, round((due_at - time.time()) / 60))
+        return EmailResponseDTO(
+            status=StatusCode.SUCCESS,
+            message=f"Aviso para {request.to} añadido al resumen ({len(products)} productos); se enviará en ~{minutes} min",
+            delivered_to=request.to,
+        )
+
+    @staticmethod
+    def _enqueue(request: EmailRequestDTO) -> EmailResponseDTO:
+        dispatcher = get_shared_dispatcher()
+        message_id = dispatcher.outbox.enqueue(request)
+        dispatcher.notify()
+        return EmailResponseDTO(
+            status=StatusCode.SUCCESS,
+            message=f"Correo para {request.to} encolado para su envío (id {message_id})",
+            delivered_to=request.to,
+            message_id=message_id,
+        )
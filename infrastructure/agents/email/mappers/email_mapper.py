@@ -3,17 +3,26 @@ from infrastructure.agents.email.dtos.email_response_dto import EmailResponseDTO
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
 from application.enums.status_code import StatusCode
+from config.settings import EMAIL_DIGEST_DEFAULT
 
 class EmailMapper:
     @staticmethod
     def map_request(app_request: AgentAppRequest) -> EmailRequestDTO:
-        data = app_request.content                  # dict con to/subject/body
+        data = app_request.content                  # dict con to/subject/body (y digest opcional)
         return EmailRequestDTO(
             to      = data["to"],
             subject = data["subject"],
-            body    = data["body"]
+            body    = data["body"],
+            digest  = EmailMapper._flag(data.get("digest", EMAIL_DIGEST_DEFAULT))
         )
 
+    @staticmethod
+    def _flag(value) -> bool:
+        # El LLM a veces manda los booleanos como texto ("true", "false")
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "si", "sí")
+        return bool(value)
+
     @staticmethod
     def map_response(dto: EmailResponseDTO) -> AgentAppResponse:
         return AgentAppResponse(
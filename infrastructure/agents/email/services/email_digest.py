@@ -0,0 +1,81 @@
+# infrastructure/agents/email/services/email_digest.py
+"""
+Composición del correo resumen (digest) de un destinatario.
+
+✔  Une todos los avisos acumulados durante la ventana en un único mensaje.
+✔  Productos deduplicados por tienda y SKU (o descripción si no hay SKU):
+   se conserva el último precio visto.
+✔  Los cuerpos repetidos aparecen una sola vez.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from config.settings import EMAIL_DIGEST_MAX_PRODUCTS
+from infrastructure.agents.email.dtos.digest_item_dto import DigestItem
+from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
+
+
+def products_from_result(result: Any) -> List[dict]:
+    """
+    Productos del último resultado del scraper (buffer compartido): el lote completo
+    o, en modo diff, los productos nuevos y los que han cambiado de precio.
+    """
+    if not isinstance(result, dict):
+        return []
+    products = result.get("products")
+    records = products.to_records() if hasattr(products, "to_records") else list(products or [])
+    for diff in result.get("diff") or []:
+        records += [{**product, "shop": product.get("shop") or diff["url"]} for product in diff.get("new", [])]
+        records += [
+            {"description": change["description"], "price": change["price"], "sku": change["sku"], "shop": diff["url"]}
+            for change in diff.get("repriced", [])
+        ]
+    return [r for r in records if isinstance(r, dict)]
+
+
+def dedupe_products(items: List[DigestItem]) -> List[dict]:
+    """Productos de todos los avisos sin repetir, en orden de primera aparición."""
+    products: Dict[Tuple[str, str], dict] = {}
+    for item in items:
+        for product in item.products:
+            key = (product.get("shop") or "", product.get("sku") or product.get("description") or "")
+            if key == ("", ""):
+                continue
+            # dict conserva la posición de la primera aparición aunque se actualice el valor
+            products[key] = product
+    return list(products.values())
+
+
+def render_digest(recipient: str, items: List[DigestItem], max_products: int = EMAIL_DIGEST_MAX_PRODUCTS) -> EmailRequestDTO:
+    """
+    Correo único con el contenido de `items`.
+
+    Args:
+        recipient (str): Destinatario del resumen.
+        items (List[DigestItem]): Avisos acumulados, en orden de llegada.
+        max_products (int): Productos listados como máximo.
+    """
+    subjects = list(dict.fromkeys(item.subject for item in items))
+    if len(subjects) == 1:
+        subject = f"{subjects[0]} (resumen de {len(items)} avisos)"
+    else:
+        subject = f"Resumen de {len(items)} avisos"
+
+    lines = []
+    products = dedupe_products(items)
+    if products:
+        lines.append(f"Productos ({len(products)}):")
+        for product in products[:max_products]:
+            sku = f" [{product['sku']}]" if product.get("sku") else ""
+            shop = f" — {product['shop']}" if product.get("shop") else ""
+            lines.append(f"  • {product.get('description', '')}{sku}: {product.get('price', '')}{shop}")
+        if len(products) > max_products:
+            lines.append(f"  … y {len(products) - max_products} más")
+        lines.append("")
+
+    bodies = list(dict.fromkeys(item.body.strip() for item in items if item.body.strip()))
+    if bodies:
+        lines.append("Avisos:" if products else "")
+        lines.extend(f"{body}\n" for body in bodies)
+
+    return EmailRequestDTO(to=recipient, subject=subject, body="\n".join(lines).strip() + "\n")
@@ -0,0 +1,330 @@
+# infrastructure/agents/email/services/email_outbox.py
+"""
+Bandeja de salida persistente (SQLite) para los correos del EmailAgent.
+
+✔  Encolar es una inserción local: el agente responde al instante con un id,
+   sin esperar al servidor SMTP.
+✔  Los workers reservan lotes de forma atómica (queued → sending), así que
+   varios hilos o procesos no envían el mismo correo dos veces.
+✔  Reintentos programados (`next_attempt_at`) y estado consultable por id.
+✔  Los correos que quedaron en "sending" tras una caída se devuelven a la cola al arrancar.
+✔  Modo resumen: los avisos se acumulan por destinatario y, al cerrar la ventana,
+   se encolan como un único correo en la misma transacción en que se vacía el resumen.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from config.settings import EMAIL_OUTBOX_PATH
+from infrastructure.agents.email.dtos.digest_item_dto import DigestItem
+from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
+from infrastructure.agents.email.dtos.outbox_message_dto import (
+    OutboxMessage,
+    OUTBOX_FAILED,
+    OUTBOX_QUEUED,
+    OUTBOX_SENDING,
+    OUTBOX_SENT,
+)
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = "id, to_addr, subject, body, status, attempts, next_attempt_at, last_error, created_at, sent_at"
+
+
+class EmailOutbox:
+    """
+    Cola persistente de correos pendientes de entrega.
+    """
+
+    def __init__(self, path: str = EMAIL_OUTBOX_PATH):
+        """
+        Args:
+            path (str): Fichero SQLite de la bandeja de salida.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id              TEXT PRIMARY KEY,
+                to_addr         TEXT NOT NULL,
+                subject         TEXT NOT NULL,
+                body            TEXT NOT NULL,
+                status          TEXT NOT NULL,
+                attempts        INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error      TEXT,
+                created_at      REAL NOT NULL,
+                updated_at      REAL NOT NULL,
+                sent_at         REAL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt_at)")
+        # Resúmenes abiertos (uno por destinatario) y sus avisos acumulados
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS digests (
+                to_addr TEXT PRIMARY KEY,
+                due_at  REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS digest_items (
+                id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                to_addr    TEXT NOT NULL,
+                subject    TEXT NOT NULL,
+                body       TEXT NOT NULL,
+                products   TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_digests_due ON digests(due_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_digest_items_to ON digest_items(to_addr, id)")
+
+    # ─────── PRODUCTOR ───────
+    def enqueue(self, request: EmailRequestDTO) -> str:
+        """Guarda el correo como pendiente y devuelve su id."""
+        message_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO outbox (id, to_addr, subject, body, status, next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (message_id, request.to, request.subject, request.body, OUTBOX_QUEUED, now, now, now),
+            )
+        logger.debug("[EmailOutbox] Encolado %s → %s", message_id, request.to)
+        return message_id
+
+    def add_to_digest(self, request: EmailRequestDTO, products: List[dict], window: float) -> float:
+        """
+        Acumula el aviso en el resumen del destinatario y devuelve cuándo (epoch) se enviará.
+
+        La ventana se abre con el primer aviso y no se alarga con los siguientes,
+        así que ningún aviso espera más de `window` segundos.
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO digests (to_addr, due_at) VALUES (?, ?)", (request.to, now + window)
+                )
+                self._db.execute(
+                    "INSERT INTO digest_items (to_addr, subject, body, products, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (request.to, request.subject, request.body, json.dumps(products, ensure_ascii=False), now),
+                )
+                (due_at,) = self._db.execute(
+                    "SELECT due_at FROM digests WHERE to_addr = ?", (request.to,)
+                ).fetchone()
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        logger.debug("[EmailOutbox] Aviso para %s añadido al resumen (envío en %.0fs)", request.to, due_at - now)
+        return due_at
+
+    def flush_due_digests(self, render: Callable[[str, List[DigestItem]], EmailRequestDTO]) -> List[str]:
+        """
+        Encola un correo por cada resumen cuya ventana ha vencido y vacía esos resúmenes.
+
+        Args:
+            render: Construye el correo a partir del destinatario y sus avisos.
+
+        Returns:
+            List[str]: Ids de los correos encolados.
+        """
+        now = time.time()
+        message_ids = []
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                recipients = [
+                    to for (to,) in self._db.execute("SELECT to_addr FROM digests WHERE due_at <= ?", (now,))
+                ]
+                for to in recipients:
+                    rows = self._db.execute(
+                        "SELECT subject, body, products, created_at FROM digest_items WHERE to_addr = ? ORDER BY id",
+                        (to,),
+                    ).fetchall()
+                    if rows:
+                        items = [
+                            DigestItem(subject=subject, body=body, products=json.loads(products), created_at=created_at)
+                            for subject, body, products, created_at in rows
+                        ]
+                        request = render(to, items)
+                        message_id = uuid.uuid4().hex
+                        self._db.execute(
+                            "INSERT INTO outbox (id, to_addr, subject, body, status, next_attempt_at, created_at, updated_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (message_id, request.to, request.subject, request.body, OUTBOX_QUEUED, now, now, now),
+                        )
+                        message_ids.append(message_id)
+                        logger.info("[EmailOutbox] Resumen %s → %s con %d avisos", message_id, to, len(items))
+                    self._db.execute("DELETE FROM digest_items WHERE to_addr = ?", (to,))
+                    self._db.execute("DELETE FROM digests WHERE to_addr = ?", (to,))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return message_ids
+
+    # ─────── CONSULTA ───────
+    def get(self, message_id: str) -> Optional[OutboxMessage]:
+        with self._lock:
+            row = self._db.execute(f"SELECT {_COLUMNS} FROM outbox WHERE id = ?", (message_id,)).fetchone()
+        return self._message(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """Número de correos por estado."""
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        counts = {status: 0 for status in (OUTBOX_QUEUED, OUTBOX_SENDING, OUTBOX_SENT, OUTBOX_FAILED)}
+        counts.update(dict(rows))
+        return counts
+
+    def recent(self, limit: int = 50, status: Optional[str] = None) -> List[OutboxMessage]:
+        query = f"SELECT {_COLUMNS} FROM outbox"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY created_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [self._message(row) for row in rows]
+
+    def next_due_in(self) -> Optional[float]:
+        """Segundos hasta el próximo correo pendiente (0 si ya hay alguno), o None si no hay."""
+        with self._lock:
+            (due,) = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = ?", (OUTBOX_QUEUED,)
+            ).fetchone()
+        return None if due is None else max(0.0, due - time.time())
+
+    def next_digest_due_in(self) -> Optional[float]:
+        """Segundos hasta que vence el próximo resumen abierto, o None si no hay ninguno."""
+        with self._lock:
+            (due,) = self._db.execute("SELECT MIN(due_at) FROM digests").fetchone()
+        return None if due is None else max(0.0, due - time.time())
+
+    def digest_counts(self) -> Dict[str, int]:
+        """Resúmenes abiertos y avisos acumulados en ellos."""
+        with self._lock:
+            (digests,) = self._db.execute("SELECT COUNT(*) FROM digests").fetchone()
+            (items,) = self._db.execute("SELECT COUNT(*) FROM digest_items").fetchone()
+        return {"digests": digests, "items": items}
+
+    # ─────── CONSUMIDOR ───────
+    def claim_batch(self, limit: int) -> List[OutboxMessage]:
+        """Reserva hasta `limit` correos vencidos (pasan a "sending") y los devuelve."""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    f"SELECT {_COLUMNS} FROM outbox WHERE status = ? AND next_attempt_at <= ? "
+                    "ORDER BY next_attempt_at LIMIT ?",
+                    (OUTBOX_QUEUED, now, limit),
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE outbox SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    [(OUTBOX_SENDING, now, row[0]) for row in rows],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        messages = [self._message(row) for row in rows]
+        for message in messages:
+            message.status = OUTBOX_SENDING
+            message.attempts += 1
+        return messages
+
+    def touch(self, message_ids: Sequence[str]) -> Set[str]:
+        """
+        Renueva la reserva de los correos indicados (requeue_stale mide desde aquí).
+
+        Returns:
+            Set[str]: Los que seguían reservados; el resto volvió a la cola y no se debe enviar.
+        """
+        now = time.time()
+        reserved = set()
+        with self._lock:
+            for message_id in message_ids:
+                cursor = self._db.execute(
+                    "UPDATE outbox SET updated_at = ? WHERE id = ? AND status = ?",
+                    (now, message_id, OUTBOX_SENDING),
+                )
+                if cursor.rowcount:
+                    reserved.add(message_id)
+        return reserved
+
+    def mark_sent(self, message_id: str) -> None:
+        now = time.time()
+        self._update(message_id, "status = ?, sent_at = ?, last_error = NULL", (OUTBOX_SENT, now))
+
+    def mark_retry(self, message_id: str, error: str, delay: float) -> None:
+        self._update(
+            message_id, "status = ?, next_attempt_at = ?, last_error = ?",
+            (OUTBOX_QUEUED, time.time() + delay, error),
+        )
+
+    def mark_failed(self, message_id: str, error: str) -> None:
+        self._update(message_id, "status = ?, last_error = ?", (OUTBOX_FAILED, error))
+
+    def requeue_stale(self, older_than: float) -> int:
+        """Devuelve a la cola los correos reservados hace más de `older_than` segundos (worker caído)."""
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE outbox SET status = ?, next_attempt_at = ?, updated_at = ? WHERE status = ? AND updated_at < ?",
+                (OUTBOX_QUEUED, now, now, OUTBOX_SENDING, now - older_than),
+            )
+        if cursor.rowcount:
+            logger.info("[EmailOutbox] %d correos reservados se devuelven a la cola", cursor.rowcount)
+        return cursor.rowcount
+
+    def purge_sent(self, older_than: float) -> int:
+        """Borra los correos entregados hace más de `older_than` segundos."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbox WHERE status = ? AND sent_at < ?", (OUTBOX_SENT, time.time() - older_than)
+            )
+        return cursor.rowcount
+
+    # ─────── HELPERS ───────
+    def _update(self, message_id: str, assignments: str, params: tuple) -> None:
+        with self._lock:
+            self._db.execute(
+                f"UPDATE outbox SET {assignments}, updated_at = ? WHERE id = ?",
+                (*params, time.time(), message_id),
+            )
+
+    @staticmethod
+    def _message(row) -> OutboxMessage:
+        message_id, to, subject, body, status, attempts, next_attempt_at, last_error, created_at, sent_at = row
+        return OutboxMessage(
+            id=message_id,
+            to=to,
+            subject=subject,
+            body=body,
+            status=status,
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            last_error=last_error,
+            created_at=created_at,
+            sent_at=sent_at,
+        )
@@ -0,0 +1,218 @@
+# infrastructure/agents/email/services/outbox_dispatcher.py
+"""
+Workers en segundo plano que entregan los correos de la bandeja de salida.
+
+✔  Cada worker reserva un lote de correos vencidos y los envía por el pool SMTP
+   (las conexiones se reutilizan dentro del lote y entre lotes).
+✔  Errores temporales (conexión, 4xx) → reintento con espera exponencial y jitter;
+   errores permanentes (5xx, destinatario rechazado) o reintentos agotados → "failed".
+✔  Se despiertan al encolar un correo; si no, sondean la cola periódicamente.
+✔  En cada vuelta encolan los resúmenes (modo digest) cuya ventana ha vencido.
+✔  Al arrancar y luego cada `sending_timeout` segundos devuelven a la cola los
+   correos reservados por un worker que no llegó a terminarlos.
+"""
+
+import logging
+import random
+import smtplib
+import threading
+import time
+from typing import List, Optional
+
+from config.settings import (
+    EMAIL_OUTBOX_WORKERS,
+    EMAIL_OUTBOX_BATCH_SIZE,
+    EMAIL_OUTBOX_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_BACKOFF_BASE,
+    EMAIL_OUTBOX_BACKOFF_MAX,
+    EMAIL_OUTBOX_POLL_INTERVAL,
+    EMAIL_OUTBOX_SENDING_TIMEOUT,
+)
+from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
+from infrastructure.agents.email.dtos.outbox_message_dto import OutboxMessage
+from infrastructure.agents.email.services.email_digest import render_digest
+from infrastructure.agents.email.services.email_outbox import EmailOutbox
+from infrastructure.agents.email.services.smtp_service import SmtpService
+
+logger = logging.getLogger(__name__)
+
+
+def is_permanent_error(exc: BaseException) -> bool:
+    """True si reintentar no va a servir (rechazo 5xx o datos no válidos)."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(500 <= code < 600 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 500 <= exc.smtp_code < 600
+    return isinstance(exc, (ValueError, smtplib.SMTPNotSupportedError))
+
+
+class OutboxDispatcher:
+    """
+    Entrega en segundo plano los correos de una EmailOutbox.
+    """
+
+    def __init__(
+        self,
+        outbox: EmailOutbox,
+        smtp_service: SmtpService,
+        workers: int = EMAIL_OUTBOX_WORKERS,
+        batch_size: int = EMAIL_OUTBOX_BATCH_SIZE,
+        max_attempts: int = EMAIL_OUTBOX_MAX_ATTEMPTS,
+        backoff_base: float = EMAIL_OUTBOX_BACKOFF_BASE,
+        backoff_max: float = EMAIL_OUTBOX_BACKOFF_MAX,
+        poll_interval: float = EMAIL_OUTBOX_POLL_INTERVAL,
+        sending_timeout: float = EMAIL_OUTBOX_SENDING_TIMEOUT,
+    ):
+        """
+        Args:
+            outbox (EmailOutbox): Bandeja de salida de la que se leen los correos.
+            smtp_service (SmtpService): Servicio de envío (con su pool de conexiones).
+            workers (int): Hilos de entrega.
+            batch_size (int): Correos reservados por cada worker en cada vuelta.
+            max_attempts (int): Intentos antes de marcar un correo como fallido.
+            backoff_base (float): Espera (s) tras el primer fallo; se duplica en cada reintento.
+            backoff_max (float): Espera máxima (s) entre reintentos.
+            poll_interval (float): Cada cuánto (s) se revisa la cola si nadie avisa.
+            sending_timeout (float): Segundos tras los que un correo reservado se da por abandonado.
+        """
+        self.outbox = outbox
+        self.smtp_service = smtp_service
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self.sending_timeout = sending_timeout
+        self._next_requeue_at = 0.0  # monotonic; lo comparten todos los workers
+        self._requeue_lock = threading.Lock()
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    # ─────── CICLO DE VIDA ───────
+    def start(self) -> "OutboxDispatcher":
+        with self._lock:
+            if self._threads:
+                return self
+            self._stop.clear()
+            # Correos que un proceso anterior dejó a medias
+            self._requeue_stale_if_due()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"email-outbox-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        logger.info("[OutboxDispatcher] %d workers de correo iniciados", self.workers)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Detiene los workers cuando terminan el lote en curso."""
+        self._stop.set()
+        self._wake.set()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def notify(self) -> None:
+        """Avisa a los workers de que hay correo nuevo."""
+        self._wake.set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads) and not self._stop.is_set()
+
+    # ─────── WORKERS ───────
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._requeue_stale_if_due()
+                self.outbox.flush_due_digests(render_digest)
+                batch = self.outbox.claim_batch(self.batch_size)
+            except Exception:
+                logger.exception("[OutboxDispatcher] Error leyendo la bandeja de salida")
+                batch = []
+
+            if not batch:
+                due = [d for d in (self.outbox.next_due_in(), self.outbox.next_digest_due_in()) if d is not None]
+                timeout = min([*due, self.poll_interval])
+                self._wake.wait(timeout)
+                self._wake.clear()
+                continue
+
+            # El lote se envía en serie: antes de cada envío se renueva la reserva de lo que
+            # queda, para que el barrido de requeue_stale no devuelva a la cola (y otro worker
+            # envíe por duplicado) correos que sólo esperan su turno
+            for i, message in enumerate(batch):
+                if message.id not in self.outbox.touch([m.id for m in batch[i:]]):
+                    logger.info("[OutboxDispatcher] %s ya no está reservado; no se envía", message.id)
+                    continue
+                self._deliver(message)
+
+    def _requeue_stale_if_due(self) -> None:
+        """Devuelve a la cola los correos abandonados, como mucho una vez cada `sending_timeout`."""
+        with self._requeue_lock:
+            now = time.monotonic()
+            if now < self._next_requeue_at:
+                return
+            self._next_requeue_at = now + self.sending_timeout
+        self.outbox.requeue_stale(self.sending_timeout)
+
+    def _deliver(self, message: OutboxMessage) -> None:
+        request = EmailRequestDTO(to=message.to, subject=message.subject, body=message.body)
+        try:
+            self.smtp_service.deliver(request)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            if is_permanent_error(exc) or message.attempts >= self.max_attempts:
+                logger.warning("[OutboxDispatcher] %s fallido tras %d intentos: %s", message.id, message.attempts, error)
+                self.outbox.mark_failed(message.id, error)
+            else:
+                delay = self.backoff_delay(message.attempts)
+                logger.info("[OutboxDispatcher] %s reintento en %.1fs: %s", message.id, delay, error)
+                self.outbox.mark_retry(message.id, error, delay)
+            return
+
+        self.outbox.mark_sent(message.id)
+        logger.info("[OutboxDispatcher] %s entregado a %s", message.id, message.to)
+
+    def backoff_delay(self, attempts: int) -> float:
+        """Espera antes del siguiente intento: base · 2^(intentos-1), con tope y ±20 % de jitter."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(0.8, 1.2)
+
+
+_shared_outbox: Optional[EmailOutbox] = None
+_shared_dispatcher: Optional[OutboxDispatcher] = None
+_shared_lock = threading.Lock()
+
+
+def _outbox() -> EmailOutbox:
+    # Llamar con _shared_lock tomado
+    global _shared_outbox
+    if _shared_outbox is None:
+        _shared_outbox = EmailOutbox()
+    return _shared_outbox
+
+
+def get_shared_outbox() -> EmailOutbox:
+    """
+    Devuelve la bandeja de salida compartida sin arrancar los workers
+    (consultas de estado, también con EMAIL_OUTBOX_ENABLED=0).
+    """
+    with _shared_lock:
+        return _outbox()
+
+
+def get_shared_dispatcher() -> OutboxDispatcher:
+    """
+    Devuelve la bandeja de salida compartida con sus workers ya arrancados
+    (se crea la primera vez).
+    """
+    global _shared_dispatcher
+    with _shared_lock:
+        if _shared_dispatcher is None:
+            _shared_dispatcher = OutboxDispatcher(_outbox(), SmtpService()).start()
+        return _shared_dispatcher
@@ -0,0 +1,304 @@
+# infrastructure/agents/email/services/smtp_pool.py
+"""
+Pool de conexiones SMTP autenticadas y reutilizables.
+
+✔  Cada conexión hace STARTTLS y login una sola vez y se reutiliza para muchos correos.
+✔  Seguro entre hilos: como mucho `max_size` conexiones abiertas; el resto espera turno.
+✔  Las conexiones que llevan un rato paradas se comprueban con NOOP antes de usarse;
+   si el servidor las cerró, se abre otra.
+✔  Un hilo de limpieza cierra (QUIT) las que superan el tiempo máximo de inactividad.
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Deque, Iterator, Optional
+
+from config.settings import (
+    SMTP_SERVER,
+    SMTP_PORT,
+    SMTP_USERNAME,
+    SMTP_PASSWORD,
+    SMTP_STARTTLS,
+    SMTP_TIMEOUT,
+    SMTP_POOL_SIZE,
+    SMTP_POOL_IDLE_TIMEOUT,
+    SMTP_POOL_CHECK_AFTER,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errores que indican que la conexión ya no sirve (hay que descartarla)
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError)
+
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    created_at: float
+    last_used: float
+
+
+@dataclass
+class SmtpPoolStats:
+    created: int = 0           # conexiones abiertas (handshake + login)
+    reused: int = 0            # préstamos servidos con una conexión ya abierta
+    health_failures: int = 0   # NOOP fallidos (conexión cerrada por el servidor)
+    discarded: int = 0         # conexiones descartadas tras un error
+    idle_closed: int = 0       # cerradas por inactividad
+    open: int = 0
+    idle: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+class SmtpConnectionPool:
+    """
+    Pool de conexiones a un servidor SMTP.
+
+    Uso:
+        with pool.connection() as smtp:
+            smtp.send_message(msg)
+    """
+
+    def __init__(
+        self,
+        host: str = SMTP_SERVER,
+        port: int = SMTP_PORT,
+        username: Optional[str] = SMTP_USERNAME,
+        password: Optional[str] = SMTP_PASSWORD,
+        starttls: bool = SMTP_STARTTLS,
+        timeout: float = SMTP_TIMEOUT,
+        max_size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT,
+        check_after: float = SMTP_POOL_CHECK_AFTER,
+    ):
+        """
+        Args:
+            host (str): Servidor SMTP.
+            port (int): Puerto SMTP.
+            username (str, optional): Usuario; sin usuario no se hace login.
+            password (str, optional): Contraseña.
+            starttls (bool): Negociar TLS con STARTTLS tras conectar.
+            timeout (float): Timeout de socket en segundos.
+            max_size (int): Conexiones abiertas como máximo.
+            idle_timeout (float): Segundos de inactividad tras los que se cierra una conexión.
+            check_after (float): Segundos de inactividad a partir de los que se hace NOOP antes de reutilizarla.
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.check_after = check_after
+
+        self._idle: Deque[_PooledConnection] = deque()
+        self._open = 0
+        self._stats = SmtpPoolStats()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+
+    # ─────── API PÚBLICA ───────
+    @contextmanager
+    def connection(self, wait: Optional[float] = None) -> Iterator[smtplib.SMTP]:
+        """
+        Presta una conexión lista para enviar. Si el bloque lanza un error de
+        conexión, la conexión se descarta en lugar de devolverse al pool.
+
+        Args:
+            wait (float, optional): Segundos de espera máxima si todas las conexiones están en uso.
+
+        Raises:
+            TimeoutError: Si no queda ninguna conexión libre en `wait` segundos.
+            smtplib.SMTPException / OSError: Si no se puede conectar o autenticar.
+        """
+        conn = self._acquire(wait)
+        try:
+            yield conn.smtp
+        except CONNECTION_ERRORS:
+            self._discard(conn)
+            raise
+        except smtplib.SMTPResponseException as exc:
+            # 421: el servidor va a cerrar la conexión
+            if exc.smtp_code == 421:
+                self._discard(conn)
+            else:
+                self._reset_and_release(conn)
+            raise
+        except BaseException:
+            self._reset_and_release(conn)
+            raise
+        else:
+            self._release(conn)
+
+    def stats(self) -> SmtpPoolStats:
+        with self._cond:
+            return SmtpPoolStats(**{**self._stats.__dict__, "open": self._open, "idle": len(self._idle)})
+
+    def close(self) -> None:
+        """Cierra todas las conexiones libres; las prestadas se cierran al devolverse."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._quit(conn)
+
+    # ─────── HELPERS ───────
+    def _acquire(self, wait: Optional[float]) -> _PooledConnection:
+        deadline = None if wait is None else time.monotonic() + wait
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("El pool SMTP está cerrado")
+                conn = self._idle.pop() if self._idle else None   # LIFO: la más reciente
+                if conn is None:
+                    if self._open < self.max_size:
+                        self._open += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No hay conexiones SMTP libres")
+                    self._cond.wait(remaining)
+                    continue
+
+            if self._usable(conn):
+                with self._cond:
+                    self._stats.reused += 1
+                return conn
+
+        # Hueco reservado: se abre la conexión fuera del lock
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def _usable(self, conn: _PooledConnection) -> bool:
+        """Comprueba una conexión libre; si no sirve la cierra y libera su hueco."""
+        idle_for = time.monotonic() - conn.last_used
+        if idle_for >= self.idle_timeout:
+            self._drop(conn, "idle_closed")
+            return False
+        if idle_for < self.check_after:
+            return True
+        try:
+            code, _ = conn.smtp.noop()
+            if code == 250:
+                return True
+        except (smtplib.SMTPException, OSError):
+            pass
+        logger.debug("[SmtpPool] NOOP fallido, se abre otra conexión")
+        self._drop(conn, "health_failures")
+        return False
+
+    def _connect(self) -> _PooledConnection:
+        started = time.perf_counter()
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+        except BaseException:
+            smtp.close()
+            raise
+        now = time.monotonic()
+        with self._cond:
+            self._stats.created += 1
+        self._ensure_reaper()
+        logger.debug("[SmtpPool] Conexión nueva a %s:%s en %.3fs", self.host, self.port, time.perf_counter() - started)
+        return _PooledConnection(smtp, now, now)
+
+    def _release(self, conn: _PooledConnection) -> None:
+        conn.last_used = time.monotonic()
+        with self._cond:
+            if not self._closed:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+            self._open -= 1
+        self._quit(conn)
+
+    def _reset_and_release(self, conn: _PooledConnection) -> None:
+        # Un envío a medias deja la transacción abierta: RSET antes de reutilizarla
+        try:
+            conn.smtp.rset()
+        except (smtplib.SMTPException, OSError):
+            self._discard(conn)
+            return
+        self._release(conn)
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        self._drop(conn, "discarded")
+
+    def _drop(self, conn: _PooledConnection, reason: str) -> None:
+        with self._cond:
+            self._open -= 1
+            setattr(self._stats, reason, getattr(self._stats, reason) + 1)
+            self._cond.notify()
+        self._quit(conn)
+
+    @staticmethod
+    def _quit(conn: _PooledConnection) -> None:
+        try:
+            conn.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.smtp.close()
+
+    def _ensure_reaper(self) -> None:
+        with self._cond:
+            if self._reaper is not None or self.idle_timeout <= 0:
+                return
+            self._reaper = threading.Thread(target=self._reap, name="smtp-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        """Cierra periódicamente las conexiones libres que superan `idle_timeout`."""
+        interval = max(0.5, self.idle_timeout / 2)
+        while True:
+            time.sleep(interval)
+            now = time.monotonic()
+            with self._cond:
+                if self._closed:
+                    return
+                expired = [c for c in self._idle if now - c.last_used >= self.idle_timeout]
+                for conn in expired:
+                    self._idle.remove(conn)
+                self._open -= len(expired)
+                self._stats.idle_closed += len(expired)
+                if expired:
+                    self._cond.notify_all()
+            for conn in expired:
+                logger.debug("[SmtpPool] Conexión cerrada por inactividad")
+                self._quit(conn)
+
+
+_shared_pool: Optional[SmtpConnectionPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool() -> SmtpConnectionPool:
+    """
+    Devuelve el pool SMTP compartido por todo el proceso (se crea la primera vez).
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = SmtpConnectionPool()
+            logger.info("Pool SMTP compartido inicializado.")
+        return _shared_pool
@@ -2,17 +2,13 @@
 import smtplib
 import logging
 from email.message import EmailMessage
+from typing import Optional
 
-from config.settings import (
-    SMTP_SERVER,
-    SMTP_PORT,
-    SMTP_USERNAME,
-    SMTP_PASSWORD,
-    SMTP_FROM_EMAIL,
-)
+from config.settings import SMTP_FROM_EMAIL
 from infrastructure.agents.email.dtos.email_request_dto import EmailRequestDTO
 from infrastructure.agents.email.dtos.email_response_dto import EmailResponseDTO
 from application.enums.status_code import StatusCode   # ← enum real
+from infrastructure.agents.email.services.smtp_pool import SmtpConnectionPool, get_shared_pool
 
 # Configuración del logger
 logging.basicConfig(level=logging.DEBUG)
@@ -20,35 +16,14 @@ logger = logging.getLogger(__name__)
 
 
 class SmtpService:
-    def __init__(self):
-        self.smtp_server = SMTP_SERVER
-        self.smtp_port = SMTP_PORT
-        self.smtp_user = SMTP_USERNAME
-        self.smtp_password = SMTP_PASSWORD
+    def __init__(self, pool: Optional[SmtpConnectionPool] = None):
+        # Las conexiones (STARTTLS + login) se reutilizan entre correos a través del pool
+        self.pool = pool or get_shared_pool()
         self.smtp_from_email = SMTP_FROM_EMAIL
 
     def send_email(self, request: EmailRequestDTO) -> EmailResponseDTO:
-        logger.debug("[SmtpService] Preparando correo...")
-        logger.debug(f"[SmtpService] Destinatario: {request.to}")
-        logger.debug(f"[SmtpService] Asunto: {request.subject}")
-        logger.debug(f"[SmtpService] Cuerpo: {request.body}")
-
-        msg = EmailMessage()
-        msg.set_content(request.body)
-        msg["Subject"] = request.subject
-        msg["From"] = self.smtp_from_email
-        msg["To"] = request.to
-
         try:
-            logger.debug(
-                f"[SmtpService] Conectando a {self.smtp_server}:{self.smtp_port}"
-            )
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                logger.debug("[SmtpService] Iniciando sesión SMTP...")
-                server.login(self.smtp_user, self.smtp_password)
-                logger.debug("[SmtpService] Enviando correo...")
-                server.send_message(msg)
+            self.deliver(request)
 
             logger.info("[SmtpService] Correo enviado a %s", request.to)
             return EmailResponseDTO(
@@ -63,3 +38,34 @@ class SmtpService:
                 message=f"Fallo al enviar correo: {str(e)}",
                 delivered_to=request.to,
             )
+
+    def deliver(self, request: EmailRequestDTO) -> None:
+        """
+        Envía el correo y propaga cualquier error (lo usan los workers de la
+        bandeja de salida para decidir si reintentan).
+
+        Raises:
+            smtplib.SMTPException / OSError: Si la entrega falla.
+        """
+        logger.debug("[SmtpService] Preparando correo...")
+        logger.debug(f"[SmtpService] Destinatario: {request.to}")
+        logger.debug(f"[SmtpService] Asunto: {request.subject}")
+        logger.debug(f"[SmtpService] Cuerpo: {request.body}")
+
+        msg = EmailMessage()
+        msg.set_content(request.body)
+        msg["Subject"] = request.subject
+        msg["From"] = self.smtp_from_email
+        msg["To"] = request.to
+        self._send(msg)
+
+    def _send(self, msg: EmailMessage) -> None:
+        try:
+            with self.pool.connection() as server:
+                logger.debug("[SmtpService] Enviando correo...")
+                server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # El servidor cerró una conexión reutilizada: un reintento con otra nueva
+            logger.debug("[SmtpService] Conexión cerrada por el servidor, reintentando...")
+            with self.pool.connection() as server:
+                server.send_message(msg)
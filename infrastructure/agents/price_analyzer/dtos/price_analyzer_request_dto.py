@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from infrastructure.agents.webscraper.dtos.product_batch import ProductBatch
+
+@dataclass
+class PriceAnalyzerRequestDTO:
+    """
+    DTO con los productos a analizar.
+
+    Attributes:
+        products (ProductBatch): Productos scrapeados (precio en texto, tienda opcional).
+        outlier_factor (float): Multiplicador del rango intercuartílico para marcar outliers.
+        decimal (str): Separador decimal en casos ambiguos: ",", "." o "auto".
+        max_items (int): Máximo de outliers y comparaciones por SKU que se devuelven.
+    """
+    products: ProductBatch
+    outlier_factor: float
+    decimal: str
+    max_items: int
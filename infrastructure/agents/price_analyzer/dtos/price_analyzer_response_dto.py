@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+from application.enums.status_code import StatusCode
+
+@dataclass
+class PriceSummary:
+    count: int                      # productos recibidos
+    parsed: int                     # con precio interpretable
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    q1: Optional[float] = None
+    q3: Optional[float] = None
+    std: Optional[float] = None
+
+@dataclass
+class ShopPriceSummary:
+    shop: str
+    count: int
+    parsed: int
+    outliers: int = 0
+    cheapest_count: int = 0         # SKU compartidos en los que es la tienda más barata
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    median: Optional[float] = None
+
+@dataclass
+class PriceOutlier:
+    sku: str
+    description: str
+    shop: str
+    price: float
+
+@dataclass
+class SkuComparison:
+    sku: str
+    description: str
+    cheapest_shop: str
+    cheapest_price: float
+    dearest_shop: str
+    dearest_price: float
+    spread: float
+    shops: int
+
+@dataclass
+class PriceAnalyzerResponseDTO:
+    """
+    Resultado del análisis de precios.
+
+    Attributes:
+        summary (PriceSummary): Estadísticas globales.
+        shops (List[ShopPriceSummary]): Estadísticas por tienda.
+        outliers (List[PriceOutlier]): Precios atípicos (como mucho `max_items`).
+        outlier_count (int): Total de precios atípicos.
+        comparisons (List[SkuComparison]): SKU con mayor diferencia de precio entre tiendas.
+        shared_skus (int): Total de SKU presentes en más de una tienda.
+        unparsed (List[str]): Ejemplos de precios que no se pudieron interpretar.
+    """
+    status: StatusCode
+    message: str = "OK"
+    summary: Optional[PriceSummary] = None
+    shops: List[ShopPriceSummary] = field(default_factory=list)
+    outliers: List[PriceOutlier] = field(default_factory=list)
+    outlier_count: int = 0
+    comparisons: List[SkuComparison] = field(default_factory=list)
+    shared_skus: int = 0
+    unparsed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        result = asdict(self)
+        result["status"] = self.status.name if isinstance(self.status, StatusCode) else self.status
+        return result
@@ -0,0 +1,89 @@
+# infrastructure/agents/price_analyzer/mappers/price_analyzer_mapper.py
+import json
+from typing import Any
+
+from application.dtos.agent_app_request import AgentAppRequest
+from application.dtos.agent_app_response import AgentAppResponse
+from buffer.shared_buffer import get_last_json
+from config.settings import (
+    PRICE_ANALYZER_OUTLIER_FACTOR,
+    PRICE_ANALYZER_DECIMAL,
+    PRICE_ANALYZER_MAX_ITEMS,
+)
+from infrastructure.agents.price_analyzer.dtos.price_analyzer_request_dto import PriceAnalyzerRequestDTO
+from infrastructure.agents.price_analyzer.dtos.price_analyzer_response_dto import PriceAnalyzerResponseDTO
+from infrastructure.agents.webscraper.dtos.product_batch import ProductBatch
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+
+
+class PriceAnalyzerMapper:
+    @staticmethod
+    def map_request(request: AgentAppRequest) -> PriceAnalyzerRequestDTO:
+        """
+        Acepta cualquiera de los siguientes formatos en request.content
+        ───────────────────────────────────────────────────────────────
+        1) {"products": [{"price": "...", "sku": "...", ...}], "outlier_factor": 1.5}
+        2) {"kwargs": {"products": [...]}}
+        3) "products" como string JSON (tal y como lo suelen enviar los LLM)
+        4) Sin "products": se analizan los del último resultado de web_scrape
+        """
+        data = request.content
+        if isinstance(data, str):
+            try:
+                data = json.loads(data) if data.strip() else {}
+            except Exception:
+                raise ValueError("Error decodificando los argumentos: string inválido")
+        if isinstance(data, list):
+            data = {"products": data}
+        if isinstance(data, dict) and isinstance(data.get("kwargs"), dict):
+            data = data["kwargs"]
+        if not isinstance(data, dict):
+            raise ValueError("Formato de argumentos no soportado para price_analyze")
+
+        raw = data.get("products")
+        if isinstance(raw, str):
+            try:
+                raw = json.loads(raw)
+            except Exception:
+                raise ValueError("'products' no es un JSON válido")
+        if raw is None or len(raw) == 0:
+            last = get_last_json()
+            raw = last.get("products") if isinstance(last, dict) else None
+        if raw is None or len(raw) == 0:
+            raise ValueError("No hay productos que analizar (ni en la llamada ni en el último scraping)")
+
+        return PriceAnalyzerRequestDTO(
+            products=PriceAnalyzerMapper._products(raw),
+            outlier_factor=float(data.get("outlier_factor") or PRICE_ANALYZER_OUTLIER_FACTOR),
+            decimal=data.get("decimal") or PRICE_ANALYZER_DECIMAL,
+            max_items=int(data.get("max_items") or PRICE_ANALYZER_MAX_ITEMS),
+        )
+
+    @staticmethod
+    def _products(raw: Any) -> ProductBatch:
+        # El lote del último scraping se analiza tal cual, sin copiarlo
+        if isinstance(raw, ProductBatch):
+            return raw
+        products = ProductBatch()
+        for item in raw:
+            if isinstance(item, ProductResult):
+                products.append(item)
+            elif isinstance(item, dict):
+                products.append(ProductResult(
+                    description=str(item.get("description", "")),
+                    price=str(item.get("price", "")),
+                    sku=str(item.get("sku", "")),
+                    shop=str(item.get("shop", "")),
+                ))
+            else:
+                # Un precio suelto ("12,95 €")
+                products.append(ProductResult(description="", price=str(item), sku=""))
+        return products
+
+    @staticmethod
+    def map_response(dto: PriceAnalyzerResponseDTO) -> AgentAppResponse:
+        return AgentAppResponse(
+            content=dto.to_dict(),
+            status=dto.status,
+            message=dto.message,
+        )
@@ -0,0 +1,153 @@
+# infrastructure/agents/price_analyzer/price_analyzer_agent.py
+import logging
+
+import numpy as np
+
+from application.enums.status_code import StatusCode
+from application.interfaces.agent_interface import AgentInterface
+from application.dtos.agent_app_request import AgentAppRequest
+from application.dtos.agent_app_response import AgentAppResponse
+
+from buffer.shared_buffer import get_last_json, set_last_json
+from infrastructure.agents.price_analyzer.dtos.price_analyzer_request_dto import PriceAnalyzerRequestDTO
+from infrastructure.agents.price_analyzer.dtos.price_analyzer_response_dto import (
+    PriceAnalyzerResponseDTO,
+    PriceOutlier,
+)
+from infrastructure.agents.price_analyzer.mappers.price_analyzer_mapper import PriceAnalyzerMapper
+from infrastructure.agents.price_analyzer.services.price_parser import parse_prices
+from infrastructure.agents.price_analyzer.services.price_statistics import (
+    compare_skus,
+    outlier_mask,
+    per_shop,
+    summarize,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ejemplos de precios no interpretables que se devuelven para diagnóstico
+MAX_UNPARSED_SAMPLES = 5
+
+
+class PriceAnalyzerAgent(AgentInterface):
+    """
+    Analiza los precios de una lista de productos scrapeados sin pasar por el LLM:
+    los convierte a números en bloque y calcula estadísticas, outliers y
+    comparaciones entre tiendas con operaciones vectorizadas de NumPy.
+    """
+
+    @classmethod
+    def get_function_name(cls) -> str:
+        return "price_analyze"
+
+    @classmethod
+    def get_function_description(cls) -> str:
+        return (
+            "Analiza los precios de los productos scrapeados: mínimo, máximo, mediana, "
+            "outliers y comparación entre tiendas. Sin 'products' usa el último resultado de web_scrape."
+        )
+
+    @classmethod
+    def get_function_list(cls) -> list:
+        return [
+            {
+                "name": cls.get_function_name(),
+                "description": cls.get_function_description(),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "products": {
+                            "type": "array",
+                            "description": "Productos a analizar (opcional; por defecto, los del último web_scrape)",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "description": {"type": "string"},
+                                    "price": {"type": "string"},
+                                    "sku": {"type": "string"},
+                                    "shop": {"type": "string"}
+                                },
+                                "required": ["price"]
+                            }
+                        },
+                        "outlier_factor": {
+                            "type": "number",
+                            "description": "Multiplicador del rango intercuartílico para detectar outliers (opcional, 1.5)"
+                        },
+                        "decimal": {
+                            "type": "string",
+                            "enum": ["auto", ",", "."],
+                            "description": "Separador decimal en precios ambiguos como '1.234' (opcional)"
+                        }
+                    },
+                    "required": [],
+                },
+            }
+        ]
+
+    def run(self, request: AgentAppRequest) -> AgentAppResponse:
+        print("[PriceAnalyzerAgent] → Analizando precios...")
+        try:
+            req = PriceAnalyzerMapper.map_request(request)
+            dto = self._analyze(req)
+            print(
+                f"[PriceAnalyzerAgent] {dto.summary.parsed}/{dto.summary.count} precios | "
+                f"mediana {dto.summary.median} | {dto.outlier_count} outliers | "
+                f"{dto.shared_skus} SKU en varias tiendas"
+            )
+
+            # El resultado del scraping se conserva y se le añade el análisis
+            last = get_last_json()
+            if isinstance(last, dict):
+                set_last_json({**last, "price_analysis": dto.to_dict()})
+
+            return PriceAnalyzerMapper.map_response(dto)
+
+        except Exception as exc:
+            print(f"[PriceAnalyzerAgent] Error: {exc}")
+            return PriceAnalyzerMapper.map_response(
+                PriceAnalyzerResponseDTO(status=StatusCode.ERROR, message=str(exc))
+            )
+
+    @staticmethod
+    def _analyze(req: PriceAnalyzerRequestDTO) -> PriceAnalyzerResponseDTO:
+        products = req.products
+        prices = parse_prices(products.prices, decimal=req.decimal)
+        shops = np.asarray(products.shops, dtype=str)
+        skus = np.asarray(products.skus, dtype=str)
+
+        outliers = outlier_mask(prices, req.outlier_factor)
+        shop_summaries = per_shop(prices, shops, outliers)
+        comparisons, shared_skus, wins = compare_skus(
+            prices, shops, skus, products.descriptions, req.max_items
+        )
+        for summary in shop_summaries:
+            summary.cheapest_count = wins.get(summary.shop, 0)
+
+        # Outliers más alejados de la mediana primero
+        outlier_index = np.flatnonzero(outliers)
+        median = np.nanmedian(prices) if outlier_index.size else 0.0
+        outlier_index = outlier_index[np.argsort(-np.abs(prices[outlier_index] - median), kind="stable")]
+
+        unparsed = np.flatnonzero(np.isnan(prices))[:MAX_UNPARSED_SAMPLES]
+        logger.debug("[PriceAnalyzerAgent] %d productos, %d sin precio válido", len(products), int(np.isnan(prices).sum()))
+
+        return PriceAnalyzerResponseDTO(
+            status=StatusCode.SUCCESS,
+            message="OK",
+            summary=summarize(prices),
+            shops=shop_summaries,
+            outliers=[
+                PriceOutlier(
+                    sku=products.skus[i],
+                    description=products.descriptions[i],
+                    shop=products.shops[i],
+                    price=round(float(prices[i]), 2),
+                )
+                for i in outlier_index[:req.max_items]
+            ],
+            outlier_count=int(outlier_index.size),
+            comparisons=comparisons,
+            shared_skus=shared_skus,
+            unparsed=[products.prices[i] for i in unparsed],
+        )
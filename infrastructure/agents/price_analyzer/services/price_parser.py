@@ -0,0 +1,139 @@
+# infrastructure/agents/price_analyzer/services/price_parser.py
+"""
+Conversión vectorizada de precios en texto ("12,95 €", "$1,299.00", "1.234,50 EUR")
+a números.
+
+✔  Todas las operaciones se hacen sobre el array completo (numpy.char), sin bucles Python.
+✔  Símbolos de moneda, espacios (también NBSP) y códigos ISO se descartan.
+✔  Separador decimal por fila: el último de los dos que aparezca ("1.234,50" / "1,234.50").
+✔  Casos ambiguos ("1.234" o "1,234") se resuelven con el formato mayoritario del lote;
+   si ninguna fila tiene decimales son separadores de miles, y si hay empate, NaN.
+✔  En rangos ("10,00 € – 20,00 €") se toma el precio mínimo (el primero).
+✔  Con varios importes se toma el último junto a una moneda: en ofertas
+   ("Antes 20,00 € Ahora 15,00 €", el <del>/<ins> de WooCommerce con su texto
+   para lectores de pantalla) es el precio vigente, y en "3 unidades por 12,95 €"
+   el número suelto no es un precio. Sin moneda cuenta el primer número.
+✔  El texto que rodea al importe ("IVA incl.", "desde") no aporta dígitos ni separadores.
+✔  Lo que no es un precio queda como NaN.
+"""
+
+import re
+from typing import Sequence
+
+import numpy as np
+
+# Separadores de rango de precios habituales en WooCommerce y otras plantillas
+_RANGE_SEPARATORS = ("–", "—", " - ", " a ")
+# Un importe: separadores y espacios (también NBSP) sólo si les sigue un dígito
+_AMOUNT = r"-?\d(?:\d|[.,\t \xa0](?=\d))*"
+_CURRENCY = r"(?:[€$£¥]|EUR|USD|GBP)"
+# Un importe no empieza a media cifra ("1 234", "-5"): el prefijo voraz no puede partirlo
+_START = r"(?<![\d.,\-])(?<!\d[\t \xa0])"
+# Último importe pegado a una moneda ("15,00 €", "$1,299.00"); el prefijo voraz busca el último
+_CURRENCY_AMOUNT_RE = re.compile(
+    rf"^[^\n]*(?:{_CURRENCY}[\t \xa0]*{_START}({_AMOUNT})|{_START}({_AMOUNT})[\t \xa0]*{_CURRENCY})[^\n]*$",
+    re.MULTILINE,
+)
+# Primer número de la fila (filas sin moneda, o ya reducidas a su importe)
+_NUMBER_RE = re.compile(rf"^[^\d\n]*?({_AMOUNT})[^\n]*$", re.MULTILINE)
+# Todo lo que no sea dígito, separador o signo (€, $, EUR, espacios...)
+_NOISE_RE = re.compile(r"[^\d,.\-\n]+")
+
+DECIMAL_AUTO = "auto"
+DECIMAL_COMMA = ","
+DECIMAL_DOT = "."
+
+
+def parse_prices(prices: Sequence[str], decimal: str = DECIMAL_AUTO) -> np.ndarray:
+    """
+    Args:
+        prices (Sequence[str]): Precios tal y como los devuelve el scraper.
+        decimal (str): "," o "." para forzar el separador decimal en los casos
+            ambiguos; "auto" lo deduce de las filas no ambiguas del lote.
+
+    Returns:
+        np.ndarray: float64 con un valor por precio (NaN si no se pudo interpretar).
+
+    >>> parse_prices(["12,95€ IVA incl.", "Antes 20,00 € Ahora 15,00 €", "1.234,50 EUR", "consultar"]).tolist()
+    [12.95, 15.0, 1234.5, nan]
+    >>> parse_prices(["14,95 € El precio original era: 14,95 €. 12,50 € El precio actual es: 12,50 €.",
+    ...               "3 unidades por 12,95 €"]).tolist()
+    [12.5, 12.95]
+    >>> parse_prices(["$1,000", "$2,500", "$3,000"]).tolist()
+    [1000.0, 2500.0, 3000.0]
+    """
+    if len(prices) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    text = np.asarray([p if isinstance(p, str) else "" for p in prices], dtype=str)
+    text = np.char.replace(text, "\n", " ")
+    for separator in _RANGE_SEPARATORS:
+        text = np.char.partition(text, separator)[:, 0]
+
+    # Pasadas de regex sobre el lote entero (las filas se separan con "\n"): el último
+    # importe con moneda, si lo hay; si no, el primer número; y fuera los espacios internos
+    rows = _CURRENCY_AMOUNT_RE.sub(r"\1\2", "\n".join(text.tolist()))
+    numbers = _NUMBER_RE.sub(r"\1", rows)
+    cleaned = np.asarray(_NOISE_RE.sub("", numbers).split("\n"), dtype=str)
+
+    last_comma = np.char.rfind(cleaned, ",")
+    last_dot = np.char.rfind(cleaned, ".")
+    length = np.char.str_len(cleaned)
+    has_comma = last_comma >= 0
+    has_dot = last_dot >= 0
+
+    # Un único separador seguido de exactamente 3 dígitos: puede ser de miles o decimal
+    single_comma = has_comma & ~has_dot & (np.char.count(cleaned, ",") == 1)
+    single_dot = has_dot & ~has_comma & (np.char.count(cleaned, ".") == 1)
+    ambiguous = (single_comma & (length - last_comma == 4)) | (single_dot & (length - last_dot == 4))
+
+    comma_decimal = np.where(
+        has_comma & has_dot,
+        last_comma > last_dot,
+        has_comma & (np.char.count(cleaned, ",") == 1),
+    )
+
+    # Varios puntos y ninguna coma ("1.234.567"): sólo pueden ser separadores de miles
+    thousands = has_dot & ~has_comma & (np.char.count(cleaned, ".") > 1)
+
+    undecided = np.zeros_like(ambiguous)
+    if ambiguous.any():
+        if decimal == DECIMAL_AUTO:
+            # Formato mayoritario entre las filas con 1 o 2 decimales tras el último separador
+            tail = length - np.maximum(last_comma, last_dot) - 1
+            clear = (has_comma | has_dot) & (tail >= 1) & (tail <= 2)
+            comma_votes = int(np.count_nonzero(comma_decimal & clear))
+            dot_votes = int(np.count_nonzero(~comma_decimal & clear))
+            if comma_votes == dot_votes == 0:
+                # Ningún precio con decimales: catálogo en unidades, ",ddd" / ".ddd" son miles
+                decimal = None
+            elif comma_votes == dot_votes:
+                # Empate: no se adivina
+                undecided = ambiguous
+            else:
+                decimal = DECIMAL_COMMA if comma_votes > dot_votes else DECIMAL_DOT
+        if decimal is None:
+            comma_decimal = np.where(ambiguous, False, comma_decimal)
+            thousands |= ambiguous
+        else:
+            # "1.234" con coma decimal son miles; "1,234" con punto decimal, también
+            comma_decimal = np.where(ambiguous, single_comma & (decimal == DECIMAL_COMMA), comma_decimal)
+            thousands |= ambiguous & (single_dot == (decimal == DECIMAL_COMMA))
+
+    normalised = np.where(
+        comma_decimal,
+        np.char.replace(np.char.replace(cleaned, ".", ""), ",", "."),
+        np.char.replace(cleaned, ",", ""),
+    )
+    normalised = np.where(thousands, np.char.replace(normalised, ".", ""), normalised)
+
+    # Válido: como mucho un "-" al principio y un "." decimal, y al menos un dígito
+    minus = np.char.count(normalised, "-")
+    digits = np.char.replace(np.char.lstrip(normalised, "-"), ".", "", 1)
+    valid = (
+        ~undecided
+        & np.char.isdigit(digits)
+        & (np.char.count(normalised, ".") <= 1)
+        & ((minus == 0) | ((minus == 1) & np.char.startswith(normalised, "-")))
+    )
+    return np.where(valid, normalised, "nan").astype(np.float64)
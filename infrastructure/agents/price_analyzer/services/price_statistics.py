@@ -0,0 +1,146 @@
+# infrastructure/agents/price_analyzer/services/price_statistics.py
+"""
+Estadísticas de precios sobre arrays NumPy.
+
+✔  Resumen global: mínimo, máximo, media, mediana, cuartiles y desviación.
+✔  Outliers por rango intercuartílico (Tukey): fuera de [Q1 - k·IQR, Q3 + k·IQR].
+✔  Resumen por tienda con reducciones agrupadas (ordenación + reduceat).
+✔  Comparación entre tiendas de los SKU que venden varias: más barata, más cara y diferencia.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from infrastructure.agents.price_analyzer.dtos.price_analyzer_response_dto import (
+    PriceSummary,
+    ShopPriceSummary,
+    SkuComparison,
+)
+
+
+def summarize(prices: np.ndarray) -> PriceSummary:
+    """Resumen de los precios válidos (los NaN se cuentan como no interpretables)."""
+    valid = prices[~np.isnan(prices)]
+    if valid.size == 0:
+        return PriceSummary(count=int(prices.size), parsed=0)
+    q1, median, q3 = np.percentile(valid, [25, 50, 75])
+    return PriceSummary(
+        count=int(prices.size),
+        parsed=int(valid.size),
+        min=_round(valid.min()),
+        max=_round(valid.max()),
+        mean=_round(valid.mean()),
+        median=_round(median),
+        q1=_round(q1),
+        q3=_round(q3),
+        std=_round(valid.std()),
+    )
+
+
+def outlier_mask(prices: np.ndarray, factor: float) -> np.ndarray:
+    """True en los precios fuera de las vallas de Tukey; NaN nunca es outlier."""
+    valid = ~np.isnan(prices)
+    if np.count_nonzero(valid) < 4:
+        return np.zeros(prices.shape, dtype=bool)
+    q1, q3 = np.percentile(prices[valid], [25, 75])
+    iqr = q3 - q1
+    with np.errstate(invalid="ignore"):
+        return valid & ((prices < q1 - factor * iqr) | (prices > q3 + factor * iqr))
+
+
+def per_shop(prices: np.ndarray, shops: np.ndarray, outliers: np.ndarray) -> List[ShopPriceSummary]:
+    """Resumen por tienda, en el orden en que aparece cada tienda por primera vez."""
+    valid = ~np.isnan(prices)
+    names, first, inverse = np.unique(shops, return_index=True, return_inverse=True)
+    totals = np.bincount(inverse, minlength=names.size)
+    outlier_counts = np.bincount(inverse, weights=outliers, minlength=names.size).astype(int)
+
+    # Precios válidos ordenados por (tienda, precio): cada tienda queda en un tramo contiguo
+    group, values = inverse[valid], prices[valid]
+    order = np.lexsort((values, group))
+    group, values = group[order], values[order]
+    parsed = np.bincount(group, minlength=names.size)
+    starts = np.concatenate(([0], np.cumsum(parsed)[:-1]))
+    present = parsed > 0
+
+    sums = np.zeros(names.size)
+    if values.size:
+        sums[present] = np.add.reduceat(values, starts[present])
+
+    summaries = []
+    for i in np.argsort(first):
+        summary = ShopPriceSummary(
+            shop=str(names[i]),
+            count=int(totals[i]),
+            parsed=int(parsed[i]),
+            outliers=int(outlier_counts[i]),
+        )
+        if present[i]:
+            segment = values[starts[i]:starts[i] + parsed[i]]
+            summary.min = _round(segment[0])
+            summary.max = _round(segment[-1])
+            summary.mean = _round(sums[i] / parsed[i])
+            summary.median = _round(np.median(segment))
+        summaries.append(summary)
+    return summaries
+
+
+def compare_skus(
+    prices: np.ndarray,
+    shops: np.ndarray,
+    skus: np.ndarray,
+    descriptions: Sequence[str],
+    limit: int,
+) -> Tuple[List[SkuComparison], int, Dict[str, int]]:
+    """
+    Compara los SKU que venden al menos dos tiendas distintas.
+
+    Returns:
+        (las `limit` comparaciones con mayor diferencia de precio,
+         nº total de SKU compartidos,
+         nº de SKU compartidos en los que cada tienda es estrictamente la más barata)
+    """
+    valid = ~np.isnan(prices) & (skus != "")
+    if not valid.any():
+        return [], 0, {}
+
+    index = np.flatnonzero(valid)
+    shop_index = np.unique(shops, return_inverse=True)[1]
+
+    # Por (SKU, precio): el primero y el último de cada tramo son la más barata y la más cara
+    by_price = index[np.lexsort((prices[index], skus[index]))]
+    _, starts, counts = np.unique(skus[by_price], return_index=True, return_counts=True)
+
+    # Por (SKU, tienda): tiendas distintas = cambios de tienda dentro de cada tramo
+    by_shop = index[np.lexsort((shop_index[index], skus[index]))]
+    sku_sorted, shop_sorted = skus[by_shop], shop_index[by_shop]
+    new_shop = np.concatenate(([True], (sku_sorted[1:] != sku_sorted[:-1]) | (shop_sorted[1:] != shop_sorted[:-1])))
+    distinct_shops = np.add.reduceat(new_shop.astype(int), starts)
+
+    shared = distinct_shops >= 2
+    cheapest = by_price[starts[shared]]
+    dearest = by_price[(starts + counts - 1)[shared]]
+    spread = prices[dearest] - prices[cheapest]
+
+    # Con el mismo precio en todas las tiendas no hay ninguna más barata
+    names, wins = np.unique(shops[cheapest[spread > 0]], return_counts=True)
+    top = np.argsort(-spread, kind="stable")[:max(0, limit)]
+    comparisons = [
+        SkuComparison(
+            sku=str(skus[cheapest[i]]),
+            description=descriptions[cheapest[i]],
+            cheapest_shop=str(shops[cheapest[i]]),
+            cheapest_price=_round(prices[cheapest[i]]),
+            dearest_shop=str(shops[dearest[i]]),
+            dearest_price=_round(prices[dearest[i]]),
+            spread=_round(spread[i]),
+            shops=int(distinct_shops[shared][i]),
+        )
+        for i in top
+    ]
+    return comparisons, int(cheapest.size), {str(n): int(w) for n, w in zip(names, wins)}
+
+
+def _round(value: float) -> float:
+    return round(float(value), 2)
@@ -0,0 +1,119 @@
+# infrastructure/agents/webscraper/dtos/product_batch.py
+"""
+Lote columnar de productos: una lista por campo en lugar de un objeto por producto.
+
+✔  Una sola copia de los datos en memoria: los ProductResult del crawler se
+   vuelcan a las columnas según llegan y se descartan.
+✔  Serialización directa a JSON / NDJSON desde las columnas, sin dicts intermedios.
+✔  Acceso por columnas (p.ej. `prices`) para el análisis vectorizado.
+"""
+
+from json.encoder import encode_basestring
+from typing import IO, Iterable, Iterator, List
+
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+
+# Mismo orden de campos que ProductResult
+_RECORD = '{"description":%s,"price":%s,"sku":%s,"shop":%s}'
+
+
+class ProductBatch:
+    """
+    Productos scrapeados en columnas paralelas.
+
+    Attributes:
+        descriptions (List[str]): Descripción de cada producto.
+        prices (List[str]): Precio tal y como aparece en la tienda.
+        skus (List[str]): SKU de cada producto.
+        shops (List[str]): URL de la tienda de cada producto.
+    """
+
+    __slots__ = ("descriptions", "prices", "skus", "shops")
+
+    def __init__(self):
+        self.descriptions: List[str] = []
+        self.prices: List[str] = []
+        self.skus: List[str] = []
+        self.shops: List[str] = []
+
+    # ─────── CONSTRUCCIÓN ───────
+    @classmethod
+    def collect(cls, products: Iterable[ProductResult]) -> "ProductBatch":
+        """Vuelca un iterable de productos (p.ej. el generador del crawler) a columnas."""
+        batch = cls()
+        batch.extend(products)
+        return batch
+
+    @classmethod
+    def concat(cls, batches: Iterable["ProductBatch"]) -> "ProductBatch":
+        result = cls()
+        for batch in batches:
+            result.descriptions += batch.descriptions
+            result.prices += batch.prices
+            result.skus += batch.skus
+            result.shops += batch.shops
+        return result
+
+    def append(self, product: ProductResult) -> None:
+        self.descriptions.append(product.description)
+        self.prices.append(product.price)
+        self.skus.append(product.sku)
+        self.shops.append(product.shop)
+
+    def extend(self, products: Iterable[ProductResult]) -> None:
+        for product in products:
+            self.append(product)
+
+    # ─────── ACCESO ───────
+    def __len__(self) -> int:
+        return len(self.skus)
+
+    def __getitem__(self, i: int) -> ProductResult:
+        return ProductResult(
+            description=self.descriptions[i],
+            price=self.prices[i],
+            sku=self.skus[i],
+            shop=self.shops[i],
+        )
+
+    def __iter__(self) -> Iterator[ProductResult]:
+        """Vistas ProductResult creadas al vuelo (no se guardan)."""
+        for description, price, sku, shop in zip(self.descriptions, self.prices, self.skus, self.shops):
+            yield ProductResult(description=description, price=price, sku=sku, shop=shop)
+
+    def __repr__(self) -> str:
+        return f"ProductBatch({len(self)} productos)"
+
+    # ─────── SERIALIZACIÓN ───────
+    def _encoded_records(self) -> Iterator[str]:
+        # encode_basestring (en C) escapa cada columna de una vez y conserva los no ASCII
+        return map(
+            _RECORD.__mod__,
+            zip(
+                map(encode_basestring, self.descriptions),
+                map(encode_basestring, self.prices),
+                map(encode_basestring, self.skus),
+                map(encode_basestring, self.shops),
+            ),
+        )
+
+    def to_json(self) -> str:
+        """Array JSON de objetos {"description", "price", "sku", "shop"}."""
+        return "[" + ",".join(self._encoded_records()) + "]"
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """Una línea JSON por producto (con salto de línea final)."""
+        for record in self._encoded_records():
+            yield record + "\n"
+
+    def write_ndjson(self, fp: IO[str]) -> int:
+        """Escribe el lote como NDJSON en `fp` y devuelve el número de productos."""
+        fp.writelines(self.iter_ndjson())
+        return len(self)
+
+    def to_records(self) -> List[dict]:
+        """Lista de dicts, sólo para consumidores que no admiten el lote (p.ej. jsonify)."""
+        return [
+            {"description": d, "price": p, "sku": s, "shop": sh}
+            for d, p, s, sh in zip(self.descriptions, self.prices, self.skus, self.shops)
+        ]
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field, asdict
+from typing import List
+
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+
+@dataclass
+class PriceChange:
+    sku: str
+    description: str
+    old_price: str
+    price: str
+
+@dataclass
+class ShopDiff:
+    """
+    Cambios de una tienda respecto a la última ejecución guardada.
+
+    Attributes:
+        url (str): URL de la tienda.
+        new (List[ProductResult]): Productos que no estaban en la instantánea anterior.
+        removed (List[ProductResult]): Productos que ya no aparecen.
+        repriced (List[PriceChange]): Productos cuyo precio ha cambiado.
+        unchanged (int): Productos sin cambios.
+        unchanged_pages (int): Páginas cuyo hash coincidía y no se han parseado.
+    """
+    url: str
+    new: List[ProductResult] = field(default_factory=list)
+    removed: List[ProductResult] = field(default_factory=list)
+    repriced: List[PriceChange] = field(default_factory=list)
+    unchanged: int = 0
+    unchanged_pages: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.new or self.removed or self.repriced)
+
+    def to_dict(self):
+        return asdict(self)
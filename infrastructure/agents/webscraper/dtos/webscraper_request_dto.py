@@ -1,14 +1,26 @@
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
+# Contenedor de producto por defecto (plantillas WooCommerce habituales)
+DEFAULT_CONTAINER_SELECTOR = ".meta-wrapper"
+# Enlace a la página siguiente del catálogo (paginación WooCommerce y <link rel="next">)
+DEFAULT_NEXT_PAGE_SELECTOR = "a.next.page-numbers, link[rel=next]"
+# Modos de scraping: catálogo completo o sólo cambios respecto a la última ejecución
+SCRAPE_MODE_FULL = "full"
+SCRAPE_MODE_DIFF = "diff"
+
 @dataclass
 class ShopRequestEntry:
     url: str
     selector_price: str
     selector_description: str
     selector_sku: Dict[str, str]  # Ejemplo: {"tag": "a", "attribute": "data-product_sku"}
+    selector_container: str = DEFAULT_CONTAINER_SELECTOR  # Elemento que agrupa SKU, precio y descripción
+    selector_next_page: str = DEFAULT_NEXT_PAGE_SELECTOR   # "" desactiva la paginación
 
 @dataclass
 class WebScraperRequestDTO:
     entries: List[ShopRequestEntry]
-    limit_results: bool = False  # ← Nuevo campo
\ No newline at end of file
+    limit_results: bool = False  # ← Nuevo campo
+    max_results: Optional[int] = None  # Presupuesto de productos por tienda (None = sin límite)
+    mode: str = SCRAPE_MODE_FULL  # "diff" devuelve sólo productos nuevos, retirados o con cambio de precio
\ No newline at end of file
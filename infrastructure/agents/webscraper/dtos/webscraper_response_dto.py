@@ -1,21 +1,34 @@
-from dataclasses import dataclass, asdict
+import json
+from dataclasses import dataclass, field
+from typing import Optional
 from application.enums.status_code import StatusCode
 
-@dataclass
+@dataclass(slots=True)
 class ProductResult:
     description: str
     price: str
     sku: str
+    shop: str = ""  # URL de la tienda de la que procede
 
 @dataclass
 class WebScraperResponseDTO:
-    products: list  # List[ProductResult]
+    products: "ProductBatch"
     status: StatusCode
     message: str
+    diff: Optional[list] = field(default=None)  # List[ShopDiff], sólo en modo "diff"
 
     def to_dict(self):
-        return {
-            "products": [asdict(p) for p in self.products],
+        # El lote se comparte tal cual (sin copiar los productos); se serializa al final con to_json
+        result = {
+            "products": self.products,
             "status": self.status.name if isinstance(self.status, StatusCode) else self.status,
             "message": self.message,
-        }
\ No newline at end of file
+        }
+        if self.diff is not None:
+            result["diff"] = [d.to_dict() for d in self.diff]
+        return result
+
+    def to_json(self) -> str:
+        """JSON completo de la respuesta, con los productos escritos directamente desde el lote."""
+        head = {k: v for k, v in self.to_dict().items() if k != "products"}
+        return '{"products":' + self.products.to_json() + "," + json.dumps(head, ensure_ascii=False)[1:]
\ No newline at end of file
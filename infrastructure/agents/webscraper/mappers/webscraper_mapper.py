@@ -1,14 +1,36 @@
-from infrastructure.agents.webscraper.dtos.webscraper_request_dto import WebScraperRequestDTO, ShopRequestEntry
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import (
+    WebScraperRequestDTO,
+    ShopRequestEntry,
+    DEFAULT_CONTAINER_SELECTOR,
+    DEFAULT_NEXT_PAGE_SELECTOR,
+    SCRAPE_MODE_FULL,
+)
 from infrastructure.agents.webscraper.dtos.webscraper_response_dto import WebScraperResponseDTO, ProductResult
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
+from config.settings import SCRAPER_MAX_RESULTS
 import json
 
 class WebScraperMapper:
+    @staticmethod
+    def _max_results(value, default):
+        """
+        Presupuesto de productos pedido por el LLM; `default` si falta o no es un
+        entero positivo ("10" vale, "diez", 0 o -1 no).
+        """
+        if value is None or isinstance(value, bool):
+            return default
+        try:
+            max_results = int(value)
+        except (TypeError, ValueError):
+            return default
+        return max_results if max_results > 0 else default
+
     @staticmethod
     def map_request(request: AgentAppRequest) -> WebScraperRequestDTO:
         data = request.content
         limit_results = True  # o ajusta a tu necesidad
+        max_results = SCRAPER_MAX_RESULTS if limit_results else None
 
         # Si los datos llegan como string JSON, decodifica primero
         if isinstance(data, str):
@@ -25,10 +47,17 @@ class WebScraperMapper:
                     url=shop["url"],
                     selector_price=shop["selector_price"],
                     selector_description=shop.get("selector_description", ""),
-                    selector_sku=shop.get("selector_sku", {})
+                    selector_sku=shop.get("selector_sku", {}),
+                    selector_container=shop.get("selector_container") or DEFAULT_CONTAINER_SELECTOR,
+                    selector_next_page=shop.get("selector_next_page", DEFAULT_NEXT_PAGE_SELECTOR)
                 ) for shop in shops
             ]
-            return WebScraperRequestDTO(entries=entries, limit_results=limit_results)
+            return WebScraperRequestDTO(
+                entries=entries,
+                limit_results=limit_results,
+                max_results=WebScraperMapper._max_results(data.get("max_results"), max_results),
+                mode=data.get("mode") or SCRAPE_MODE_FULL,
+            )
 
         # 2. Siguiente prioridad: 'kwargs' a nivel raíz
         if isinstance(data, dict) and "kwargs" in data and isinstance(data["kwargs"], dict):
@@ -41,19 +70,33 @@ class WebScraperMapper:
                         url=shop["url"],
                         selector_price=shop["selector_price"],
                         selector_description=shop.get("selector_description", ""),
-                        selector_sku=shop.get("selector_sku", {})
+                        selector_sku=shop.get("selector_sku", {}),
+                        selector_container=shop.get("selector_container") or DEFAULT_CONTAINER_SELECTOR,
+                        selector_next_page=shop.get("selector_next_page", DEFAULT_NEXT_PAGE_SELECTOR)
                     ) for shop in shops
                 ]
-                return WebScraperRequestDTO(entries=entries, limit_results=limit_results)
+                return WebScraperRequestDTO(
+                    entries=entries,
+                    limit_results=limit_results,
+                    max_results=WebScraperMapper._max_results(inner.get("max_results"), max_results),
+                    mode=inner.get("mode") or SCRAPE_MODE_FULL,
+                )
             # b) Si hay parámetros sueltos dentro de kwargs
             entries = [
                 ShopRequestEntry(
                     url=inner.get("url", ""),
                     selector_price=inner.get("selector_price", ""),
                     selector_description=inner.get("selector_description", ""),
-                    selector_sku=inner.get("selector_sku", {})
+                    selector_sku=inner.get("selector_sku", {}),
+                    selector_container=inner.get("selector_container") or DEFAULT_CONTAINER_SELECTOR,
+                    selector_next_page=inner.get("selector_next_page", DEFAULT_NEXT_PAGE_SELECTOR)
                 )
             ]
-            return WebScraperRequestDTO(entries=entries, limit_results=limit_results)
+            return WebScraperRequestDTO(
+                entries=entries,
+                limit_results=limit_results,
+                max_results=WebScraperMapper._max_results(inner.get("max_results"), max_results),
+                mode=inner.get("mode") or SCRAPE_MODE_FULL,
+            )
 
         # 3. Úl
@@ -0,0 +1,45 @@
+# infrastructure/agents/webscraper/parsers/html_parser_backend.py
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Union
+
+
+class HtmlParserBackend(ABC):
+    """
+    Contrato común de los motores de parseo HTML usados por el scraper.
+
+    Cada implementación decide cómo construir el árbol y cómo compilar los
+    selectores CSS; el extractor de productos sólo trabaja con nodos opacos
+    a través de estos métodos.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def parse(self, html: Union[str, bytes]) -> Any:
+        """Construye el documento a partir del HTML (texto o bytes sin decodificar)."""
+        pass
+
+    @abstractmethod
+    def compile(self, selector: str) -> Any:
+        """Compila un selector CSS para reutilizarlo en muchas búsquedas."""
+        pass
+
+    @abstractmethod
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        """Devuelve todos los descendientes de `node` que cumplen el selector."""
+        pass
+
+    @abstractmethod
+    def select_one(self, node: Any, compiled: Any) -> Optional[Any]:
+        """Devuelve el primer descendiente de `node` que cumple el selector, o None."""
+        pass
+
+    @abstractmethod
+    def text(self, node: Any) -> str:
+        """Texto del nodo con cada fragmento recortado y concatenado (como get_text(strip=True))."""
+        pass
+
+    @abstractmethod
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        """Valor del atributo `name` del nodo, o None si no existe."""
+        pass
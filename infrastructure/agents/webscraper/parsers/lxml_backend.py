@@ -0,0 +1,34 @@
+# infrastructure/agents/webscraper/parsers/lxml_backend.py
+from typing import Any, List, Optional, Union
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from infrastructure.agents.webscraper.parsers.html_parser_backend import HtmlParserBackend
+
+
+class LxmlBackend(HtmlParserBackend):
+    """
+    Backend lxml (libxml2). Cada selector CSS se traduce una vez a XPath compilado.
+    """
+
+    name = "lxml"
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return lxml.html.document_fromstring(html)
+
+    def compile(self, selector: str) -> Any:
+        return CSSSelector(selector, translator="html")
+
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        return compiled(node)
+
+    def select_one(self, node: Any, compiled: Any) -> Optional[Any]:
+        found = compiled(node)
+        return found[0] if found else None
+
+    def text(self, node: Any) -> str:
+        return "".join(fragment.strip() for fragment in node.itertext())
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
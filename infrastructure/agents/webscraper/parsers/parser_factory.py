@@ -0,0 +1,87 @@
+# infrastructure/agents/webscraper/parsers/parser_factory.py
+import logging
+from typing import Callable, Dict, Optional
+
+from config.settings import SCRAPER_PARSER_BACKEND
+from infrastructure.agents.webscraper.parsers.html_parser_backend import HtmlParserBackend
+
+logger = logging.getLogger(__name__)
+
+
+def _selectolax() -> HtmlParserBackend:
+    from infrastructure.agents.webscraper.parsers.selectolax_backend import SelectolaxBackend
+    return SelectolaxBackend()
+
+
+def _lxml() -> HtmlParserBackend:
+    from infrastructure.agents.webscraper.parsers.lxml_backend import LxmlBackend
+    return LxmlBackend()
+
+
+def _bs4_lxml() -> HtmlParserBackend:
+    import lxml  # noqa: F401  (BeautifulSoup sólo lo usa si está instalado)
+    from infrastructure.agents.webscraper.parsers.soup_backend import SoupBackend
+    return SoupBackend("lxml")
+
+
+def _html_parser() -> HtmlParserBackend:
+    from infrastructure.agents.webscraper.parsers.soup_backend import SoupBackend
+    return SoupBackend("html.parser")
+
+
+# Orden de preferencia en modo "auto": del más rápido al más portable
+_BACKENDS: Dict[str, Callable[[], HtmlParserBackend]] = {
+    "selectolax": _selectolax,
+    "lxml": _lxml,
+    "bs4:lxml": _bs4_lxml,
+    "html.parser": _html_parser,
+}
+
+_instances: Dict[str, HtmlParserBackend] = {}
+
+
+def available_backends() -> Dict[str, HtmlParserBackend]:
+    """Devuelve todos los backends cuyas dependencias están instaladas."""
+    found = {}
+    for name in _BACKENDS:
+        backend = _load(name)
+        if backend is not None:
+            found[name] = backend
+    return found
+
+
+def get_parser_backend(name: Optional[str] = None) -> HtmlParserBackend:
+    """
+    Devuelve el backend de parseo configurado.
+
+    Args:
+        name (str, optional): "auto", "selectolax", "lxml", "bs4:lxml" o "html.parser".
+            Por defecto se usa SCRAPER_PARSER_BACKEND de settings.
+
+    Returns:
+        HtmlParserBackend: El backend pedido o, si su librería no está instalada,
+        el siguiente disponible en orden de preferencia (html.parser siempre lo está).
+    """
+    name = (name or SCRAPER_PARSER_BACKEND or "auto").lower()
+    if name != "auto":
+        if name not in _BACKENDS:
+            raise ValueError(f"Backend de parseo desconocido: '{name}'")
+        backend = _load(name)
+        if backend is not None:
+            return backend
+        logger.warning("Backend de parseo '%s' no disponible, usando el siguiente disponible.", name)
+
+    for candidate in _BACKENDS:
+        backend = _load(candidate)
+        if backend is not None:
+            return backend
+    raise RuntimeError("No hay ningún backend de parseo HTML disponible")
+
+
+def _load(name: str) -> Optional[HtmlParserBackend]:
+    if name not in _instances:
+        try:
+            _instances[name] = _BACKENDS[name]()
+        except ImportError:
+            return None
+    return _instances[name]
@@ -0,0 +1,33 @@
+# infrastructure/agents/webscraper/parsers/selectolax_backend.py
+from typing import Any, List, Optional, Union
+
+from selectolax.lexbor import LexborHTMLParser
+
+from infrastructure.agents.webscraper.parsers.html_parser_backend import HtmlParserBackend
+
+
+class SelectolaxBackend(HtmlParserBackend):
+    """
+    Backend selectolax (motor Lexbor en C). Lexbor cachea internamente los
+    selectores, así que el selector "compilado" es la propia cadena CSS.
+    """
+
+    name = "selectolax"
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return LexborHTMLParser(html)
+
+    def compile(self, selector: str) -> Any:
+        return selector
+
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        return node.css(compiled)
+
+    def select_one(self, node: Any, compiled: Any) -> Optional[Any]:
+        return node.css_first(compiled)
+
+    def text(self, node: Any) -> str:
+        return node.text(deep=True, separator="", strip=True)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
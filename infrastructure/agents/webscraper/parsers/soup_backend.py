@@ -0,0 +1,41 @@
+# infrastructure/agents/webscraper/parsers/soup_backend.py
+from typing import Any, List, Optional, Union
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from infrastructure.agents.webscraper.parsers.html_parser_backend import HtmlParserBackend
+
+
+class SoupBackend(HtmlParserBackend):
+    """
+    Backend BeautifulSoup. Los selectores se compilan una sola vez con soupsieve.
+
+    Args:
+        features (str): Parser subyacente de BeautifulSoup ("html.parser" o "lxml").
+    """
+
+    def __init__(self, features: str = "html.parser"):
+        self.features = features
+        self.name = f"bs4:{features}"
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return BeautifulSoup(html, self.features)
+
+    def compile(self, selector: str) -> Any:
+        return soupsieve.compile(selector)
+
+    def select(self, node: Any, compiled: Any) -> List[Any]:
+        return compiled.select(node)
+
+    def select_one(self, node: Any, compiled: Any) -> Optional[Any]:
+        return compiled.select_one(node)
+
+    def text(self, node: Any) -> str:
+        return node.get_text(strip=True)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        value = node.get(name)
+        if isinstance(value, list):  # atributos multivaluados (class, rel...)
+            return " ".join(value)
+        return value
@@ -0,0 +1,141 @@
+# infrastructure/agents/webscraper/services/catalogue_crawler.py
+"""
+Rastreo de catálogos por streaming.
+
+✔  Generador: los productos se entregan según se parsean, página a página.
+✔  Sigue los enlaces de paginación hasta agotar el catálogo o el presupuesto.
+✔  Lee el cuerpo por trozos y re-parsea ventanas crecientes (64 KB, 128 KB...),
+   de modo que al cubrir el presupuesto se corta la descarga y el parseo.
+✔  Memoria acotada a una página (o a su prefijo) sea cual sea el catálogo.
+"""
+
+import logging
+from typing import Callable, Iterator, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from config.settings import SCRAPER_MAX_PAGES, SCRAPER_STREAM_WINDOW
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import ShopRequestEntry
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+from infrastructure.agents.webscraper.services.page_stream import PageStream, sniff_encoding
+from infrastructure.agents.webscraper.services.product_extractor import (
+    CompiledShopSelectors,
+    ProductExtractor,
+)
+
+logger = logging.getLogger(__name__)
+
+# Elementos que produce el recorrido de una página
+_PRODUCT = "product"
+_NEXT = "next"
+
+
+class CatalogueCrawler:
+    """
+    Recorre el catálogo de una tienda y produce sus productos en orden.
+
+    Args:
+        extractor (ProductExtractor): Extractor (y backend de parseo) a utilizar.
+        open_page (Callable[[str], PageStream]): Abre una URL y devuelve su cuerpo por trozos
+            (caché de páginas o transporte directo).
+        max_pages (int): Número máximo de páginas a seguir por tienda.
+        first_window (int): Bytes del primer prefijo que se parsea; cada ventana dobla la anterior.
+    """
+
+    def __init__(
+        self,
+        extractor: ProductExtractor,
+        open_page: Callable[[str], PageStream],
+        max_pages: int = SCRAPER_MAX_PAGES,
+        first_window: int = SCRAPER_STREAM_WINDOW,
+    ):
+        self.extractor = extractor
+        self.open_page = open_page
+        self.max_pages = max(1, max_pages)
+        self.first_window = max(1024, first_window)
+
+    def crawl(self, entry: ShopRequestEntry, max_results: Optional[int] = None) -> Iterator[ProductResult]:
+        """
+        Args:
+            entry (ShopRequestEntry): Tienda a recorrer.
+            max_results (int, optional): Presupuesto de productos; None recorre todo el catálogo.
+
+        Yields:
+            ProductResult: Productos en orden de aparición, página tras página.
+        """
+        if max_results is not None and max_results <= 0:
+            return
+
+        selectors = self.extractor.compiled_for(entry)
+        url: Optional[str] = entry.url
+        visited = set()
+        produced = 0
+
+        for page_number in range(1, self.max_pages + 1):
+            if not url or url in visited:
+                break
+            visited.add(url)
+            logger.debug("[CatalogueCrawler] Página %d: %s", page_number, url)
+
+            next_url = None
+            stream = self.open_page(url)
+            try:
+                for kind, value in self._iter_page(selectors, stream):
+                    if kind == _NEXT:
+                        next_url = urljoin(url, value)
+                        continue
+                    value.shop = entry.url
+                    yield value
+                    produced += 1
+                    if max_results is not None and produced >= max_results:
+                        logger.debug("[CatalogueCrawler] Presupuesto de %d productos cubierto", max_results)
+                        return
+            finally:
+                # Si paramos antes de tiempo, cerrar el stream corta la descarga
+                stream.close()
+
+            url = next_url
+
+    def _iter_page(
+        self, selectors: CompiledShopSelectors, stream: PageStream
+    ) -> Iterator[Tuple[str, Union[ProductResult, str]]]:
+        """
+        Produce ("product", ProductResult) según se completan los contenedores y,
+        al final de la página, ("next", href) si hay paginación.
+
+        Cada ventana re-parsea el prefijo recibido; el último contenedor de un
+        prefijo puede estar truncado, así que sólo se entregan los anteriores.
+        Como las ventanas se doblan, el coste total queda acotado a ~2 parseos.
+        """
+        extractor = self.extractor
+        buffer = bytearray()
+        window = self.first_window
+        emitted = 0
+        encoding = None
+
+        for chunk in stream:
+            buffer += chunk
+            if len(buffer) < window:
+                continue
+            window *= 2
+            encoding = encoding or sniff_encoding(bytes(buffer[:4096]), stream.encoding)
+            document = extractor.parse(buffer.decode(encoding, errors="replace"))
+            complete = extractor.containers(selectors, document)[:-1]
+            for container in complete[emitted:]:
+                product = extractor.product(selectors, container)
+                if product is not None:
+                    yield _PRODUCT, product
+            emitted = max(emitted, len(complete))
+
+        # Página completa: se entregan los contenedores restantes y la paginación
+        if not buffer:
+            return
+        encoding = encoding or sniff_encoding(bytes(buffer[:4096]), stream.encoding)
+        document = extractor.parse(buffer.decode(encoding, errors="replace"))
+        for container in extractor.containers(selectors, document)[emitted:]:
+            product = extractor.product(selectors, container)
+            if product is not None:
+                yield _PRODUCT, product
+
+        next_href = extractor.next_page(selectors, document)
+        if next_href:
+            yield _NEXT, next_href
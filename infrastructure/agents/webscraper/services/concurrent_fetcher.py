@@ -0,0 +1,72 @@
+# infrastructure/agents/webscraper/services/concurrent_fetcher.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, TypeVar
+from urllib.parse import urlsplit
+
+from config.settings import SCRAPER_MAX_WORKERS, SCRAPER_MAX_PER_HOST
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ConcurrentFetcher:
+    """
+    Etapa de descarga concurrente del scraper.
+
+    Ejecuta una función por cada elemento en un pool de hilos acotado,
+    limitando las peticiones simultáneas contra un mismo host y devolviendo
+    los resultados en el mismo orden en que llegaron los elementos.
+    """
+
+    def __init__(self, max_workers: int = SCRAPER_MAX_WORKERS, max_per_host: int = SCRAPER_MAX_PER_HOST):
+        """
+        Args:
+            max_workers (int): Número máximo de descargas simultáneas en total.
+            max_per_host (int): Número máximo de descargas simultáneas contra un mismo host.
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="webscraper",
+        )
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def map(self, fn: Callable[[T], R], items: List[T], url_of: Callable[[T], str]) -> List[R]:
+        """
+        Aplica `fn` a cada elemento de forma concurrente.
+
+        Args:
+            fn (Callable): Función de descarga/procesado de un elemento.
+            items (List): Elementos a procesar (p.ej. ShopRequestEntry).
+            url_of (Callable): Devuelve la URL de un elemento, usada para el límite por host.
+
+        Returns:
+            List: Resultados en el mismo orden que `items`.
+
+        Raises:
+            Exception: La primera excepción (en orden de entrada) lanzada por `fn`.
+        """
+        def task(item: T) -> R:
+            with self._host_slot(url_of(item)):
+                return fn(item)
+
+        # Con un único elemento no compensa saltar a otro hilo
+        if len(items) <= 1:
+            return [task(item) for item in items]
+
+        logger.debug("[ConcurrentFetcher] Descargando %d elementos en paralelo", len(items))
+        futures = [self._executor.submit(task, item) for item in items]
+        return [future.result() for future in futures]
@@ -0,0 +1,125 @@
+# infrastructure/agents/webscraper/services/incremental_scraper.py
+"""
+Scraping incremental: sólo se devuelve lo que ha cambiado desde la última ejecución.
+
+✔  Recorre el catálogo completo (sin presupuesto): un producto no visto no
+   puede distinguirse de uno retirado.
+✔  Hash SHA-256 del cuerpo (y los selectores) de cada página; si coincide con
+   la instantánea, se reutilizan sus productos y su paginación sin parsear.
+✔  El diff (nuevos, retirados, con cambio de precio) y la sustitución de la
+   instantánea los resuelve SnapshotStore.
+"""
+
+import hashlib
+import logging
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from config.settings import SCRAPER_MAX_PAGES
+from infrastructure.agents.webscraper.dtos.product_diff_dto import ShopDiff
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import ShopRequestEntry
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+from infrastructure.agents.webscraper.services.page_stream import PageStream, sniff_encoding
+from infrastructure.agents.webscraper.services.product_extractor import ProductExtractor
+from infrastructure.agents.webscraper.services.snapshot_store import PageSnapshot, SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalScraper:
+    """
+    Calcula el diff de una tienda frente a su instantánea guardada.
+
+    Args:
+        extractor (ProductExtractor): Extractor (y backend de parseo) a utilizar.
+        open_page (Callable[[str], PageStream]): Abre una URL y devuelve su cuerpo por trozos.
+        store (SnapshotStore): Almacén de instantáneas.
+        max_pages (int): Número máximo de páginas a seguir por tienda.
+    """
+
+    def __init__(
+        self,
+        extractor: ProductExtractor,
+        open_page: Callable[[str], PageStream],
+        store: SnapshotStore,
+        max_pages: int = SCRAPER_MAX_PAGES,
+    ):
+        self.extractor = extractor
+        self.open_page = open_page
+        self.store = store
+        self.max_pages = max(1, max_pages)
+
+    def diff(self, entry: ShopRequestEntry) -> ShopDiff:
+        """
+        Recorre la tienda, compara con la instantánea anterior y la actualiza.
+
+        Raises:
+            requests.RequestException: Si alguna página no se puede descargar
+                (la instantánea no se modifica).
+        """
+        pages: List[Tuple[PageSnapshot, List[ProductResult]]] = []
+        unchanged_pages = 0
+        url: Optional[str] = entry.url
+        visited = set()
+
+        for page_number in range(1, self.max_pages + 1):
+            if not url or url in visited:
+                break
+            visited.add(url)
+
+            with self.open_page(url) as stream:
+                body = b"".join(stream)
+                encoding = stream.encoding
+            content_hash = self._content_hash(entry, body)
+
+            previous = self.store.page(entry.url, url)
+            if previous is not None and previous.content_hash == content_hash:
+                logger.debug("[IncrementalScraper] Página %d sin cambios: %s", page_number, url)
+                unchanged_pages += 1
+                page = previous
+                products = self.store.products_for_page(entry.url, url)
+            else:
+                logger.debug("[IncrementalScraper] Página %d modificada: %s", page_number, url)
+                page, products = self._parse_page(entry, url, body, encoding, content_hash)
+
+            pages.append((page, products))
+            url = page.next_url
+
+        diff = self.store.diff_and_replace(entry.url, pages)
+        diff.unchanged_pages = unchanged_pages
+        return diff
+
+    @staticmethod
+    def _content_hash(entry: ShopRequestEntry, body: bytes) -> str:
+        # Los selectores forman parte del hash: si cambian, la página se vuelve a parsear
+        digest = hashlib.sha256(body)
+        selectors = (
+            entry.selector_container, entry.selector_price, entry.selector_description,
+            entry.selector_sku.get("tag", ""), entry.selector_sku.get("attribute", ""),
+            entry.selector_next_page,
+        )
+        digest.update("\x00".join(selectors).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _parse_page(
+        self,
+        entry: ShopRequestEntry,
+        url: str,
+        body: bytes,
+        encoding: Optional[str],
+        content_hash: str,
+    ) -> Tuple[PageSnapshot, List[ProductResult]]:
+        extractor = self.extractor
+        selectors = extractor.compiled_for(entry)
+        document = extractor.parse(body.decode(sniff_encoding(body, encoding), errors="replace"))
+
+        products = []
+        for container in extractor.containers(selectors, document):
+            product = extractor.product(selectors, container)
+            if product is not None:
+                product.shop = entry.url
+                products.append(product)
+
+        next_href = extractor.next_page(selectors, document)
+        next_url = urljoin(url, next_href) if next_href else None
+        return PageSnapshot(url, content_hash, next_url), products
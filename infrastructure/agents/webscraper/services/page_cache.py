@@ -0,0 +1,319 @@
+# infrastructure/agents/webscraper/services/page_cache.py
+"""
+Caché HTTP en disco para las páginas descargadas por el scraper.
+
+✔  Almacén SQLite acotado en tamaño con expulsión LRU (por último acceso).
+✔  TTL por dominio: dentro del TTL la página se sirve sin tocar la red.
+✔  Fuera del TTL se revalida con GET condicional (ETag / Last-Modified);
+   un 304 reutiliza el cuerpo guardado.
+✔  Lectura por trozos (`stream`) que sólo guarda la página si se descargó entera.
+✔  Estadísticas de aciertos, revalidaciones, fallos y expulsiones.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from config.settings import (
+    SCRAPER_CACHE_PATH,
+    SCRAPER_CACHE_MAX_BYTES,
+    SCRAPER_CACHE_TTL,
+    SCRAPER_CACHE_DOMAIN_TTLS,
+)
+from infrastructure.http.http_transport import HttpTransport
+from infrastructure.agents.webscraper.services.page_stream import (
+    STREAM_CHUNK_SIZE,
+    PageStream,
+    charset_from_headers,
+    sniff_encoding,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """
+    Página servida por la caché (o recién descargada).
+
+    Attributes:
+        url (str): URL solicitada.
+        body (bytes): Cuerpo de la respuesta, ya descomprimido.
+        encoding (str): Charset declarado por el servidor (None si no lo declaró).
+        from_cache (bool): True si el cuerpo no se descargó en esta llamada.
+    """
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(sniff_encoding(self.body, self.encoding), errors="replace")
+
+
+@dataclass
+class PageCacheStats:
+    hits: int = 0          # servidas dentro del TTL, sin red
+    revalidated: int = 0   # 304 Not Modified tras GET condicional
+    misses: int = 0        # descargadas completas
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+
+class PageCache:
+    """
+    Caché de páginas con revalidación condicional sobre el transporte HTTP compartido.
+    """
+
+    def __init__(
+        self,
+        transport: HttpTransport,
+        path: str = SCRAPER_CACHE_PATH,
+        max_bytes: int = SCRAPER_CACHE_MAX_BYTES,
+        default_ttl: float = SCRAPER_CACHE_TTL,
+        domain_ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            transport (HttpTransport): Transporte usado para descargar y revalidar.
+            path (str): Fichero SQLite donde se guardan las páginas.
+            max_bytes (int): Tamaño máximo (comprimido) del almacén antes de expulsar entradas.
+            default_ttl (float): Segundos durante los que una página se considera fresca.
+            domain_ttls (dict, optional): TTL específico por dominio, p.ej. {"tienda.com": 3600}.
+                Se aplica también a sus subdominios.
+        """
+        self.transport = transport
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.domain_ttls = {
+            d.lower().lstrip("."): float(t)
+            for d, t in (SCRAPER_CACHE_DOMAIN_TTLS if domain_ttls is None else domain_ttls).items()
+        }
+        self._stats = PageCacheStats()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url           TEXT PRIMARY KEY,
+                body          BLOB NOT NULL,
+                encoding      TEXT,
+                etag          TEXT,
+                last_modified TEXT,
+                fetched_at    REAL NOT NULL,
+                accessed_at   REAL NOT NULL,
+                size          INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at)")
+
+    # ─────── API PÚBLICA ───────
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> CachedPage:
+        """
+        Devuelve la página `url`, desde la caché si sigue fresca o tras revalidarla.
+
+        Raises:
+            requests.RequestException: Si la descarga falla o el servidor responde con error.
+        """
+        now = time.time()
+        ttl = self.ttl_for(url)
+        row = self._lookup(url)
+
+        if row is not None and now - row["fetched_at"] < ttl:
+            self._count("hits")
+            self._touch(url, now)
+            logger.debug("[PageCache] HIT %s", url)
+            return CachedPage(url, row["body"], row["encoding"], from_cache=True)
+
+        request_headers = self._conditional_headers(headers, row)
+        kwargs = {"headers": request_headers}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        response = self.transport.get(url, **kwargs)
+
+        if response.status_code == 304 and row is not None:
+            self._revalidated(url, response.headers.get("ETag"), now)
+            return CachedPage(url, row["body"], row["encoding"], from_cache=True)
+
+        response.raise_for_status()
+        self._count("misses")
+        page = CachedPage(url, response.content, charset_from_headers(response.headers))
+
+        if self._storable(ttl, response.headers):
+            self._store(page, response.headers.get("ETag"), response.headers.get("Last-Modified"), now)
+        return page
+
+    def stream(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> PageStream:
+        """
+        Igual que `fetch`, pero devuelve el cuerpo por trozos. Una descarga que se
+        corta antes del final (stream cerrado) no se guarda en la caché.
+
+        Raises:
+            requests.RequestException: Si la descarga falla o el servidor responde con error.
+        """
+        now = time.time()
+        ttl = self.ttl_for(url)
+        row = self._lookup(url)
+
+        if row is not None and now - row["fetched_at"] < ttl:
+            self._count("hits")
+            self._touch(url, now)
+            logger.debug("[PageCache] HIT %s", url)
+            return PageStream(url, iter([row["body"]]), row["encoding"], from_cache=True)
+
+        kwargs = {"headers": self._conditional_headers(headers, row), "stream": True}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        response = self.transport.get(url, **kwargs)
+
+        if response.status_code == 304 and row is not None:
+            response.close()
+            self._revalidated(url, response.headers.get("ETag"), now)
+            return PageStream(url, iter([row["body"]]), row["encoding"], from_cache=True)
+
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        self._count("misses")
+        encoding = charset_from_headers(response.headers)
+        storable = self._storable(ttl, response.headers)
+
+        def chunks() -> Iterator[bytes]:
+            parts = []
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                if storable:
+                    parts.append(chunk)
+                yield chunk
+            # Sólo se llega aquí si el cuerpo se leyó completo
+            if storable:
+                self._store(
+                    CachedPage(url, b"".join(parts), encoding),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                )
+
+        return PageStream(url, chunks(), encoding, on_close=response.close)
+
+    def ttl_for(self, url: str) -> float:
+        """TTL aplicable a `url`: el del dominio más específico configurado o el global."""
+        host = (urlsplit(url).hostname or "").lower()
+        labels = host.split(".")
+        for i in range(len(labels)):
+            domain = ".".join(labels[i:])
+            if domain in self.domain_ttls:
+                return self.domain_ttls[domain]
+        return self.default_ttl
+
+    def stats(self) -> PageCacheStats:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+            return PageCacheStats(
+                hits=self._stats.hits,
+                revalidated=self._stats.revalidated,
+                misses=self._stats.misses,
+                stores=self._stats.stores,
+                evictions=self._stats.evictions,
+                entries=entries,
+                bytes=size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM pages")
+
+    # ─────── HELPERS ───────
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+
+    @staticmethod
+    def _conditional_headers(headers: Optional[Dict[str, str]], row: Optional[dict]) -> Dict[str, str]:
+        request_headers = dict(headers or {})
+        if row is not None:
+            if row["etag"]:
+                request_headers["If-None-Match"] = row["etag"]
+            if row["last_modified"]:
+                request_headers["If-Modified-Since"] = row["last_modified"]
+        return request_headers
+
+    @staticmethod
+    def _storable(ttl: float, response_headers: Dict[str, str]) -> bool:
+        return ttl > 0 and "no-store" not in response_headers.get("Cache-Control", "").lower()
+
+    def _revalidated(self, url: str, etag: Optional[str], now: float) -> None:
+        self._count("revalidated")
+        with self._lock:
+            self._db.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ?, etag = COALESCE(?, etag) WHERE url = ?",
+                (now, now, etag, url),
+            )
+        logger.debug("[PageCache] 304 %s", url)
+
+    def _lookup(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, encoding, etag, last_modified, fetched_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, encoding, etag, last_modified, fetched_at = row
+        return {
+            "body": zlib.decompress(body),
+            "encoding": encoding,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+        }
+
+    def _touch(self, url: str, now: float) -> None:
+        with self._lock:
+            self._db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, url))
+
+    def _store(self, page: CachedPage, etag: Optional[str], last_modified: Optional[str], now: float) -> None:
+        blob = zlib.compress(page.body, 6)
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, body, encoding, etag, last_modified, fetched_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (page.url, blob, page.encoding, etag, last_modified, now, now, len(blob)),
+            )
+            self._stats.stores += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Expulsa las entradas menos usadas hasta volver a `max_bytes` (requiere el lock)."""
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        if total <= self.max_bytes:
+            return
+        for url, size in self._db.execute("SELECT url, size FROM pages ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+            total -= size
+            self._stats.evictions += 1
+            logger.debug("[PageCache] Expulsada %s", url)
@@ -0,0 +1,104 @@
+# infrastructure/agents/webscraper/services/page_stream.py
+import re
+from typing import Callable, Dict, Iterator, Optional
+
+import requests
+
+from infrastructure.http.http_transport import HttpTransport
+
+# Tamaño de cada lectura del cuerpo de la respuesta
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+
+
+def charset_from_headers(headers: Dict[str, str]) -> Optional[str]:
+    """Charset declarado en Content-Type, o None si el servidor no lo indica."""
+    match = _HEADER_CHARSET_RE.search(headers.get("Content-Type", ""))
+    return match.group(1) if match else None
+
+
+def sniff_encoding(head: bytes, declared: Optional[str] = None) -> str:
+    """
+    Codificación con la que decodificar una página: la de las cabeceras si existe,
+    si no la de <meta charset> en los primeros bytes y, en último caso, UTF-8.
+    """
+    if declared:
+        return declared
+    match = _META_CHARSET_RE.search(head[:4096])
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+
+class PageStream:
+    """
+    Cuerpo de una página leído por trozos.
+
+    Cerrar el stream antes de consumirlo entero corta la descarga: así el
+    scraper deja de leer en cuanto tiene los productos que necesita.
+
+    Attributes:
+        url (str): URL de la página.
+        encoding (str | None): Charset declarado por el servidor (None si no lo declaró).
+        from_cache (bool): True si el cuerpo sale de la caché de páginas.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        chunks: Iterator[bytes],
+        encoding: Optional[str] = None,
+        from_cache: bool = False,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.url = url
+        self.encoding = encoding
+        self.from_cache = from_cache
+        self._chunks = chunks
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks
+
+    def close(self) -> None:
+        close_chunks = getattr(self._chunks, "close", None)
+        if close_chunks is not None:
+            close_chunks()
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self) -> "PageStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_page_stream(
+    transport: HttpTransport,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> PageStream:
+    """
+    Abre `url` sin caché y devuelve su cuerpo como PageStream.
+
+    Raises:
+        requests.RequestException: Si la conexión falla o el servidor responde con error.
+    """
+    kwargs = {"headers": headers or {}, "stream": True}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    response = transport.get(url, **kwargs)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return PageStream(
+        url,
+        response.iter_content(STREAM_CHUNK_SIZE),
+        encoding=charset_from_headers(response.headers),
+        on_close=response.close,
+    )
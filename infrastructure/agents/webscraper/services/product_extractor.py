@@ -0,0 +1,118 @@
+# infrastructure/agents/webscraper/services/product_extractor.py
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Union
+
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import (
+    ShopRequestEntry,
+    DEFAULT_CONTAINER_SELECTOR,
+)
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+from infrastructure.agents.webscraper.parsers.html_parser_backend import HtmlParserBackend
+from infrastructure.agents.webscraper.parsers.parser_factory import get_parser_backend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledShopSelectors:
+    """Selectores de una tienda ya compilados para un backend concreto."""
+    container: Any
+    next_page: Optional[Any]
+    sku: Any
+    sku_attribute: str
+    price: Optional[Any]
+    description: Optional[Any]
+
+
+@lru_cache(maxsize=256)
+def _compile_selectors(
+    backend: HtmlParserBackend,
+    selector_container: str,
+    selector_next_page: str,
+    sku_tag: str,
+    sku_attribute: str,
+    selector_price: str,
+    selector_description: str,
+) -> CompiledShopSelectors:
+    return CompiledShopSelectors(
+        container=backend.compile(selector_container),
+        next_page=backend.compile(selector_next_page) if selector_next_page else None,
+        sku=backend.compile(f"{sku_tag}[{sku_attribute}]"),
+        sku_attribute=sku_attribute,
+        price=backend.compile(selector_price) if selector_price else None,
+        description=backend.compile(selector_description) if selector_description else None,
+    )
+
+
+class ProductExtractor:
+    """
+    Extrae productos (SKU, precio, descripción) de una página de tienda usando
+    un backend de parseo intercambiable y selectores compilados por tienda.
+    """
+
+    def __init__(self, backend: Optional[HtmlParserBackend] = None):
+        self.backend = backend or get_parser_backend()
+        logger.info("[ProductExtractor] Backend de parseo: %s", self.backend.name)
+
+    def compiled_for(self, entry: ShopRequestEntry) -> CompiledShopSelectors:
+        """Selectores compilados de `entry` (se cachean entre llamadas y tiendas iguales)."""
+        return _compile_selectors(
+            self.backend,
+            entry.selector_container or DEFAULT_CONTAINER_SELECTOR,
+            entry.selector_next_page,
+            entry.selector_sku["tag"],
+            entry.selector_sku["attribute"],
+            entry.selector_price,
+            entry.selector_description,
+        )
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return self.backend.parse(html)
+
+    def containers(self, selectors: CompiledShopSelectors, document: Any) -> List[Any]:
+        """Contenedores de producto del documento, en orden de aparición."""
+        return self.backend.select(document, selectors.container)
+
+    def product(self, selectors: CompiledShopSelectors, container: Any) -> Optional[ProductResult]:
+        """Lee SKU, precio y descripción de un contenedor; None si no tiene SKU."""
+        backend = self.backend
+        sku_elem = backend.select_one(container, selectors.sku)
+        if sku_elem is None:
+            return None
+
+        price_elem = backend.select_one(container, selectors.price) if selectors.price else None
+        desc_elem = backend.select_one(container, selectors.description) if selectors.description else None
+
+        return ProductResult(
+            description=backend.text(desc_elem) if desc_elem is not None else "",
+            price=backend.text(price_elem) if price_elem is not None else "",
+            sku=backend.attr(sku_elem, selectors.sku_attribute) or "",
+        )
+
+    def next_page(self, selectors: CompiledShopSelectors, document: Any) -> Optional[str]:
+        """Enlace (href) a la siguiente página del catálogo, si la página tiene paginación."""
+        if selectors.next_page is None:
+            return None
+        link = self.backend.select_one(document, selectors.next_page)
+        return (self.backend.attr(link, "href") or None) if link is not None else None
+
+    def extract(self, entry: ShopRequestEntry, html: Union[str, bytes]) -> Iterator[ProductResult]:
+        """
+        Extrae los productos en una sola pasada: primero localiza los contenedores
+        de producto y después lee SKU, precio y descripción dentro de cada uno,
+        sin volver a subir por el árbol desde cada ancla de SKU.
+
+        Args:
+            entry (ShopRequestEntry): Tienda con sus selectores.
+            html (str | bytes): Contenido de la página.
+
+        Yields:
+            ProductResult: Un producto por cada contenedor con SKU, en orden de aparición.
+        """
+        selectors = self.compiled_for(entry)
+        for container in self.containers(selectors, self.parse(html)):
+            product = self.product(selectors, container)
+            if product is not None:
+                yield product
@@ -0,0 +1,194 @@
+# infrastructure/agents/webscraper/services/snapshot_store.py
+"""
+Instantáneas persistentes de los catálogos scrapeados, para el modo incremental.
+
+✔  Productos indexados por (URL de tienda, página, SKU) con su último precio y descripción:
+   un SKU que aparece en varias páginas (destacados, listados cruzados) se guarda en cada una.
+✔  Hash del contenido de cada página: si no cambia, no hace falta volver a parsearla.
+✔  Cálculo del diff (nuevos, retirados, con cambio de precio) y sustitución atómica.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.settings import SCRAPER_SNAPSHOT_PATH
+from infrastructure.agents.webscraper.dtos.product_diff_dto import PriceChange, ShopDiff
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import ProductResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PageSnapshot:
+    """Última versión conocida de una página de catálogo."""
+    page_url: str
+    content_hash: str
+    next_url: Optional[str]
+
+
+class SnapshotStore:
+    """
+    Almacén SQLite de instantáneas por tienda, compartido entre hilos.
+    """
+
+    def __init__(self, path: str = SCRAPER_SNAPSHOT_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS products (
+                shop_url    TEXT NOT NULL,
+                sku         TEXT NOT NULL,
+                description TEXT NOT NULL,
+                price       TEXT NOT NULL,
+                page_url    TEXT NOT NULL,
+                position    INTEGER NOT NULL,
+                updated_at  REAL NOT NULL,
+                PRIMARY KEY (shop_url, page_url, sku)
+            );
+            CREATE INDEX IF NOT EXISTS idx_products_page ON products(shop_url, page_url, position);
+            CREATE TABLE IF NOT EXISTS pages (
+                shop_url     TEXT NOT NULL,
+                page_url     TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                next_url     TEXT,
+                updated_at   REAL NOT NULL,
+                PRIMARY KEY (shop_url, page_url)
+            );
+            """
+        )
+        self._migrate_products_key()
+
+    def _migrate_products_key(self) -> None:
+        # Instantáneas antiguas: clave (shop_url, sku), un SKU sólo en su primera página
+        key = [row[1] for row in sorted(self._db.execute("PRAGMA table_info(products)"), key=lambda r: r[5]) if row[5]]
+        if "page_url" in key:
+            return
+        logger.info("[SnapshotStore] Migrando la clave de products a (shop_url, page_url, sku)")
+        self._db.executescript(
+            """
+            BEGIN;
+            ALTER TABLE products RENAME TO products_old;
+            DROP INDEX IF EXISTS idx_products_page;
+            CREATE TABLE products (
+                shop_url    TEXT NOT NULL,
+                sku         TEXT NOT NULL,
+                description TEXT NOT NULL,
+                price       TEXT NOT NULL,
+                page_url    TEXT NOT NULL,
+                position    INTEGER NOT NULL,
+                updated_at  REAL NOT NULL,
+                PRIMARY KEY (shop_url, page_url, sku)
+            );
+            CREATE INDEX idx_products_page ON products(shop_url, page_url, position);
+            INSERT INTO products SELECT * FROM products_old;
+            DROP TABLE products_old;
+            COMMIT;
+            """
+        )
+
+    # ─────── PÁGINAS ───────
+    def page(self, shop_url: str, page_url: str) -> Optional[PageSnapshot]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_hash, next_url FROM pages WHERE shop_url = ? AND page_url = ?",
+                (shop_url, page_url),
+            ).fetchone()
+        return PageSnapshot(page_url, row[0], row[1]) if row else None
+
+    def products_for_page(self, shop_url: str, page_url: str) -> List[ProductResult]:
+        """Productos guardados de una página, en el orden en que aparecían."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT description, price, sku FROM products "
+                "WHERE shop_url = ? AND page_url = ? ORDER BY position",
+                (shop_url, page_url),
+            ).fetchall()
+        return [ProductResult(description=d, price=p, sku=s, shop=shop_url) for d, p, s in rows]
+
+    # ─────── DIFF ───────
+    def diff_and_replace(
+        self,
+        shop_url: str,
+        pages: Iterable[Tuple[PageSnapshot, List[ProductResult]]],
+    ) -> ShopDiff:
+        """
+        Compara el catálogo recién leído con la instantánea guardada de la tienda,
+        sustituye la instantánea por el nuevo catálogo y devuelve las diferencias.
+
+        Args:
+            shop_url (str): URL de la tienda (clave de la instantánea).
+            pages (Iterable): Pares (página, productos de la página) en orden de recorrido.
+        """
+        pages = list(pages)
+        now = time.time()
+        diff = ShopDiff(url=shop_url)
+
+        with self._lock:
+            previous: Dict[str, Tuple[str, str]] = {
+                sku: (description, price)
+                for sku, description, price in self._db.execute(
+                    "SELECT sku, description, price FROM products WHERE shop_url = ?", (shop_url,)
+                )
+            }
+
+            # El diff es por SKU (primera aparición); la instantánea guarda cada (página, SKU),
+            # para que una página sin cambios siga devolviendo todos sus productos
+            current: Dict[str, ProductResult] = {}
+            occurrences: Dict[Tuple[str, str], ProductResult] = {}
+            for page, products in pages:
+                for product in products:
+                    if product.sku:
+                        current.setdefault(product.sku, product)
+                        occurrences.setdefault((page.page_url, product.sku), product)
+
+            for sku, product in current.items():
+                if sku not in previous:
+                    diff.new.append(product)
+                elif previous[sku][1] != product.price:
+                    diff.repriced.append(PriceChange(
+                        sku=sku,
+                        description=product.description,
+                        old_price=previous[sku][1],
+                        price=product.price,
+                    ))
+                else:
+                    diff.unchanged += 1
+            for sku, (description, price) in previous.items():
+                if sku not in current:
+                    diff.removed.append(ProductResult(description=description, price=price, sku=sku, shop=shop_url))
+
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM products WHERE shop_url = ?", (shop_url,))
+                self._db.execute("DELETE FROM pages WHERE shop_url = ?", (shop_url,))
+                self._db.executemany(
+                    "INSERT INTO products (shop_url, sku, description, price, page_url, position, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (shop_url, sku, product.description, product.price, page_url, position, now)
+                        for position, ((page_url, sku), product) in enumerate(occurrences.items())
+                    ],
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO pages (page_url, shop_url, content_hash, next_url, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(page.page_url, shop_url, page.content_hash, page.next_url, now) for page, _ in pages],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+        logger.debug(
+            "[SnapshotStore] %s: %d nuevos, %d retirados, %d con cambio de precio",
+            shop_url, len(diff.new), len(diff.removed), len(diff.repriced),
+        )
+        return diff
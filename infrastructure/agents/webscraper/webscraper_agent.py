@@ -1,7 +1,5 @@
 # infrastructure/agents/webscraper/webscraper_agent.py
-
-import requests
-from bs4 import BeautifulSoup
+import logging
 
 from application.enums.status_code import StatusCode
 from application.interfaces.agent_interface import AgentInterface
@@ -9,9 +7,25 @@ from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
 
 from buffer.shared_buffer import get_last_json, set_last_json
-from infrastructure.agents.webscraper.dtos.webscraper_request_dto import WebScraperRequestDTO
-from infrastructure.agents.webscraper.dtos.webscraper_response_dto import WebScraperResponseDTO, ProductResult
+from infrastructure.agents.webscraper.dtos.webscraper_request_dto import (
+    WebScraperRequestDTO,
+    SCRAPE_MODE_FULL,
+    SCRAPE_MODE_DIFF,
+)
+from infrastructure.agents.webscraper.dtos.webscraper_response_dto import WebScraperResponseDTO
+from infrastructure.agents.webscraper.dtos.product_batch import ProductBatch
 from infrastructure.agents.webscraper.mappers.webscraper_mapper import WebScraperMapper
+from infrastructure.agents.webscraper.services.catalogue_crawler import CatalogueCrawler
+from infrastructure.agents.webscraper.services.concurrent_fetcher import ConcurrentFetcher
+from infrastructure.agents.webscraper.services.incremental_scraper import IncrementalScraper
+from infrastructure.agents.webscraper.services.page_cache import PageCache
+from infrastructure.agents.webscraper.services.page_stream import PageStream, open_page_stream
+from infrastructure.agents.webscraper.services.product_extractor import ProductExtractor
+from infrastructure.agents.webscraper.services.snapshot_store import SnapshotStore
+from infrastructure.http.http_transport import get_shared_transport
+from config.settings import SCRAPER_TIMEOUT, SCRAPER_CACHE_ENABLED
+
+logger = logging.getLogger(__name__)
 
 HEADERS = {
     "User-Agent": (
@@ -23,6 +37,14 @@ HEADERS = {
 }
 
 class WebScraperAgent(AgentInterface):
+    def __init__(self):
+        self._fetcher = ConcurrentFetcher()
+        self._transport = get_shared_transport()
+        self._page_cache = PageCache(self._transport) if SCRAPER_CACHE_ENABLED else None
+        self._extractor = ProductExtractor()
+        self._crawler = CatalogueCrawler(self._extractor, self._open_page)
+        self._incremental = IncrementalScraper(self._extractor, self._open_page, SnapshotStore())
+
     @staticmethod
     def get_function_name() -> str:
         return "web_scrape"
@@ -50,6 +72,14 @@ class WebScraperAgent(AgentInterface):
                                     "url": {"type": "string"},
                                     "selector_price": {"type": "string"},
                                     "selector_description": {"type": "string"},
+                                    "selector_next_page": {
+                                        "type": "string",
+                                        "description": "Selector CSS del enlace a la página siguiente (opcional, '' desactiva la paginación)"
+                                    },
+                                    "selector_container": {
+                                        "type": "string",
+                                        "description": "Selector CSS del bloque de cada producto (opcional, por defecto '.meta-wrapper')"
+                                    },
                                     "selector_sku": {
                                         "type": "object",
                                         "properties": {
@@ -61,6 +91,18 @@ class WebScraperAgent(AgentInterface):
                                 },
                                 "required": ["url", "selector_price", "selector_description", "selector_sku"]
                             }
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Número máximo de productos por tienda (opcional, se ignora en modo 'diff')"
+                        },
+                        "mode": {
+                            "type": "string",
+                            "enum": [SCRAPE_MODE_FULL, SCRAPE_MODE_DIFF],
+                            "description": (
+                                "'full' (por defecto) devuelve los productos; 'diff' devuelve sólo los nuevos, "
+                                "retirados y con cambio de precio desde la última ejecución"
+                            )
                         }
                     },
                     "required": ["shops"],
@@ -74,51 +116,37 @@ class WebScraperAgent(AgentInterface):
         try:
             req: WebScraperRequestDTO = WebScraperMapper.map_request(request)
             print("WebScraperAgent - req.entries:", req.entries)
-            products = []
-
-            for entry in req.entries:
-                print("Procesando entry:", entry)
-                r = requests.get(entry.url, headers=HEADERS, timeout=15)
-                r.raise_for_status()
-                soup = BeautifulSoup(r.text, "html.parser")
-                print("HTML descargado OK, buscando productos...")
-
-                for prod in soup.find_all(entry.selector_sku["tag"], attrs={entry.selector_sku["attribute"]: True}):
-                    sku = prod.get(entry.selector_sku["attribute"], "")
-
-                    meta_wrapper = prod.find_parent(class_="meta-wrapper")
-                    if not meta_wrapper:
-                        print(f"SKU: {sku} sin meta-wrapper, saltando")
-                        continue
-
-                    price_elem = meta_wrapper.select_one(entry.selector_price)
-                    desc_elem = meta_wrapper.select_one(entry.selector_description)
-
-                    price = price_elem.get_text(strip=True) if price_elem else ""
-                    description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-                    print(f"→ description: {description} | price: {price} | sku: {sku}")
-
-                    products.append(ProductResult(description=description, price=price, sku=sku))
+            if req.mode == SCRAPE_MODE_DIFF:
+                return self._run_diff(req)
+
+            # Cada tienda se rastrea en paralelo (streaming + paginación) y se vuelca
+            # directamente a un lote columnar; el orden de entrada se conserva
+            per_shop = self._fetcher.map(
+                lambda entry: ProductBatch.collect(self._crawler.crawl(entry, req.max_results)),
+                req.entries,
+                url_of=lambda e: e.url,
+            )
 
-                    if req.limit_results and len(products) > 3:
-                        print("[INFO] Límite de productos alcanzado")
-                        break
+            for entry, shop_products in zip(req.entries, per_shop):
+                print(f"{entry.url}: {len(shop_products)} productos")
+            products = ProductBatch.concat(per_shop)
 
-            print("Productos extraídos:", products)
+            if logger.isEnabledFor(logging.DEBUG):
+                for product in products:
+                    logger.debug("→ description: %s | price: %s | sku: %s", product.description, product.price, product.sku)
 
             # --- DEVOLUCIÓN HOMOGENEIZADA PARA FLUJO AUTOGEN ---
-            content = {
-                "products": [p.__dict__ for p in products],  # Asegúrate que ProductResult es serializable (usa __dict__ o dataclass.asdict)
-            }
             dto = WebScraperResponseDTO(
                 products=products,
                 status=StatusCode.SUCCESS,
                 message="OK"
             )
 
+            # El lote se comparte sin copiar entre el buffer (price_analyze) y el contenido;
+            # el resultado de la herramienta se serializa desde sus columnas (FunctionExecutionMapper)
+            content = {"products": products}
             set_last_json(dto.to_dict())
-            print("\n WebScraperAgent   ------  get_last_json:", get_last_json())
+            logger.debug("WebScraperAgent ------ get_last_json: %s", get_last_json())
 
             return AgentAppResponse(
                 content=content,
@@ -129,9 +157,42 @@ class WebScraperAgent(AgentInterface):
         except Exception as exc:
             print("EXCEPCIÓN en WebScraperAgent:", exc)
             print("\n WebScraperAgent con excepcion   ------  get_last_json:", get_last_json())
+            dto = WebScraperResponseDTO(products=ProductBatch(), status=StatusCode.ERROR, message=str(exc))
             set_last_json(dto.to_dict())
             return AgentAppResponse(
                 content={"products": []},
                 status=StatusCode.ERROR,
                 message=str(exc)
             )
+
+    def _run_diff(self, req: WebScraperRequestDTO) -> AgentAppResponse:
+        # El diff necesita el catálogo completo: el presupuesto de productos no se aplica
+        diffs = self._fetcher.map(self._incremental.diff, req.entries, url_of=lambda e: e.url)
+
+        for diff in diffs:
+            print(
+                f"{diff.url}: {len(diff.new)} nuevos | {len(diff.removed)} retirados | "
+                f"{len(diff.repriced)} con cambio de precio | {diff.unchanged} sin cambios "
+                f"({diff.unchanged_pages} páginas sin modificar)"
+            )
+            for change in diff.repriced:
+                logger.debug("→ sku: %s | price: %s → %s", change.sku, change.old_price, change.price)
+
+        content = {"diff": [d.to_dict() for d in diffs]}
+        dto = WebScraperResponseDTO(products=ProductBatch(), status=StatusCode.SUCCESS, message="OK", diff=diffs)
+        set_last_json(dto.to_dict())
+
+        return AgentAppResponse(
+            content=content,
+            status=StatusCode.SUCCESS,
+            message="OK"
+        )
+
+    def _open_page(self, url: str) -> PageStream:
+        if self._page_cache is not None:
+            stream = self._page_cache.stream(url, headers=HEADERS, timeout=SCRAPER_TIMEOUT)
+            print("HTML obtenido OK:", url, "(caché)" if stream.from_cache else "")
+            return stream
+
+        print("Descargando:", url)
+        return open_page_stream(self._transport, url, headers=HEADERS, timeout=SCRAPER_TIMEOUT)
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class WikiPage:
+    """
+    Artículo resuelto para un título solicitado.
+
+    Attributes:
+        requested (str): Título tal y como se pidió.
+        title (str): Título final, normalizado y tras seguir las redirecciones.
+        pageid (int, optional): Identificador de la página (None si no existe).
+        revid (int, optional): Revisión de la que procede el texto.
+        wikitext (str): Wikitexto de la revisión.
+        extract (str, optional): Texto plano generado por el servidor (modo "extract").
+        missing (bool): True si el artículo no existe (o el título no es válido).
+        redirected_from (str, optional): Primer título redirigido de la cadena, si lo hubo.
+    """
+    requested: str
+    title: str
+    pageid: Optional[int] = None
+    revid: Optional[int] = None
+    wikitext: str = ""
+    extract: Optional[str] = None
+    missing: bool = False
+    redirected_from: Optional[str] = None
+
+    @property
+    def found(self) -> bool:
+        return not self.missing and bool(self.wikitext or self.extract)
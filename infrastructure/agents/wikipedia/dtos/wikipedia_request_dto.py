@@ -1,5 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from config.settings import WIKIPEDIA_MAX_CHARS, WIKIPEDIA_DEFAULT_MODE, WIKIPEDIA_PASSAGES_TOP_K
+
+# Modos de obtención del texto
+WIKI_MODE_WIKITEXT = "wikitext"  # wikitexto completo, limpiado en local por secciones
+WIKI_MODE_EXTRACT = "extract"    # texto plano generado por el servidor (TextExtracts)
 
 @dataclass
 class WikipediaRequestDTO:
-    title: str  # Título del artículo solicitado
\ No newline at end of file
+    title: str  # Título del artículo solicitado
+    titles: List[str] = field(default_factory=list)  # Consulta por lotes: varios títulos a la vez
+    mode: str = WIKIPEDIA_DEFAULT_MODE  # WIKI_MODE_WIKITEXT o WIKI_MODE_EXTRACT
+    sections: List[str] = field(default_factory=list)  # Secciones a devolver ("lead" = introducción); vacío = todas
+    max_chars: int = WIKIPEDIA_MAX_CHARS  # Presupuesto de caracteres por artículo (0 = sin límite)
+    question: Optional[str] = None  # Si se indica, sólo se devuelven los pasajes más relevantes para ella
+    top_k: int = WIKIPEDIA_PASSAGES_TOP_K  # Pasajes devueltos por artículo con "question"
+
+    @property
+    def all_titles(self) -> List[str]:
+        return self.titles or [self.title]
@@ -1,5 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
+from typing import Optional
 from application.enums.status_code import StatusCode
 
 @dataclass
@@ -7,4 +8,5 @@ class WikipediaResponseDTO:
     content: str
     status: StatusCode
     message: str = "OK"
-    title: str = ""
\ No newline at end of file
+    title: str = ""
+    revid: Optional[int] = None  # Revisión de la que procede el texto
\ No newline at end of file
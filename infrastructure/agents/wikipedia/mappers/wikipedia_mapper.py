@@ -1,6 +1,11 @@
 # infrastructure/agents/wikipedia/mappers/wikipedia_mapper.py
+import json
+from typing import Dict, List, Union
+
 from infrastructure.agents.wikipedia.dtos.wikipedia_request_dto import (
     WikipediaRequestDTO,
+    WIKI_MODE_EXTRACT,
+    WIKI_MODE_WIKITEXT,
 )
 from infrastructure.agents.wikipedia.dtos.wikipedia_response_dto import (
     WikipediaResponseDTO,
@@ -8,6 +13,7 @@ from infrastructure.agents.wikipedia.dtos.wikipedia_response_dto import (
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
 from application.enums.status_code import StatusCode
+from infrastructure.agents.wikipedia.services.wiki_sections import budget_chars
 
 
 class WikipediaMapper:
@@ -22,13 +28,49 @@ class WikipediaMapper:
         4) {"kwargs": {"title": "Italia"}}
         5) {"kwargs": {"query": "Italia"}}
         6) "Italia"                            ← string directo
+        7) {"titles": ["Italia", "Francia"]}   ← consulta por lotes (también "A|B" o en kwargs)
+
+        Opciones (junto al título o dentro de kwargs):
+            "mode": "wikitext" | "extract", "sections": ["lead", "Historia"] (o "A|B"),
+            "max_chars": 2000, "max_tokens": 500,
+            "question": "¿Cuál es su capital?", "top_k": 3   ← sólo los pasajes relevantes
         """
         data = app_request.content
+        dto = WikipediaMapper._map_titles(data)
+
+        options = data if isinstance(data, dict) else {}
+        if isinstance(options.get("kwargs"), dict):
+            options = {**options["kwargs"], **{k: v for k, v in options.items() if k != "kwargs"}}
 
+        mode = options.get("mode") or dto.mode
+        if mode not in (WIKI_MODE_WIKITEXT, WIKI_MODE_EXTRACT):
+            raise ValueError(f"Modo no válido: '{mode}' (usa 'wikitext' o 'extract')")
+        dto.mode = mode
+        if options.get("sections"):
+            dto.sections = WikipediaMapper._split_titles(options["sections"])
+        # Se mira si la clave trae valor, no si es verdadera: max_chars = 0 pide "sin límite"
+        if options.get("max_chars") is not None or options.get("max_tokens") is not None:
+            dto.max_chars = budget_chars(int(options.get("max_chars") or 0), int(options.get("max_tokens") or 0))
+        if isinstance(options.get("question"), str) and options["question"].strip():
+            dto.question = options["question"].strip()
+        if options.get("top_k"):
+            dto.top_k = max(1, int(options["top_k"]))
+        return dto
+
+    @staticmethod
+    def _map_titles(data: Union[str, dict]) -> WikipediaRequestDTO:
         # Caso 6: llega un string
         if isinstance(data, str):
             return WikipediaRequestDTO(title=data)
 
+        # Caso 7: varios títulos
+        titles = data.get("titles")
+        if titles is None and isinstance(data.get("kwargs"), dict):
+            titles = data["kwargs"].get("titles")
+        if titles:
+            titles = WikipediaMapper._split_titles(titles)
+            return WikipediaRequestDTO(title=titles[0], titles=titles)
+
         # Casos 1-2
         if "title" in data:
             return WikipediaRequestDTO(title=data["title"])
@@ -49,16 +91,44 @@ class WikipediaMapper:
         raise ValueError("No se encontró el parámetro 'title' (o 'query') en la llamada")
 
     @staticmethod
-    def map_response(dto: WikipediaResponseDTO) -> AgentAppResponse:
-        # Cortamos a 20 palabras
-        words = dto.content.split()
-        truncated = " ".join(words[:20]) + ("..." if len(words) > 20 else "")
+    def _split_titles(titles: Union[str, List[str]]) -> List[str]:
+        if isinstance(titles, str):
+            titles = titles.split("|")
+        return [t.strip() for t in titles if isinstance(t, str) and t.strip()]
 
+    @staticmethod
+    def map_response(dto: WikipediaResponseDTO) -> AgentAppResponse:
+        # El agente ya recorta el texto al presupuesto pedido (max_chars / max_tokens)
         # Añadimos TERMINATE sólo en éxito
         termination_flag = " TERMINATE" if dto.status == StatusCode.SUCCESS else ""
 
         return AgentAppResponse(
-            content=f"{truncated}{termination_flag}",
+            content=f"{dto.content}{termination_flag}",
             status=dto.status,
             message=dto.message,
         )
+
+
+    @staticmethod
+    def map_batch_response(results: Dict[str, WikipediaResponseDTO]) -> AgentAppResponse:
+        """
+        Respuesta de una consulta por lotes: JSON {título solicitado: texto (o error)}.
+        Es SUCCESS si se encontró al menos un artículo.
+        """
+        found = sum(1 for dto in results.values() if dto.status == StatusCode.SUCCESS)
+        summary = {
+            requested: (
+                {"title": dto.title, "content": dto.content}
+                if dto.status == StatusCode.SUCCESS
+                else {"error": dto.message}
+            )
+            for requested, dto in results.items()
+        }
+        status = StatusCode.SUCCESS if found else StatusCode.ERROR
+        termination_flag = " TERMINATE" if found else ""
+
+        return AgentAppResponse(
+            content=json.dumps(summary, ensure_ascii=False) + termination_flag,
+            status=status,
+            message=f"{found}/{len(results)} artículos encontrados",
+        )
@@ -0,0 +1,222 @@
+# infrastructure/agents/wikipedia/services/article_cache.py
+"""
+Caché en disco de artículos de Wikipedia ya limpios.
+
+✔  Almacén SQLite con el texto comprimido (zlib) y clave por título normalizado.
+✔  Guarda el revid de la revisión de la que sale el texto: pasado el TTL se
+   revalida con una consulta barata (`rvprop=ids`, sin contenido) y, si la
+   revisión no ha cambiado, se sigue sirviendo el texto guardado.
+✔  Un acierto evita la red y el `strip_code` de mwparserfromhell.
+✔  Tamaño acotado con expulsión LRU (por último acceso) y estadísticas de aciertos.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from config.settings import (
+    WIKIPEDIA_CACHE_PATH,
+    WIKIPEDIA_CACHE_MAX_BYTES,
+    WIKIPEDIA_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+_SPACES = re.compile(r"[\s_]+")
+
+
+def normalize_title(title: str) -> str:
+    """Clave de caché: misma normalización básica que MediaWiki ('_' → ' ', primera letra en mayúscula)."""
+    title = _SPACES.sub(" ", title or "").strip()
+    return title[:1].upper() + title[1:]
+
+
+@dataclass
+class CachedArticle:
+    """
+    Artículo guardado en la caché.
+
+    Attributes:
+        key (str): Título solicitado, normalizado (más la variante, si la hay).
+        title (str): Título final del artículo (tras redirecciones).
+        revid (int, optional): Revisión de la que procede el texto.
+        content (str): Texto limpio (sin wikicódigo).
+        checked_at (float): Última vez que se descargó o revalidó.
+    """
+    key: str
+    title: str
+    revid: Optional[int]
+    content: str
+    checked_at: float
+
+
+@dataclass
+class ArticleCacheStats:
+    hits: int = 0          # servidos dentro del TTL, sin red
+    revalidated: int = 0   # revid sin cambios tras la consulta ligera
+    misses: int = 0        # descargados y limpiados de nuevo
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+
+class ArticleCache:
+    """
+    Caché de artículos limpios con revalidación por número de revisión.
+    """
+
+    def __init__(
+        self,
+        path: str = WIKIPEDIA_CACHE_PATH,
+        max_bytes: int = WIKIPEDIA_CACHE_MAX_BYTES,
+        ttl: float = WIKIPEDIA_CACHE_TTL,
+    ):
+        """
+        Args:
+            path (str): Fichero SQLite donde se guardan los artículos.
+            max_bytes (int): Tamaño máximo (comprimido) del almacén antes de expulsar entradas.
+            ttl (float): Segundos durante los que un artículo se sirve sin revalidar.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._stats = ArticleCacheStats()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                key         TEXT PRIMARY KEY,
+                title       TEXT NOT NULL,
+                revid       INTEGER,
+                content     BLOB NOT NULL,
+                checked_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size        INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles(accessed_at)")
+
+    # ─────── API PÚBLICA ───────
+    def get_many(self, titles: Iterable[str], variant: str = "") -> Dict[str, CachedArticle]:
+        """
+        Busca varios títulos de una vez.
+
+        Args:
+            variant (str): Versión del texto (modo, secciones, presupuesto...); cada una se guarda aparte.
+
+        Returns:
+            Dict[str, CachedArticle]: Entradas encontradas, por título solicitado.
+                Las que superan el TTL deben pasar por `is_fresh` / `revalidated`.
+        """
+        keys = {title: self._key(title, variant) for title in titles}
+        if not keys:
+            return {}
+        unique = list(dict.fromkeys(keys.values()))
+        placeholders = ",".join("?" * len(unique))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT key, title, revid, content, checked_at FROM articles WHERE key IN ({placeholders})",
+                unique,
+            ).fetchall()
+        found = {
+            key: CachedArticle(key, title, revid, zlib.decompress(content).decode("utf-8"), checked_at)
+            for key, title, revid, content, checked_at in rows
+        }
+        return {title: found[key] for title, key in keys.items() if key in found}
+
+    def is_fresh(self, article: CachedArticle, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - article.checked_at < self.ttl
+
+    def hit(self, article: CachedArticle) -> None:
+        """Registra un acierto dentro del TTL."""
+        self._count("hits")
+        with self._lock:
+            self._db.execute("UPDATE articles SET accessed_at = ? WHERE key = ?", (time.time(), article.key))
+        logger.debug("[ArticleCache] HIT %s", article.key)
+
+    def revalidated(self, article: CachedArticle) -> None:
+        """Registra que la revisión guardada sigue siendo la última."""
+        self._count("revalidated")
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE articles SET checked_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, article.key),
+            )
+        logger.debug("[ArticleCache] REVALIDADO %s (rev %s)", article.key, article.revid)
+
+    def miss(self) -> None:
+        self._count("misses")
+
+    def store(self, requested: str, title: str, revid: Optional[int], content: str, variant: str = "") -> None:
+        """Guarda (o reemplaza) el texto limpio de `requested`."""
+        blob = zlib.compress(content.encode("utf-8"), 6)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(key, title, revid, content, checked_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._key(requested, variant), title, revid, blob, now, now, len(blob)),
+            )
+            self._stats.stores += 1
+            self._evict()
+
+    def stats(self) -> ArticleCacheStats:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles").fetchone()
+            return ArticleCacheStats(
+                hits=self._stats.hits,
+                revalidated=self._stats.revalidated,
+                misses=self._stats.misses,
+                stores=self._stats.stores,
+                evictions=self._stats.evictions,
+                entries=entries,
+                bytes=size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM articles")
+
+    # ─────── HELPERS ───────
+    @staticmethod
+    def _key(title: str, variant: str) -> str:
+        # '#' no puede aparecer en un título de MediaWiki
+        key = normalize_title(title)
+        return f"{key}#{variant}" if variant else key
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+
+    def _evict(self) -> None:
+        """Expulsa los artículos menos usados hasta volver a `max_bytes` (requiere el lock)."""
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM articles ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM articles WHERE key = ?", (key,))
+            total -= size
+            self._stats.evictions += 1
+            logger.debug("[ArticleCache] Expulsado %s", key)
@@ -0,0 +1,127 @@
+# infrastructure/agents/wikipedia/services/dump_index.py
+"""
+Índice título → bloque de un volcado multistream de Wikipedia.
+
+✔  Tabla SQLite con clave primaria por título normalizado: cada búsqueda es
+   un acceso directo por clave, sin recorrer el volcado.
+✔  Cada entrada apunta al flujo bz2 (offset y longitud en bytes) que contiene la página.
+✔  Guarda el tamaño y la fecha del volcado indexado para detectar índices obsoletos.
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from config.settings import WIKIPEDIA_DUMP_INDEX_PATH
+
+
+@dataclass(frozen=True)
+class DumpIndexEntry:
+    """
+    Attributes:
+        title (str): Título tal y como aparece en el volcado.
+        offset (int): Posición del flujo bz2 que contiene la página.
+        length (int): Longitud en bytes de ese flujo.
+        page_id (int): Identificador de la página.
+    """
+    title: str
+    offset: int
+    length: int
+    page_id: int
+
+
+class DumpIndex:
+    """
+    Índice persistente de un volcado. Se construye una vez con el indexador
+    (`dump_indexer`) y después sólo se consulta.
+    """
+
+    def __init__(self, path: str = WIKIPEDIA_DUMP_INDEX_PATH):
+        """
+        Args:
+            path (str): Fichero SQLite del índice.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS titles (
+                key     TEXT PRIMARY KEY,
+                title   TEXT NOT NULL,
+                offset  INTEGER NOT NULL,
+                length  INTEGER NOT NULL,
+                page_id INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    # ─────── CONSULTA ───────
+    def lookup_many(self, keys: Iterable[str]) -> Dict[str, DumpIndexEntry]:
+        """Entradas de los títulos normalizados `keys` que existen en el volcado."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, DumpIndexEntry] = {}
+        # SQLite limita el número de parámetros por sentencia
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT key, title, offset, length, page_id FROM titles WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            for key, title, offset, length, page_id in rows:
+                found[key] = DumpIndexEntry(title, offset, length, page_id)
+        return found
+
+    def source(self) -> Optional[Tuple[int, float]]:
+        """(tamaño, mtime) del volcado indexado, o None si el índice está vacío."""
+        with self._lock:
+            rows = dict(self._db.execute("SELECT name, value FROM meta").fetchall())
+        if "dump_size" not in rows:
+            return None
+        return int(rows["dump_size"]), float(rows["dump_mtime"])
+
+    def matches(self, dump_path: str) -> bool:
+        """True si el índice se construyó a partir del fichero `dump_path` actual."""
+        stat = os.stat(dump_path)
+        return self.source() == (stat.st_size, stat.st_mtime)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    # ─────── CONSTRUCCIÓN ───────
+    def rebuild(self, dump_path: str, rows: Iterable[Tuple[str, str, int, int, int]]) -> int:
+        """
+        Sustituye el índice completo en una sola transacción.
+
+        Args:
+            dump_path (str): Volcado indexado (se guardan su tamaño y fecha).
+            rows: Tuplas (clave, título, offset, longitud, page_id).
+
+        Returns:
+            int: Número de títulos indexados.
+        """
+        stat = os.stat(dump_path)
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM titles")
+                self._db.execute("DELETE FROM meta")
+                self._db.executemany("INSERT OR IGNORE INTO titles VALUES (?, ?, ?, ?, ?)", rows)
+                self._db.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [("dump_size", str(stat.st_size)), ("dump_mtime", repr(stat.st_mtime))],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            return self._db.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
@@ -0,0 +1,133 @@
+# infrastructure/agents/wikipedia/services/dump_indexer.py
+"""
+Indexador de volcados multistream de Wikipedia (`*-pages-articles-multistream.xml.bz2`).
+
+Un volcado multistream es una concatenación de flujos bz2 independientes de
+~100 páginas cada uno, así que cualquier página se puede leer descomprimiendo
+sólo su flujo. Este job construye, una sola vez, el índice título → (offset,
+longitud, page_id) que usa WikipediaDumpReader.
+
+✔  Con el fichero `*-multistream-index.txt.bz2` oficial (`offset:page_id:título`)
+   no hace falta descomprimir el volcado: basta con leer el índice.
+✔  Sin él, recorre el volcado flujo a flujo y extrae los títulos de cada uno.
+
+Uso:
+    python -m infrastructure.agents.wikipedia.services.dump_indexer DUMP [--index-file F] [--db INDICE]
+"""
+
+import argparse
+import bz2
+import html
+import logging
+import os
+import re
+import time
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from config.settings import WIKIPEDIA_DUMP_PATH, WIKIPEDIA_DUMP_INDEX_PATH
+from infrastructure.agents.wikipedia.services.article_cache import normalize_title
+from infrastructure.agents.wikipedia.services.dump_index import DumpIndex
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+_PAGE_HEADER = re.compile(rb"<title>(.*?)</title>\s*<ns>-?\d+</ns>\s*<id>(\d+)</id>", re.S)
+
+IndexRow = Tuple[str, str, int, int, int]
+
+
+def iter_streams(fp: BinaryIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Tuple[int, int, bytes]]:
+    """
+    Recorre los flujos bz2 concatenados de `fp`.
+
+    Yields:
+        (offset, longitud comprimida, contenido descomprimido) de cada flujo.
+    """
+    decompressor = bz2.BZ2Decompressor()
+    parts = []
+    start = 0      # offset del flujo en curso
+    position = 0   # offset del primer byte de `data`
+    while True:
+        data = fp.read(chunk_size)
+        if not data:
+            break
+        while data:
+            parts.append(decompressor.decompress(data))
+            if not decompressor.eof:
+                position += len(data)
+                break
+            end = position + len(data) - len(decompressor.unused_data)
+            yield start, end - start, b"".join(parts)
+            data = decompressor.unused_data
+            start = position = end
+            decompressor = bz2.BZ2Decompressor()
+            parts = []
+
+
+def rows_from_dump(dump_path: str) -> Iterator[IndexRow]:
+    """Filas del índice leyendo los títulos de cada flujo del volcado."""
+    with open(dump_path, "rb") as fp:
+        for offset, length, xml in iter_streams(fp):
+            for title, page_id in _PAGE_HEADER.findall(xml):
+                title = html.unescape(title.decode("utf-8"))
+                yield normalize_title(title), title, offset, length, int(page_id)
+
+
+def rows_from_index_file(index_path: str, dump_path: str) -> Iterator[IndexRow]:
+    """
+    Filas del índice a partir del fichero `offset:page_id:título` oficial.
+    La longitud de cada flujo es la distancia hasta el siguiente offset (el
+    fichero viene ordenado por offset, así que sólo se retiene un flujo en memoria).
+    """
+    opener = bz2.open if index_path.endswith(".bz2") else open
+    block, block_offset = [], None
+    with opener(index_path, "rt", encoding="utf-8") as fp:
+        for line in fp:
+            offset, page_id, title = line.rstrip("\n").split(":", 2)
+            offset = int(offset)
+            if offset != block_offset:
+                yield from _block_rows(block, block_offset, offset)
+                block, block_offset = [], offset
+            block.append((int(page_id), title))
+    yield from _block_rows(block, block_offset, os.path.getsize(dump_path))
+
+
+def _block_rows(block, offset: Optional[int], end: int) -> Iterator[IndexRow]:
+    for page_id, title in block:
+        yield normalize_title(title), title, offset, end - offset, page_id
+
+
+def build_index(dump_path: str, index_db: str = WIKIPEDIA_DUMP_INDEX_PATH, index_file: Optional[str] = None) -> int:
+    """
+    Construye (o reconstruye) el índice de `dump_path`.
+
+    Args:
+        dump_path (str): Volcado multistream .xml.bz2.
+        index_db (str): Fichero SQLite de salida.
+        index_file (str, optional): Índice multistream oficial; evita descomprimir el volcado.
+
+    Returns:
+        int: Número de títulos indexados.
+    """
+    rows = rows_from_index_file(index_file, dump_path) if index_file else rows_from_dump(dump_path)
+    return DumpIndex(index_db).rebuild(dump_path, rows)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Indexa un volcado multistream de Wikipedia.")
+    parser.add_argument("dump", nargs="?", default=WIKIPEDIA_DUMP_PATH, help="Volcado *-multistream.xml.bz2")
+    parser.add_argument("--index-file", help="Índice oficial *-multistream-index.txt(.bz2), opcional")
+    parser.add_argument("--db", default=WIKIPEDIA_DUMP_INDEX_PATH, help="Fichero SQLite del índice")
+    args = parser.parse_args(argv)
+
+    if not args.dump:
+        parser.error("Indica el volcado (o define WIKIPEDIA_DUMP_PATH)")
+
+    started = time.perf_counter()
+    count = build_index(args.dump, args.db, args.index_file)
+    print(f"[DumpIndexer] {count} títulos indexados en {time.perf_counter() - started:.1f}s → {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# infrastructure/agents/wikipedia/services/passage_index.py
+"""
+Recuperación de pasajes dentro de un artículo (BM25).
+
+✔  Trocea el texto limpio en pasajes de tamaño acotado (párrafos y, si hace falta, frases).
+✔  Índice BM25 en memoria por artículo: sólo los k pasajes más relevantes para
+   la pregunta llegan al contexto del LLM, no el artículo entero.
+✔  Los índices se conservan en un LRU por (título, hash del texto): dos selecciones
+   de secciones de la misma revisión no comparten índice, y una nueva revisión
+   (texto distinto) construye el suyo.
+"""
+
+import hashlib
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Hashable, List, Tuple
+
+from config.settings import WIKIPEDIA_PASSAGE_CHARS, WIKIPEDIA_PASSAGE_INDEX_CACHE
+
+_WORD = re.compile(r"\w+")
+_PARAGRAPHS = re.compile(r"\n\s*\n")
+_SENTENCES = re.compile(r"(?<=[.!?…])\s+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Palabras en minúsculas y sin tildes ("Economía" → "economia")."""
+    folded = unicodedata.normalize("NFKD", text.lower())
+    return _WORD.findall("".join(c for c in folded if not unicodedata.combining(c)))
+
+
+def chunk_passages(text: str, max_chars: int = WIKIPEDIA_PASSAGE_CHARS) -> List[str]:
+    """
+    Agrupa párrafos consecutivos en pasajes de hasta `max_chars`; los párrafos
+    más largos se parten por frases.
+    """
+    pieces = []
+    for paragraph in _PARAGRAPHS.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(s for s in _SENTENCES.split(paragraph) if s)
+
+    passages, current = [], ""
+    for piece in pieces:
+        if current and len(current) + len(piece) + 1 > max_chars:
+            passages.append(current)
+            current = ""
+        current = f"{current}\n{piece}" if current else piece
+    if current:
+        passages.append(current)
+    return passages
+
+
+class BM25Index:
+    """
+    Índice BM25 (Okapi) sobre los pasajes de un artículo.
+    """
+
+    def __init__(self, passages: List[str], k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            passages (List[str]): Pasajes a indexar.
+            k1 (float): Saturación de la frecuencia de término.
+            b (float): Peso de la normalización por longitud del pasaje.
+        """
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+        self._term_freqs = [Counter(tokenize(p)) for p in passages]
+        self._lengths = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_length = (sum(self._lengths) / len(passages)) if passages else 0.0
+        doc_freqs = Counter(term for tf in self._term_freqs for term in tf)
+        count = len(passages)
+        self._idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items()
+        }
+
+    def search(self, query: str, k: int) -> List[Tuple[float, str]]:
+        """
+        Returns:
+            List[(puntuación, pasaje)]: Hasta `k` pasajes con algún término de la pregunta, de mayor a menor.
+                Si ninguno comparte términos con la pregunta, los `k` primeros
+                (la introducción) con puntuación 0.
+        """
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        scores = [0.0] * len(self.passages)
+        for i, (tf, length) in enumerate(zip(self._term_freqs, self._lengths)):
+            norm = self.k1 * (1 - self.b + self.b * length / self._avg_length) if self._avg_length else self.k1
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    scores[i] += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+
+        ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))[:max(0, k)]
+        if ranked and scores[ranked[0]] > 0:
+            ranked = [i for i in ranked if scores[i] > 0]
+        return [(scores[i], self.passages[i]) for i in ranked]
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+
+class PassageIndexCache:
+    """
+    LRU en memoria de índices BM25, uno por texto de artículo.
+
+    No se guarda con el artículo en ArticleCache: es un derivado del texto que se
+    reconstruye en unas decenas de milisegundos, también sirve con la caché desactivada y así la
+    caché persistente no depende del formato del índice.
+    """
+
+    def __init__(self, max_entries: int = WIKIPEDIA_PASSAGE_INDEX_CACHE, passage_chars: int = WIKIPEDIA_PASSAGE_CHARS):
+        self.max_entries = max(1, max_entries)
+        self.passage_chars = passage_chars
+        self._indexes: "OrderedDict[Hashable, BM25Index]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, title: str, text: str) -> BM25Index:
+        """Índice del texto `text` del artículo `title` (se construye si no está)."""
+        # El texto depende de la revisión y de las secciones pedidas: se identifica por su hash
+        key = (title, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+
+        index = BM25Index(chunk_passages(text, self.passage_chars))
+        with self._lock:
+            self._indexes[key] = index
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
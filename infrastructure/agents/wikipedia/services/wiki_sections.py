@@ -0,0 +1,120 @@
+# infrastructure/agents/wikipedia/services/wiki_sections.py
+"""
+Limpieza de artículos por secciones y con presupuesto de caracteres.
+
+✔  Parte el texto por encabezados (`== Historia ==`) con una expresión regular,
+   sin tokenizar el artículo: vale para wikitexto y para extractos en texto plano.
+✔  Sólo se pasan por mwparserfromhell las secciones pedidas, en orden, y se deja
+   de limpiar en cuanto se llena el presupuesto.
+✔  Recorte final en un límite de frase (o de palabra) dentro del presupuesto.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, List
+
+# Nombre reservado para la introducción (el texto anterior al primer encabezado)
+LEAD_SECTION = "lead"
+
+# Aproximación usada para convertir un presupuesto en tokens a caracteres
+CHARS_PER_TOKEN = 4
+
+_HEADING = re.compile(r"^(={2,6})[ \t]*(.+?)[ \t]*\1[ \t]*$", re.M)
+_SENTENCE_END = re.compile(r"[.!?…](?=\s|$)")
+
+
+@dataclass
+class Section:
+    """
+    Attributes:
+        title (str): Encabezado ("lead" para la introducción).
+        level (int): Nivel del encabezado (1 para la introducción, 2 para "==", ...).
+        body (str): Texto de la sección sin el encabezado ni sus subsecciones.
+    """
+    title: str
+    level: int
+    body: str
+
+
+def split_sections(text: str) -> List[Section]:
+    """Secciones de `text` en orden de aparición, empezando por la introducción."""
+    sections = []
+    position, title, level = 0, LEAD_SECTION, 1
+    for match in _HEADING.finditer(text):
+        sections.append(Section(title, level, text[position:match.start()]))
+        position, title, level = match.end(), _strip_markup(match.group(2)), len(match.group(1))
+    sections.append(Section(title, level, text[position:]))
+    return sections
+
+
+def select_sections(sections: List[Section], wanted: Iterable[str]) -> List[Section]:
+    """
+    Secciones cuyo encabezado coincide (sin distinguir mayúsculas) con alguno de
+    `wanted`, junto con sus subsecciones. Sin `wanted` se devuelven todas.
+    """
+    names = {name.strip().lower() for name in wanted if name and name.strip()}
+    if not names:
+        return sections
+
+    selected, inside_level = [], None
+    for section in sections:
+        if inside_level is not None and section.level > inside_level:
+            selected.append(section)
+            continue
+        inside_level = None
+        if section.title.lower() in names:
+            selected.append(section)
+            # La introducción no tiene subsecciones: lo que sigue son secciones del artículo
+            inside_level = section.level if section.title != LEAD_SECTION else None
+    return selected
+
+
+def clean_sections(
+    text: str,
+    wanted: Iterable[str],
+    max_chars: int,
+    clean: Callable[[str], str],
+) -> str:
+    """
+    Limpia sólo las secciones pedidas hasta llenar `max_chars`.
+
+    Args:
+        text (str): Wikitexto (o texto plano con encabezados "== ... ==").
+        wanted (Iterable[str]): Secciones a incluir ("lead" = introducción); vacío = todas.
+        max_chars (int): Presupuesto de caracteres (0 = sin límite).
+        clean (Callable): Conversión de cada trozo a texto plano (p.ej. strip_code).
+    """
+    parts, used = [], 0
+    for section in select_sections(split_sections(text), wanted):
+        body = clean(section.body).strip()
+        if section.title != LEAD_SECTION:
+            body = f"{section.title}\n{body}" if body else ""
+        if not body:
+            continue
+        parts.append(body)
+        used += len(body) + 2
+        if max_chars and used >= max_chars:
+            break
+    return cap_text("\n\n".join(parts), max_chars)
+
+
+def cap_text(text: str, max_chars: int) -> str:
+    """Recorta `text` a `max_chars` en el último final de frase (o palabra) posible."""
+    if not max_chars or len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    sentence_ends = [m.end() for m in _SENTENCE_END.finditer(cut)]
+    if sentence_ends and sentence_ends[-1] > max_chars // 2:
+        return cut[:sentence_ends[-1]]
+    space = cut.rfind(" ")
+    return (cut[:space] if space > max_chars // 2 else cut[:max_chars - 1]).rstrip() + "…"
+
+
+def budget_chars(max_chars: int = 0, max_tokens: int = 0) -> int:
+    """Presupuesto en caracteres a partir de un límite de caracteres y/o de tokens (el menor)."""
+    limits = [limit for limit in (max_chars, max_tokens * CHARS_PER_TOKEN) if limit and limit > 0]
+    return min(limits) if limits else 0
+
+
+def _strip_markup(heading: str) -> str:
+    return re.sub(r"\[\[(?:[^|\]]*\|)?([^\]]*)\]\]|'{2,}", r"\1", heading).strip()
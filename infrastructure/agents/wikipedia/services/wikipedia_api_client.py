@@ -0,0 +1,186 @@
+# infrastructure/agents/wikipedia/services/wikipedia_api_client.py
+"""
+Cliente por lotes de la API de MediaWiki.
+
+✔  Hasta 50 títulos por consulta (`titles=A|B|C`), en lugar de una petición por título.
+✔  Normalización y redirecciones resueltas en el servidor (`redirects=1`): no hace
+   falta parsear "#REDIRECT" en local ni repetir la petición por cada salto.
+✔  Sigue la continuación (`rvcontinue`) cuando la respuesta supera el tamaño máximo.
+✔  Devuelve un WikiPage por título solicitado, exista o no.
+✔  Consulta ligera de revisiones (`rvprop=ids`, sin contenido) para revalidar la caché.
+✔  Extractos en texto plano generados por el servidor (`prop=extracts`), sin
+   descargar ni parsear el wikitexto.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import WIKIPEDIA_API_URL, WIKIPEDIA_TIMEOUT, WIKIPEDIA_BATCH_SIZE
+from infrastructure.agents.wikipedia.dtos.wiki_page_dto import WikiPage
+from infrastructure.http.http_transport import HttpTransport
+
+logger = logging.getLogger(__name__)
+
+# Saltos de redirección que se siguen como máximo dentro del mapa devuelto por la API
+MAX_REDIRECT_DEPTH = 3
+
+# TextExtracts limita los extractos por consulta (exlimit) y `exchars` a 1200
+MAX_EXTRACTS_PER_QUERY = 20
+MAX_EXTRACT_CHARS = 1200
+
+
+class WikipediaApiClient:
+    """
+    Descarga el wikitexto de la última revisión de varios artículos a la vez.
+    """
+
+    def __init__(
+        self,
+        transport: HttpTransport,
+        api_url: str = WIKIPEDIA_API_URL,
+        batch_size: int = WIKIPEDIA_BATCH_SIZE,
+        timeout: float = WIKIPEDIA_TIMEOUT,
+    ):
+        """
+        Args:
+            transport (HttpTransport): Transporte HTTP compartido.
+            api_url (str): Endpoint api.php de la wiki.
+            batch_size (int): Títulos por consulta (máximo 50 en MediaWiki).
+            timeout (float): Timeout de cada petición en segundos.
+        """
+        self.transport = transport
+        self.api_url = api_url
+        self.batch_size = max(1, min(batch_size, 50))
+        self.timeout = timeout
+
+    def fetch_pages(self, titles: Iterable[str]) -> Dict[str, WikiPage]:
+        """
+        Args:
+            titles (Iterable[str]): Títulos a consultar (los repetidos se piden una vez).
+
+        Returns:
+            Dict[str, WikiPage]: Un resultado por título solicitado, en el orden recibido.
+
+        Raises:
+            requests.RequestException: Si alguna petición a la API falla.
+        """
+        return self._fetch(titles, {"prop": "revisions", "rvprop": "ids|content", "rvslots": "main"})
+
+    def fetch_revisions(self, titles: Iterable[str]) -> Dict[str, WikiPage]:
+        """
+        Igual que `fetch_pages`, pero sólo con el revid de la última revisión
+        (`wikitext` vacío): basta para saber si un artículo guardado sigue vigente.
+
+        Raises:
+            requests.RequestException: Si alguna petición a la API falla.
+        """
+        return self._fetch(titles, {"prop": "revisions", "rvprop": "ids"})
+
+    def fetch_extracts(
+        self,
+        titles: Iterable[str],
+        intro_only: bool = False,
+        max_chars: int = 0,
+    ) -> Dict[str, WikiPage]:
+        """
+        Texto plano de los artículos generado por el servidor (en `WikiPage.extract`),
+        con los encabezados en formato "== Sección ==" y el revid de la revisión.
+
+        Args:
+            intro_only (bool): Sólo la introducción (`exintro`).
+            max_chars (int): Si no supera 1200, el servidor ya corta el extracto (`exchars`).
+
+        Raises:
+            requests.RequestException: Si alguna petición a la API falla.
+        """
+        props = {
+            "prop": "extracts|revisions",
+            "rvprop": "ids",
+            "explaintext": "1",
+            "exsectionformat": "wiki",
+            "exlimit": "max",
+        }
+        if intro_only:
+            props["exintro"] = "1"
+        if 0 < max_chars <= MAX_EXTRACT_CHARS:
+            props["exchars"] = str(max_chars)
+        return self._fetch(titles, props, batch_size=min(self.batch_size, MAX_EXTRACTS_PER_QUERY))
+
+    # ─────── HELPERS ───────
+    def _fetch(self, titles: Iterable[str], props: Dict[str, str], batch_size: Optional[int] = None) -> Dict[str, WikiPage]:
+        batch_size = batch_size or self.batch_size
+        requested = list(dict.fromkeys(t.strip() for t in titles if t and t.strip()))
+        results: Dict[str, WikiPage] = {}
+        for start in range(0, len(requested), batch_size):
+            batch = requested[start:start + batch_size]
+            results.update(self._fetch_batch(batch, props))
+        return results
+
+    def _fetch_batch(self, titles: List[str], props: Dict[str, str]) -> Dict[str, WikiPage]:
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "titles": "|".join(titles),
+            "redirects": "1",
+            **props,
+        }
+        normalized: Dict[str, str] = {}
+        redirects: Dict[str, str] = {}
+        pages: Dict[str, dict] = {}
+
+        # Con artículos grandes (o muchos extractos) la API reparte el contenido en varias respuestas
+        while True:
+            response = self.transport.get(self.api_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            if "error" in data:
+                raise ValueError(data["error"].get("info", "Error de la API de Wikipedia"))
+
+            query = data.get("query", {})
+            normalized.update({n["from"]: n["to"] for n in query.get("normalized", [])})
+            redirects.update({r["from"]: r["to"] for r in query.get("redirects", [])})
+            for page in query.get("pages", []):
+                # Cada respuesta completa campos distintos (revisions, extract...) de la misma página
+                merged = pages.setdefault(page["title"], {})
+                merged.update({key: value for key, value in page.items() if value or key not in merged})
+
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+        logger.debug(
+            "[WikipediaApiClient] %d títulos → %d páginas (%d redirecciones)",
+            len(titles), len(pages), len(redirects),
+        )
+        return {title: self._resolve(title, normalized, redirects, pages) for title in titles}
+
+    @staticmethod
+    def _resolve(
+        requested: str,
+        normalized: Dict[str, str],
+        redirects: Dict[str, str],
+        pages: Dict[str, dict],
+    ) -> WikiPage:
+        title = normalized.get(requested, requested)
+        redirected_from: Optional[str] = None
+        for _ in range(MAX_REDIRECT_DEPTH):
+            if title not in redirects:
+                break
+            redirected_from = redirected_from or title
+            title = redirects[title]
+
+        page = pages.get(title)
+        if page is None or page.get("missing") or page.get("invalid"):
+            return WikiPage(requested=requested, title=title, missing=True, redirected_from=redirected_from)
+
+        revision = (page.get("revisions") or [{}])[0]
+        return WikiPage(
+            requested=requested,
+            title=title,
+            pageid=page.get("pageid"),
+            revid=revision.get("revid"),
+            wikitext=revision.get("slots", {}).get("main", {}).get("content", ""),
+            extract=page.get("extract"),
+            redirected_from=redirected_from,
+        )
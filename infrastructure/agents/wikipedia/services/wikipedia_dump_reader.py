@@ -0,0 +1,176 @@
+# infrastructure/agents/wikipedia/services/wikipedia_dump_reader.py
+"""
+Lectura de artículos desde un volcado multistream local, sin red.
+
+✔  Busca el título en el índice (acceso por clave) y descomprime sólo el
+   flujo bz2 de ~100 páginas que lo contiene.
+✔  Los títulos de un lote que caen en el mismo flujo se leen con una sola descompresión,
+   y los últimos flujos leídos se conservan en memoria (LRU).
+✔  Sigue las redirecciones del volcado (`<redirect title=...>`).
+✔  Misma interfaz que WikipediaApiClient (`fetch_pages` / `fetch_revisions`).
+"""
+
+import bz2
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from config.settings import WIKIPEDIA_DUMP_PATH, WIKIPEDIA_DUMP_BLOCK_CACHE
+from infrastructure.agents.wikipedia.dtos.wiki_page_dto import WikiPage
+from infrastructure.agents.wikipedia.services.article_cache import normalize_title
+from infrastructure.agents.wikipedia.services.dump_index import DumpIndex
+from infrastructure.agents.wikipedia.services.wikipedia_api_client import MAX_REDIRECT_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _DumpPage:
+    title: str
+    page_id: int
+    revid: Optional[int]
+    wikitext: str
+    redirect: Optional[str]
+
+
+class WikipediaDumpReader:
+    """
+    Artículos servidos desde un volcado `*-pages-articles-multistream.xml.bz2` ya indexado.
+    """
+
+    def __init__(
+        self,
+        dump_path: str = WIKIPEDIA_DUMP_PATH,
+        index: Optional[DumpIndex] = None,
+        block_cache: int = WIKIPEDIA_DUMP_BLOCK_CACHE,
+    ):
+        """
+        Args:
+            dump_path (str): Volcado multistream.
+            index (DumpIndex, optional): Índice construido con `dump_indexer` (por defecto, el configurado).
+            block_cache (int): Flujos descomprimidos que se conservan en memoria.
+        """
+        self.dump_path = dump_path
+        self.index = index or DumpIndex()
+        self._file = None
+        self._lock = threading.Lock()
+        self._read_block = lru_cache(maxsize=max(1, block_cache))(self._parse_block)
+
+    def fetch_pages(self, titles: Iterable[str]) -> Dict[str, WikiPage]:
+        """
+        Args:
+            titles (Iterable[str]): Títulos a consultar (los repetidos se leen una vez).
+
+        Returns:
+            Dict[str, WikiPage]: Un resultado por título solicitado, en el orden recibido.
+
+        Raises:
+            RuntimeError: Si no hay volcado configurado o el índice no corresponde a él.
+        """
+        self._ensure_open()
+        requested = list(dict.fromkeys(t.strip() for t in titles if t and t.strip()))
+        results: Dict[str, WikiPage] = {}
+        redirected_from: Dict[str, str] = {}
+        pending = {title: normalize_title(title) for title in requested}
+
+        for depth in range(MAX_REDIRECT_DEPTH + 1):
+            pages = self._load(pending.values())
+            next_pending = {}
+            for requested_title, key in pending.items():
+                page = pages.get(key)
+                if page is None:
+                    results[requested_title] = WikiPage(
+                        requested=requested_title,
+                        title=key,
+                        missing=True,
+                        redirected_from=redirected_from.get(requested_title),
+                    )
+                elif page.redirect and depth < MAX_REDIRECT_DEPTH:
+                    redirected_from.setdefault(requested_title, page.title)
+                    next_pending[requested_title] = normalize_title(page.redirect.split("#", 1)[0])
+                else:
+                    results[requested_title] = WikiPage(
+                        requested=requested_title,
+                        title=page.title,
+                        pageid=page.page_id,
+                        revid=page.revid,
+                        wikitext=page.wikitext,
+                        redirected_from=redirected_from.get(requested_title),
+                    )
+            pending = next_pending
+            if not pending:
+                break
+
+        return {title: results[title] for title in requested}
+
+    def fetch_revisions(self, titles: Iterable[str]) -> Dict[str, WikiPage]:
+        """
+        El revid sale del mismo flujo que el texto, así que en local cuesta lo
+        mismo que `fetch_pages` (y el flujo suele estar ya en el LRU).
+        """
+        return self.fetch_pages(titles)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._read_block.cache_clear()
+
+    # ─────── HELPERS ───────
+    def _ensure_open(self) -> None:
+        if self._file is not None:
+            return
+        if not self.dump_path:
+            raise RuntimeError("No hay volcado de Wikipedia configurado (WIKIPEDIA_DUMP_PATH)")
+        if not self.index.matches(self.dump_path):
+            raise RuntimeError(
+                f"El índice {self.index.path} no corresponde a {self.dump_path}: "
+                "ejecuta dump_indexer para reconstruirlo"
+            )
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.dump_path, "rb")
+
+    def _load(self, keys: Iterable[str]) -> Dict[str, _DumpPage]:
+        """Páginas de los títulos `keys`, descomprimiendo cada flujo implicado una sola vez."""
+        entries = self.index.lookup_many(keys)
+        blocks = defaultdict(list)
+        for key, entry in entries.items():
+            blocks[(entry.offset, entry.length)].append(key)
+
+        pages: Dict[str, _DumpPage] = {}
+        for (offset, length), keys_in_block in blocks.items():
+            block = self._read_block(offset, length)
+            for key in keys_in_block:
+                page = block.get(entries[key].title)
+                if page is not None:
+                    pages[key] = page
+        logger.debug("[WikipediaDumpReader] %d títulos en %d flujos", len(entries), len(blocks))
+        return pages
+
+    def _parse_block(self, offset: int, length: int) -> Dict[str, _DumpPage]:
+        with self._lock:
+            self._file.seek(offset)
+            data = self._file.read(length)
+        xml = bz2.decompress(data).replace(b"</mediawiki>", b"")
+        root = ET.fromstring(b"<pages>" + xml + b"</pages>")
+
+        pages = {}
+        for node in root.iter("page"):
+            title = node.findtext("title", "")
+            redirect = node.find("redirect")
+            revision = node.find("revision")
+            revid = revision.findtext("id") if revision is not None else None
+            pages[title] = _DumpPage(
+                title=title,
+                page_id=int(node.findtext("id", "0")),
+                revid=int(revid) if revid else None,
+                wikitext=(revision.findtext("text") or "") if revision is not None else "",
+                redirect=redirect.get("title") if redirect is not None else None,
+            )
+        return pages
@@ -1,5 +1,9 @@
 # infrastructure/agents/wikipedia/wikipedia_agent.py
 
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
 import requests
 import mwparserfromhell
 
@@ -7,14 +11,41 @@ from application.interfaces.agent_interface import AgentInterface
 from application.enums.status_code import StatusCode
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
-from infrastructure.agents.wikipedia.dtos.wikipedia_request_dto import WikipediaRequestDTO
+from infrastructure.agents.wikipedia.dtos.wikipedia_request_dto import (
+    WikipediaRequestDTO,
+    WIKI_MODE_EXTRACT,
+)
 from infrastructure.agents.wikipedia.dtos.wikipedia_response_dto import WikipediaResponseDTO
+from infrastructure.agents.wikipedia.dtos.wiki_page_dto import WikiPage
 from infrastructure.agents.wikipedia.mappers.wikipedia_mapper import WikipediaMapper
+from infrastructure.agents.wikipedia.services.article_cache import ArticleCache, ArticleCacheStats, CachedArticle
+from infrastructure.agents.wikipedia.services.wikipedia_api_client import WikipediaApiClient
+from infrastructure.agents.wikipedia.services.wikipedia_dump_reader import WikipediaDumpReader
+from infrastructure.agents.wikipedia.services.wiki_sections import LEAD_SECTION, cap_text, clean_sections
+from infrastructure.agents.wikipedia.services.passage_index import PassageIndexCache
+from infrastructure.http.http_transport import get_shared_transport
+from config.settings import (
+    WIKIPEDIA_CACHE_ENABLED,
+    WIKIPEDIA_BACKEND,
+    WIKIPEDIA_DEFAULT_MODE,
+    WIKIPEDIA_MAX_CHARS,
+    WIKIPEDIA_PASSAGES_TOP_K,
+)
 
+logger = logging.getLogger(__name__)
 
-MAX_REDIRECT_DEPTH = 3
 
 class WikipediaAgent(AgentInterface):
+    def __init__(self):
+        self._transport = get_shared_transport()
+        # "dump": artículos desde el volcado local indexado; "api": API de MediaWiki
+        if WIKIPEDIA_BACKEND == "dump":
+            self._client = WikipediaDumpReader()
+        else:
+            self._client = WikipediaApiClient(self._transport)
+        self._cache = ArticleCache() if WIKIPEDIA_CACHE_ENABLED else None
+        self._passages = PassageIndexCache()
+
     @classmethod
     def get_function_name(cls) -> str:
         return "wikipedia_search"
@@ -32,9 +63,30 @@ class WikipediaAgent(AgentInterface):
                 "parameters": {
                     "type": "object",
                     "properties": {
-                        "title": {"type": "string", "description": "Título del artículo de Wikipedia"}
+                        "title": {"type": "string", "description": "Título del artículo de Wikipedia"},
+                        "titles": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Varios títulos a consultar de una vez (en lugar de 'title')"
+                        },
+                        "mode": {
+                            "type": "string",
+                            "enum": ["wikitext", "extract"],
+                            "description": "'extract' pide el texto plano ya generado por Wikipedia (más ligero)"
+                        },
+                        "sections": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Secciones a devolver, p.ej. [\"lead\"] para la introducción (opcional; por defecto, todas)"
+                        },
+                        "max_chars": {"type": "integer", "description": "Máximo de caracteres por artículo (opcional)"},
+                        "max_tokens": {"type": "integer", "description": "Máximo aproximado de tokens por artículo (opcional)"},
+                        "question": {
+                            "type": "string",
+                            "description": "Pregunta concreta: devuelve sólo los pasajes del artículo que la responden (recomendado)"
+                        },
+                        "top_k": {"type": "integer", "description": "Pasajes a devolver con 'question' (opcional)"}
                     },
-                    "required": ["title"],
                     # "additionalProperties": False          # ⬅️ esto impide 'search', 'kwargs', etc.
                 }
             }
@@ -44,7 +96,16 @@ class WikipediaAgent(AgentInterface):
         print(f"Agente wikipedia recibe datos para buscar: {request}")
         try:
             internal_request = WikipediaMapper.map_request(request)
-            response = self._search(internal_request, depth=0)
+            if internal_request.titles:
+                return WikipediaMapper.map_batch_response(self.lookup(
+                    internal_request.titles,
+                    mode=internal_request.mode,
+                    sections=internal_request.sections,
+                    max_chars=internal_request.max_chars,
+                    question=internal_request.question,
+                    top_k=internal_request.top_k,
+                ))
+            response = self._search(internal_request)
             return WikipediaMapper.map_response(response)
         except Exception as e:
             return AgentAppResponse(
@@ -53,73 +114,195 @@ class WikipediaAgent(AgentInterface):
                 message=str(e)
             )
 
-    def _search(self, request: WikipediaRequestDTO, depth: int = 0) -> WikipediaResponseDTO:
-        if depth > MAX_REDIRECT_DEPTH:
-            return WikipediaResponseDTO(
-                content="",
-                status=StatusCode.ERROR,
-                message=f"Profundidad máxima de redirección alcanzada ({MAX_REDIRECT_DEPTH})"
-            )
+    def lookup(
+        self,
+        titles: List[str],
+        mode: str = WIKIPEDIA_DEFAULT_MODE,
+        sections: Sequence[str] = (),
+        max_chars: int = WIKIPEDIA_MAX_CHARS,
+        question: Optional[str] = None,
+        top_k: int = WIKIPEDIA_PASSAGES_TOP_K,
+    ) -> Dict[str, WikipediaResponseDTO]:
+        """
+        Resuelve varios títulos con el mínimo de peticiones (hasta 50 por consulta,
+        redirecciones incluidas). Los artículos de la caché no se descargan ni se
+        vuelven a limpiar; los caducados sólo se revalidan por revid.
 
+        Args:
+            titles (List[str]): Títulos a consultar.
+            mode (str): WIKI_MODE_WIKITEXT (limpieza local) o WIKI_MODE_EXTRACT (texto plano del servidor).
+            sections (Sequence[str]): Secciones a devolver ("lead" = introducción); vacío = todas.
+            max_chars (int): Presupuesto de caracteres por artículo (0 = sin límite).
+            question (str, optional): Con pregunta, de cada artículo sólo se devuelven
+                los `top_k` pasajes más relevantes (BM25), dentro del presupuesto.
+            top_k (int): Pasajes por artículo cuando hay `question`.
+
+        Returns:
+            Dict[str, WikipediaResponseDTO]: Resultado por título solicitado.
+        """
+        requested = list(dict.fromkeys(t.strip() for t in titles if t and t.strip()))
+        sections = [s.strip() for s in sections if s and s.strip()]
+        question = (question or "").strip()
+        # Con pregunta se indexa el artículo (o las secciones) completo; el presupuesto se aplica a los pasajes
+        budget, max_chars = max_chars, (0 if question else max_chars)
+        # Cada combinación de modo, secciones y presupuesto se guarda por separado
+        variant = f"{mode}|{'|'.join(s.lower() for s in sections)}|{max_chars}"
+        results: Dict[str, WikipediaResponseDTO] = {}
+        pending = requested
         try:
-            response = requests.get(
-                url="https://en.wikipedia.org/w/api.php", 
-                params={
-                    "action": "query",
-                    "format": "json",
-                    "titles": request.title,
-                    "prop": "revisions",
-                    "rvprop": "content",
-                    "rvslots": "main"
-                },
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            if self._cache is not None:
+                results, pending = self._from_cache(requested, variant)
+            if pending:
+                for title, page in self._fetch(pending, mode, sections, max_chars).items():
+                    results[title] = self._to_response(page, sections, max_chars)
+                    if self._cache is not None and results[title].status == StatusCode.SUCCESS:
+                        self._cache.store(title, page.title, page.revid, results[title].content, variant)
+
+        except requests.RequestException as e:
+            results.update(self._all_failed(pending, f"Error en la llamada a Wikipedia: {str(e)}"))
 
-            page = next(iter(data["query"]["pages"].values()))
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            results.update(self._all_failed(pending, "Formato de respuesta no válido de Wikipedia"))
 
-            if "revisions" not in page or not page["revisions"]:
-                raise ValueError(f"No se encontró contenido para '{request.title}'")
+        except Exception as e:
+            results.update(self._all_failed(pending, f"Error inesperado: {str(e)}"))
 
-            wikitext = page["revisions"][0].get("slots", {}).get("main", {}).get("*") \
-                     or page["revisions"][0].get("*")
+        if question:
+            for dto in results.values():
+                if dto.status == StatusCode.SUCCESS:
+                    dto.content = self._retrieve(dto, question, top_k, budget)
+        return {title: results[title] for title in requested if title in results}
 
-            if not wikitext:
-                raise ValueError(f"Artículo vacío o sin contenido: '{request.title}'")
+    def cache_stats(self) -> Optional[ArticleCacheStats]:
+        """Estadísticas de la caché de artículos (None si está desactivada)."""
+        return self._cache.stats() if self._cache is not None else None
 
-            parsed = mwparserfromhell.parse(wikitext)
-            clean_text = parsed.strip_code().strip()
+    def _search(self, request: WikipediaRequestDTO) -> WikipediaResponseDTO:
+        return self.lookup(
+            [request.title],
+            mode=request.mode,
+            sections=request.sections,
+            max_chars=request.max_chars,
+            question=request.question,
+            top_k=request.top_k,
+        ).get(
+            request.title.strip(),
+            WikipediaResponseDTO(content="", status=StatusCode.ERROR, message="Título vacío"),
+        )
 
-            if "#REDIRECT" in wikitext.upper():
-                target_title = parsed.filter_wikilinks()[0].title.strip_code().strip()
-                print(f"[INFO] Redirigiendo desde '{request.title}' a '{target_title}'")
-                return self._search(WikipediaRequestDTO(title=target_title), depth + 1)
+    def _retrieve(self, dto: WikipediaResponseDTO, question: str, top_k: int, max_chars: int) -> str:
+        """Pasajes del artículo más relevantes para `question`, en orden de relevancia."""
+        index = self._passages.get(dto.title, dto.content)
+        passages = [passage for _, passage in index.search(question, top_k)]
+        logger.debug("'%s': %d/%d pasajes para '%s'", dto.title, len(passages), len(index), question)
+        return cap_text("\n\n".join(passages), max_chars)
 
-            return WikipediaResponseDTO(
-                content=clean_text,
-                status=StatusCode.SUCCESS,
-                message="Artículo encontrado",
-                title=request.title
+    def _fetch(self, titles: List[str], mode: str, sections: List[str], max_chars: int) -> Dict[str, WikiPage]:
+        # El volcado local no tiene extractos: se limpia el wikitexto por secciones
+        if mode == WIKI_MODE_EXTRACT and hasattr(self._client, "fetch_extracts"):
+            intro_only = [s.lower() for s in sections] == [LEAD_SECTION]
+            # Con secciones concretas el corte se hace en local, tras seleccionarlas
+            return self._client.fetch_extracts(
+                titles,
+                intro_only=intro_only,
+                max_chars=max_chars if intro_only or not sections else 0,
             )
+        return self._client.fetch_pages(titles)
 
-        except requests.RequestException as e:
+    def _from_cache(self, titles: List[str], variant: str) -> Tuple[Dict[str, WikipediaResponseDTO], List[str]]:
+        """
+        Sirve desde la caché lo que se pueda.
+
+        Returns:
+            (respuestas servidas desde la caché, títulos que hay que descargar)
+        """
+        cached = self._cache.get_many(titles, variant)
+        now = time.time()
+        results: Dict[str, WikipediaResponseDTO] = {}
+        stale: Dict[str, CachedArticle] = {}
+        for title, article in cached.items():
+            if self._cache.is_fresh(article, now):
+                self._cache.hit(article)
+                results[title] = self._cached_response(article)
+            else:
+                stale[title] = article
+
+        if stale:
+            try:
+                current = self._client.fetch_revisions(stale)
+            except requests.RequestException as e:
+                # Sin red se sirve la copia guardada antes que un error
+                logger.warning("No se pudo revalidar la caché de Wikipedia: %s", e)
+                current = {}
+                for title, article in stale.items():
+                    self._cache.hit(article)
+                    results[title] = self._cached_response(article)
+
+            for title, page in current.items():
+                article = stale[title]
+                if not page.missing and page.revid is not None and page.revid == article.revid:
+                    self._cache.revalidated(article)
+                    results[title] = self._cached_response(article)
+
+        pending = [title for title in titles if title not in results]
+        for _ in pending:
+            self._cache.miss()
+        return results, pending
+
+    @staticmethod
+    def _cached_response(article: CachedArticle) -> WikipediaResponseDTO:
+        return WikipediaResponseDTO(
+            content=article.content,
+            status=StatusCode.SUCCESS,
+            message="Artículo encontrado (caché)",
+            title=article.title,
+            revid=article.revid,
+        )
+
+    @staticmethod
+    def _to_response(page: WikiPage, sections: Sequence[str] = (), max_chars: int = 0) -> WikipediaResponseDTO:
+        if page.missing:
             return WikipediaResponseDTO(
                 content="",
                 status=StatusCode.ERROR,
-                message=f"Error en la llamada a Wikipedia: {str(e)}"
+                message=f"No se encontró contenido para '{page.requested}'",
+                title=page.title,
             )
-
-        except (StopIteration, KeyError, IndexError) as e:
+        if not page.found:
             return WikipediaResponseDTO(
                 content="",
                 status=StatusCode.ERROR,
-                message=f"Formato de respuesta no válido de Wikipedia"
+                message=f"Artículo vacío o sin contenido: '{page.requested}'",
+                title=page.title,
             )
+        if page.redirected_from:
+            print(f"[INFO] Redirigiendo desde '{page.requested}' a '{page.title}'")
 
-        except Exception as e:
+        if page.extract is not None:
+            clean_text = clean_sections(page.extract, sections, max_chars, clean=str)
+        else:
+            # Sólo se tokenizan las secciones pedidas, y hasta llenar el presupuesto
+            clean_text = clean_sections(
+                page.wikitext, sections, max_chars, clean=lambda text: mwparserfromhell.parse(text).strip_code()
+            )
+        if not clean_text:
             return WikipediaResponseDTO(
                 content="",
                 status=StatusCode.ERROR,
-                message=f"Error inesperado: {str(e)}"
-            )
\ No newline at end of file
+                message=f"No se encontraron las secciones {', '.join(sections)} en '{page.title}'",
+                title=page.title,
+            )
+        return WikipediaResponseDTO(
+            content=clean_text,
+            status=StatusCode.SUCCESS,
+            message="Artículo encontrado",
+            title=page.title,
+            revid=page.revid,
+        )
+
+    @staticmethod
+    def _all_failed(titles: List[str], message: str) -> Dict[str, WikipediaResponseDTO]:
+        return {
+            title: WikipediaResponseDTO(content="", status=StatusCode.ERROR, message=message)
+            for title in dict.fromkeys(t.strip() for t in titles if t and t.strip())
+        }
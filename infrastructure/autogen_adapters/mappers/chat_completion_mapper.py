@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from application.dtos.llm_app_response import LLMAppResponse
+from application.enums.status_code import StatusCode
+
+# Formato de `start_time` en los eventos de autogen (logger_utils.get_current_ts, UTC)
+_AUTOGEN_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+class ChatCompletionMapper:
+    @staticmethod
+    def map_response(response: Any, is_cached: bool, start_time: Optional[str]) -> LLMAppResponse:
+        """
+        Convierte una llamada registrada por autogen (ChatCompletion, o texto si falló)
+        en un LLMAppResponse con tokens, latencia y modelo.
+
+        autogen no pide streaming al modelo: no hay TTFT.
+        """
+        if isinstance(response, str):
+            return LLMAppResponse(generated_text="", status=StatusCode.ERROR, message=response)
+
+        usage = getattr(response, "usage", None)
+        choices = getattr(response, "choices", None) or []
+        message = getattr(choices[0], "message", None) if choices else None
+        return LLMAppResponse(
+            generated_text=getattr(message, "content", None) or "",
+            status=StatusCode.SUCCESS,
+            prompt_tokens=getattr(usage, "prompt_tokens", None) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", None) or 0,
+            latency=ChatCompletionMapper._elapsed_since(start_time),
+            model=getattr(response, "model", None) or "",
+            cached=bool(is_cached),
+        )
+
+    @staticmethod
+    def _elapsed_since(start_time: Optional[str]) -> Optional[float]:
+        if not start_time:
+            return None
+        try:
+            started = datetime.strptime(start_time, _AUTOGEN_TS_FORMAT).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+        return (datetime.now(timezone.utc) - started).total_seconds()
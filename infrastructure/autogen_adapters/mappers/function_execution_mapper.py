@@ -1,3 +1,6 @@
+import json
+from typing import Any
+
 from application.dtos.agent_app_request import AgentAppRequest
 from application.dtos.agent_app_response import AgentAppResponse
 from application.enums.status_code import StatusCode
@@ -17,4 +20,33 @@ class FunctionExecutionMapper:
             name=agent_name,
             content=f"{app_response.content}\n\n[Status: {app_response.status.name}]",
             status=app_response.status
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def to_tool_result(app_response: AgentAppResponse) -> str:
+        """
+        Resultado de una herramienta para autogen, ya serializado a JSON.
+
+        autogen pasa por str() lo que no es texto; aquí se escribe el JSON una sola
+        vez y los valores con `to_json()` (p. ej. ProductBatch) se vuelcan desde sus
+        propias columnas, sin dicts intermedios.
+        """
+        return FunctionExecutionMapper._encode({
+            "content": app_response.content,
+            "status": app_response.status.name,
+            "message": app_response.message,
+        })
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        to_json = getattr(value, "to_json", None)
+        if callable(to_json):
+            return to_json()
+        if isinstance(value, dict):
+            return "{" + ",".join(
+                json.dumps(str(key), ensure_ascii=False) + ":" + FunctionExecutionMapper._encode(item)
+                for key, item in value.items()
+            ) + "}"
+        if isinstance(value, (list, tuple)):
+            return "[" + ",".join(FunctionExecutionMapper._encode(item) for item in value) + "]"
+        return json.dumps(value, ensure_ascii=False, default=str)
@@ -0,0 +1,108 @@
+# infrastructure/autogen_adapters/services/usage_tracker.py
+"""
+Uso de tokens y latencia de las llamadas al LLM que hace autogen en un chat.
+
+✔  El planner y el GroupChatManager llaman al modelo con el cliente de autogen,
+   no con nuestros proveedores: se engancha el runtime logging de autogen, que
+   notifica cada chat completion (respuesta, inicio, si vino de caché).
+✔  Cada llamada se suma al LLMUsageSummary del chat en curso (ContextVar), así que
+   varios chats en paralelo (hilos del servidor Flask) no se mezclan.
+✔  Si ya hay otro logger de autogen activo no se sustituye; el resumen queda vacío.
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+import uuid
+from typing import Any, Iterator, Optional
+
+from autogen import runtime_logging
+from autogen.logger.base_logger import BaseLogger
+
+from application.dtos.llm_usage_summary import LLMUsageSummary
+from infrastructure.autogen_adapters.mappers.chat_completion_mapper import ChatCompletionMapper
+
+logger = logging.getLogger(__name__)
+
+_current: "contextvars.ContextVar[Optional[LLMUsageSummary]]" = contextvars.ContextVar("llm_usage", default=None)
+
+
+class _UsageLogger(BaseLogger):
+    """Logger de autogen que solo atiende a las chat completions."""
+
+    def start(self) -> str:
+        return str(uuid.uuid4())
+
+    def log_chat_completion(
+        self,
+        invocation_id: uuid.UUID,
+        client_id: int,
+        wrapper_id: int,
+        source: Any,
+        request: Any,
+        response: Any,
+        is_cached: int,
+        cost: float,
+        start_time: str,
+    ) -> None:
+        summary = _current.get()
+        if summary is not None:
+            summary.add(ChatCompletionMapper.map_response(response, bool(is_cached), start_time))
+
+    def log_new_agent(self, agent: Any, init_args: Any) -> None:
+        pass
+
+    def log_event(self, source: Any, name: str, **kwargs: Any) -> None:
+        pass
+
+    def log_new_wrapper(self, wrapper: Any, init_args: Any) -> None:
+        pass
+
+    def log_new_client(self, client: Any, wrapper: Any, init_args: Any) -> None:
+        pass
+
+    def log_function_use(self, source: Any, function: Any, args: Any, returns: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def get_connection(self) -> None:
+        return None
+
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _install() -> bool:
+    """Activa el logger de uso en autogen (una vez por proceso). False si hay otro activo."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return True
+        if runtime_logging.logging_enabled():
+            logger.warning("[UsageTracker] autogen ya tiene un runtime logger activo; no se medirá el uso")
+            return False
+        runtime_logging.start(logger=_UsageLogger())
+        _installed = True
+        return True
+
+
+@contextlib.contextmanager
+def track_usage(summary: LLMUsageSummary) -> Iterator[LLMUsageSummary]:
+    """
+    Suma a `summary` las llamadas al LLM que haga autogen dentro del bloque.
+
+    Uso:
+        usage = LLMUsageSummary()
+        with track_usage(usage):
+            user.initiate_chat(manager, message=prompt)
+    """
+    _install()
+    token = _current.set(summary)
+    try:
+        yield summary
+    finally:
+        _current.reset(token)
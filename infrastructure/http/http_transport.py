@@ -0,0 +1,181 @@
+# infrastructure/http/http_transport.py
+"""
+Transporte HTTP compartido por los agentes de infraestructura (WebScraper, Wikipedia...).
+
+✔  Un único `requests.Session` con pools de conexiones por host y keep-alive.
+✔  Negociación gzip/deflate (y brotli si la librería `brotli` está instalada).
+✔  Tamaños de pool, reintentos y timeout configurables desde settings.
+✔  Contadores de peticiones, handshakes (conexiones nuevas) y reutilizaciones.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import make_headers
+
+from config.settings import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# "gzip,deflate" y además "br" cuando urllib3 puede decodificar brotli
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+@dataclass
+class TransportStats:
+    """
+    Instantánea de los contadores del transporte.
+
+    Attributes:
+        requests (int): Peticiones enviadas por los pools.
+        handshakes (int): Conexiones nuevas abiertas (DNS + TCP + TLS).
+        reused (int): Peticiones servidas sobre una conexión ya abierta.
+        hosts (int): Pools de host activos.
+    """
+    requests: int = 0
+    handshakes: int = 0
+    reused: int = 0
+    hosts: int = 0
+
+
+class _Counters:
+    """Contadores thread-safe que comparten todos los pools de un transporte."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.handshakes = 0
+
+    def add_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def add_handshake(self) -> None:
+        with self._lock:
+            self.handshakes += 1
+
+
+def _counting_pool(base: type, counters: _Counters) -> type:
+    """Crea una subclase del pool de urllib3 que anota peticiones y handshakes."""
+
+    class CountingConnection(base.ConnectionCls):
+        def connect(self):
+            # Cada connect() es un socket nuevo: DNS + TCP (+ TLS en https)
+            counters.add_handshake()
+            return super().connect()
+
+    class CountingPool(base):
+        ConnectionCls = CountingConnection
+
+        def urlopen(self, *args, **kwargs):
+            counters.add_request()
+            return super().urlopen(*args, **kwargs)
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    def __init__(self, counters: _Counters, **kwargs: Any):
+        self._counters = counters
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._counters),
+            "https": _counting_pool(HTTPSConnectionPool, self._counters),
+        }
+
+
+class HttpTransport:
+    """
+    Cliente HTTP con conexiones persistentes reutilizables entre llamadas,
+    tiendas y ejecuciones del chat.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        timeout: Union[float, Tuple[float, float]] = HTTP_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            pool_connections (int): Número de hosts distintos cuyo pool se mantiene abierto.
+            pool_maxsize (int): Conexiones keep-alive que se conservan por host.
+            max_retries (int): Reintentos de conexión a nivel de urllib3.
+            timeout (float | tuple): Timeout por defecto (segundos, o tupla conexión/lectura) si la llamada no indica otro.
+            headers (dict, optional): Cabeceras por defecto de la sesión.
+        """
+        self.timeout = timeout
+        self._counters = _Counters()
+        self._adapter = _CountingAdapter(
+            self._counters,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._session.headers.update({
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        })
+        if headers:
+            self._session.headers.update(headers)
+
+    # ─────── PETICIONES ───────
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    # ─────── MÉTRICAS ───────
+    def stats(self) -> TransportStats:
+        requests_sent = self._counters.requests
+        handshakes = self._counters.handshakes
+        return TransportStats(
+            requests=requests_sent,
+            handshakes=handshakes,
+            reused=max(0, requests_sent - handshakes),
+            hosts=len(self._adapter.poolmanager.pools),
+        )
+
+    def close(self) -> None:
+        self._session.close()
+
+
+# ─────── INSTANCIA COMPARTIDA ───────
+_shared_lock = threading.Lock()
+_shared_transport: Optional[HttpTransport] = None
+
+
+def get_shared_transport() -> HttpTransport:
+    """
+    Devuelve el transporte compartido por todos los agentes (se crea la primera vez).
+    """
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HttpTransport()
+            logger.info("Transporte HTTP compartido inicializado.")
+        return _shared_transport
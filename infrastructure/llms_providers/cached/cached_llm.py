@@ -0,0 +1,114 @@
+# infrastructure/llms_providers/cached/cached_llm.py
+import json
+import logging
+from typing import Optional
+
+from application.dtos.llm_app_request import LLMAppRequest
+from application.dtos.llm_app_response import LLMAppResponse
+from application.enums.status_code import StatusCode
+from application.interfaces.llm_interface import LLMInterface
+from infrastructure.llms_providers.cached.services.response_cache import (
+    ResponseCache,
+    ResponseCacheStats,
+    get_shared_response_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sube si cambia la forma de LLMAppResponse: las entradas antiguas dejan de coincidir
+_KEY_VERSION = 2
+
+
+class CachedLLM(LLMInterface):
+    """
+    Decorador de LLMInterface que reutiliza respuestas de peticiones idénticas.
+
+    Envuelve cualquier proveedor (LLMStudio, Gemini...) y delega en él los fallos
+    de caché. Solo se guardan las respuestas correctas; un contexto con
+    `"cache": False` salta la caché para esa petición.
+    """
+
+    def __init__(self, provider: LLMInterface, cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            provider (LLMInterface): Proveedor real.
+            cache (ResponseCache, optional): Almacén; por defecto el compartido.
+        """
+        self.provider = provider
+        self.cache = cache or get_shared_response_cache()
+
+    @property
+    def batch_concurrency(self) -> int:
+        return self.provider.batch_concurrency
+
+    def send_data(self, request: LLMAppRequest) -> LLMAppResponse:
+        key = self.cache_key(request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug("[CachedLLM] Respuesta servida desde caché")
+                return self._hit(cached)
+
+        response = self.provider.send_data(request)
+        self._store(key, response)
+        return response
+
+    async def async_send_data(self, request: LLMAppRequest) -> LLMAppResponse:
+        key = self.cache_key(request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return self._hit(cached)
+
+        response = await self.provider.async_send_data(request)
+        self._store(key, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+    def cache_key(self, request: LLMAppRequest) -> Optional[str]:
+        """
+        Descripción canónica de la petición (None si no se debe cachear).
+
+        Incluye proveedor, modelo, entrada y todo el contexto (mensajes,
+        temperatura, max_tokens...) con las claves ordenadas.
+        """
+        context = dict(request.context)
+        if context.pop("cache", True) is False:
+            return None
+        return json.dumps(
+            {
+                "v": _KEY_VERSION,
+                "provider": type(self.provider).__name__,
+                "model": context.pop("model", self.provider.get_model_name()),
+                "input": request.user_input,
+                "context": context,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+
+    def stats(self) -> ResponseCacheStats:
+        return self.cache.stats()
+
+    def get_model_name(self) -> str:
+        return self.provider.get_model_name()
+
+    def get_base_url(self) -> str:
+        return self.provider.get_base_url()
+
+    def get_api_key(self) -> str:
+        return self.provider.get_api_key()
+
+    # ─────── HELPERS ───────
+    @staticmethod
+    def _hit(response: LLMAppResponse) -> LLMAppResponse:
+        # Cada lectura es una copia: marcarla no altera la entrada guardada
+        response.cached = True
+        return response
+
+    def _store(self, key: Optional[str], response: LLMAppResponse) -> None:
+        if key is not None and response.status == StatusCode.SUCCESS:
+            self.cache.set(key, response)
@@ -0,0 +1,228 @@
+# infrastructure/llms_providers/cached/services/response_cache.py
+"""
+Caché de respuestas de LLM direccionada por contenido.
+
+✔  La clave es el SHA-256 de la petición completa (modelo, parámetros y mensajes):
+   dos peticiones iguales comparten entrada sin importar de dónde vengan.
+✔  Dos niveles: LRU en memoria (por número de entradas) y SQLite en disco
+   (comprimido con zlib, acotado en bytes con expulsión LRU) que sobrevive a reinicios.
+✔  TTL: las entradas caducadas se descartan al leerlas.
+✔  Cumple el protocolo de caché de autogen (`get` / `set` / context manager),
+   así que también sirve para las llamadas que hace el planner vía `initiate_chat(cache=...)`.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from config.settings import (
+    LLM_CACHE_PATH,
+    LLM_CACHE_MEMORY_ENTRIES,
+    LLM_CACHE_MAX_BYTES,
+    LLM_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResponseCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    expired: int = 0       # encontradas pero fuera del TTL (cuentan también como fallo)
+    stores: int = 0
+    evictions: int = 0     # expulsadas del disco por tamaño
+    memory_entries: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Almacén de respuestas en memoria + disco con TTL.
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        memory_entries: int = LLM_CACHE_MEMORY_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        ttl: float = LLM_CACHE_TTL,
+    ):
+        """
+        Args:
+            path (str): Fichero SQLite del nivel en disco.
+            memory_entries (int): Respuestas que se conservan en memoria.
+            max_bytes (int): Tamaño máximo (comprimido) del nivel en disco.
+            ttl (float): Segundos durante los que una respuesta es válida.
+        """
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key         TEXT PRIMARY KEY,
+                value       BLOB NOT NULL,
+                created_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size        INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+
+    # ─────── API PÚBLICA ───────
+    def get(self, key: str, default: Any = None) -> Any:
+        """Respuesta guardada para `key` (cualquier texto que describa la petición), o `default`."""
+        digest = self._digest(key)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(digest)
+            if entry is not None:
+                created_at, blob = entry
+                if now - created_at < self.ttl:
+                    self._memory.move_to_end(digest)
+                    self._stats.memory_hits += 1
+                    return self._load(blob, default)
+                del self._memory[digest]
+
+            row = self._db.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return default
+
+            compressed, created_at = row
+            if now - created_at >= self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (digest,))
+                self._stats.expired += 1
+                self._stats.misses += 1
+                return default
+
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, digest))
+            blob = zlib.decompress(compressed)
+            self._remember(digest, created_at, blob)
+            self._stats.disk_hits += 1
+        logger.debug("[ResponseCache] HIT (disco) %s", digest[:12])
+        return self._load(blob, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Guarda `value` (cualquier objeto serializable con pickle) para `key`."""
+        digest = self._digest(key)
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = zlib.compress(blob, 6)
+        now = time.time()
+        with self._lock:
+            self._remember(digest, now, blob)
+            if len(compressed) <= self.max_bytes:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (digest, compressed, now, now, len(compressed)),
+                )
+                self._evict()
+            self._stats.stores += 1
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return ResponseCacheStats(
+                memory_hits=self._stats.memory_hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                expired=self._stats.expired,
+                stores=self._stats.stores,
+                evictions=self._stats.evictions,
+                memory_entries=len(self._memory),
+                entries=entries,
+                bytes=size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM responses")
+
+    # ─────── PROTOCOLO DE AUTOGEN ───────
+    def close(self) -> None:
+        # autogen llama a close() al salir de cada `with cache:` de una petición;
+        # la caché es compartida entre peticiones, así que la conexión sigue abierta.
+        pass
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # ─────── HELPERS ───────
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load(blob: bytes, default: Any) -> Any:
+        # Cada lectura deserializa una copia: quien la modifique no altera la caché
+        try:
+            return pickle.loads(blob)
+        except Exception as exc:
+            logger.warning("[ResponseCache] Entrada ilegible, se ignora: %s", exc)
+            return default
+
+    def _remember(self, digest: str, created_at: float, blob: bytes) -> None:
+        """Guarda en el nivel de memoria (requiere el lock)."""
+        if self.memory_entries <= 0:
+            return
+        self._memory[digest] = (created_at, blob)
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Expulsa del disco las respuestas menos usadas hasta volver a `max_bytes` (requiere el lock)."""
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            total -= size
+            self._stats.evictions += 1
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_response_cache() -> ResponseCache:
+    """Devuelve la caché de respuestas compartida por proveedores y planner (se crea la primera vez)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
@@ -1,36 +1,73 @@
-from typing import List
+import time
+from typing import AsyncIterable, Iterable, List, Optional
 from google.genai.types import GenerateContentResponse
 import logging
 
 logger = logging.getLogger(__name__)
 
 class GeminiResponseDTO:
-    def __init__(self, generated_text: str):
+    def __init__(
+        self,
+        generated_text: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        model: str = "",
+        ttft: Optional[float] = None,
+        latency: Optional[float] = None,
+    ):
         """
         Inicializa el DTO con el texto generado.
 
         Args:
             generated_text (str): Texto obtenido del modelo Gemini.
+            prompt_tokens (int): Tokens de entrada (`usage_metadata.prompt_token_count`).
+            completion_tokens (int): Tokens generados (`usage_metadata.candidates_token_count`).
+            model (str): Versión del modelo que respondió (`model_version`).
+            ttft (float, optional): Segundos hasta el primer fragmento con texto.
+            latency (float, optional): Segundos hasta el último fragmento.
         """
         self.generated_text = generated_text
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.model = model
+        self.ttft = ttft
+        self.latency = latency
 
     @staticmethod
-    def from_chunks(chunks: List[GenerateContentResponse]) -> 'GeminiResponseDTO':
+    def from_chunks(chunks: Iterable[GenerateContentResponse], started_at: Optional[float] = None) -> 'GeminiResponseDTO':
         """
         Crea un DTO concatenando texto desde chunks generados por Gemini.
 
         Args:
-            chunks (List[GenerateContentResponse]): Lista de fragmentos generados por Gemini.
+            chunks (Iterable[GenerateContentResponse]): Fragmentos generados por Gemini (lista o stream).
+            started_at (float, optional): Instante (`time.perf_counter`) del envío; si se
+                indica, se miden el primer fragmento y el final del stream.
 
         Returns:
-            GeminiResponseDTO: DTO con el texto completo generado.
+            GeminiResponseDTO: DTO con el texto completo generado, el uso de tokens y los tiempos.
 
         Raises:
             ValueError: Si algún chunk no tiene el atributo 'text'.
         """
         try:
-            generated_text = ''.join(chunk.text for chunk in chunks if hasattr(chunk, 'text'))
-            return GeminiResponseDTO(generated_text=generated_text)
+            collector = _ChunkCollector(started_at)
+            for chunk in chunks:
+                collector.add(chunk)
+            return collector.to_dto()
+        except AttributeError as e:
+            logger.error(f"Error al extraer texto de los chunks: {e}")
+            raise ValueError("Error al procesar chunks recibidos de Gemini.") from e
+
+    @staticmethod
+    async def from_async_chunks(
+        chunks: AsyncIterable[GenerateContentResponse], started_at: Optional[float] = None
+    ) -> 'GeminiResponseDTO':
+        """Como from_chunks, sobre el stream del cliente asíncrono (`client.aio`)."""
+        try:
+            collector = _ChunkCollector(started_at)
+            async for chunk in chunks:
+                collector.add(chunk)
+            return collector.to_dto()
         except AttributeError as e:
             logger.error(f"Error al extraer texto de los chunks: {e}")
             raise ValueError("Error al procesar chunks recibidos de Gemini.") from e
@@ -44,3 +81,35 @@ class GeminiResponseDTO:
             GeminiResponseDTO: DTO vacío con cadena generada vacía.
         """
         return GeminiResponseDTO(generated_text="")
+
+
+class _ChunkCollector:
+    """Texto, uso de tokens y tiempos acumulados según llegan los fragmentos."""
+
+    def __init__(self, started_at: Optional[float]):
+        self._started_at = started_at
+        self._first_at: Optional[float] = None
+        self._parts: List[str] = []
+        self._usage = None
+        self._model = ""
+
+    def add(self, chunk: GenerateContentResponse) -> None:
+        text = chunk.text if hasattr(chunk, 'text') else None
+        if text:
+            if self._first_at is None:
+                self._first_at = time.perf_counter()
+            self._parts.append(text)
+        # El uso de tokens llega acumulado: vale el del último fragmento que lo trae
+        self._usage = getattr(chunk, 'usage_metadata', None) or self._usage
+        self._model = getattr(chunk, 'model_version', None) or self._model
+
+    def to_dto(self) -> GeminiResponseDTO:
+        started_at = self._started_at
+        return GeminiResponseDTO(
+            generated_text=''.join(self._parts),
+            prompt_tokens=getattr(self._usage, 'prompt_token_count', None) or 0,
+            completion_tokens=getattr(self._usage, 'candidates_token_count', None) or 0,
+            model=self._model,
+            ttft=None if started_at is None or self._first_at is None else self._first_at - started_at,
+            latency=None if started_at is None else time.perf_counter() - started_at,
+        )
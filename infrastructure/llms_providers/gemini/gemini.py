@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 
 from google import genai
 from google.api_core.exceptions import (
@@ -10,7 +11,7 @@ from google.api_core.exceptions import (
 )
 from google.genai.errors import ClientError
 
-from config.settings import GEMINI_API_KEY
+from config.settings import GEMINI_API_KEY, GEMINI_BATCH_CONCURRENCY
 from application.dtos.llm_app_request import LLMAppRequest
 from application.dtos.llm_app_response import LLMAppResponse
 from application.interfaces.llm_interface import LLMInterface
@@ -43,6 +44,7 @@ class Gemini(LLMInterface):
         """
         self.api_key = GEMINI_API_KEY
         self.default_model = "gemini-2.0-flash"
+        self.batch_concurrency = GEMINI_BATCH_CONCURRENCY
         
         # Validación más estricta de la API key
         if not self.api_key or len(self.api_key) < 30:  # Longitud mínima aproximada
@@ -77,6 +79,7 @@ class Gemini(LLMInterface):
 
         try:
             logging.info(f"Enviando solicitud a Gemini - Modelo: {gemini_request_dto.model}")
+            started_at = time.perf_counter()
             # Llama a la API de Gemini para generar contenido.
             response_chunks = self.client.models.generate_content_stream(
                 model=gemini_request_dto.model,
@@ -85,7 +88,8 @@ class Gemini(LLMInterface):
             )
 
             # Convierte el stream de respuesta en un DTO de respuesta.
-            gemini_response_dto = GeminiResponseDTO.from_chunks(response_chunks)
+            gemini_response_dto = GeminiResponseDTO.from_chunks(response_chunks, started_at)
+            gemini_response_dto.model = gemini_response_dto.model or gemini_request_dto.model
             logging.debug("Respuesta recibida correctamente")
 
             return GeminiMapper.map_response(
@@ -94,26 +98,67 @@ class Gemini(LLMInterface):
                 message="OK"
             )
         
-        except ClientError as e:
+        except Exception as e:
+            return self._error_response_for(e)
+
+    async def async_send_data(self, app_request: LLMAppRequest) -> LLMAppResponse:
+        """
+        Versión asíncrona de send_data con el cliente asíncrono del SDK (`client.aio`).
+
+        Varias llamadas concurrentes (p. ej. desde send_batch) comparten el cliente
+        HTTP del SDK en lugar de ocupar un hilo cada una.
+
+        Args:
+            app_request (LLMAppRequest): DTO que contiene la solicitud realizada por la aplicación.
+
+        Returns:
+            LLMAppResponse: Respuesta de Gemini o, en caso de error, un DTO con estado ERROR.
+        """
+        gemini_request_dto = GeminiMapper.map_request(app_request)
+
+        try:
+            logging.info(f"Enviando solicitud asíncrona a Gemini - Modelo: {gemini_request_dto.model}")
+            started_at = time.perf_counter()
+            response_chunks = await self.client.aio.models.generate_content_stream(
+                model=gemini_request_dto.model,
+                contents=gemini_request_dto.contents,
+                config=gemini_request_dto.config
+            )
+
+            gemini_response_dto = await GeminiResponseDTO.from_async_chunks(response_chunks, started_at)
+            gemini_response_dto.model = gemini_response_dto.model or gemini_request_dto.model
+            return GeminiMapper.map_response(
+                dto=gemini_response_dto,
+                status_code=StatusCode.SUCCESS,
+                message="OK"
+            )
+
+        except Exception as e:
+            return self._error_response_for(e)
+
+    def _error_response_for(self, e: Exception) -> LLMAppResponse:
+        """
+        Traduce una excepción del SDK (o cualquier otra) en una respuesta de error,
+        con el mismo criterio para la llamada síncrona y la asíncrona.
+        """
+        if isinstance(e, ClientError):
             # Manejo específico para errores de API key
             if "API key not valid" in str(e):
                 logging.critical("API KEY INVALIDA: Verifica config/settings.py")
                 return self._create_error_response("Error de autenticación: API key inválida o expirada")
-            else:
-                logging.error("Error de cliente Gemini: %s", str(e))
-                return self._create_error_response(f"Error de cliente: {str(e)}")
+            logging.error("Error de cliente Gemini: %s", str(e))
+            return self._create_error_response(f"Error de cliente: {str(e)}")
 
-        except (InvalidArgument, ResourceExhausted, InternalServerError) as e:
+        if isinstance(e, (InvalidArgument, ResourceExhausted, InternalServerError)):
             logging.error("Error específico de Gemini (%s): %s", type(e).__name__, str(e))
             return self._create_error_response(f"Error del servicio: {type(e).__name__}")
 
-        except GoogleAPIError as e:
+        if isinstance(e, GoogleAPIError):
             logging.error("Error general de API: %s", str(e))
             return self._create_error_response(f"Error de comunicación: {str(e)}")
 
-        except Exception as e:
-            logging.exception("Error inesperado")
-            return self._create_error_response(f"Error interno: {str(e)}")
+        logging.exception("Error inesperado", exc_info=e)
+        return self._create_error_response(f"Error interno: {str(e)}")
 
     def _create_error_response(self, message: str) -> LLMAppResponse:
         """
@@ -74,11 +74,17 @@ class GeminiMapper:
                 - generated_text: Texto generado por Gemini.
                 - status: Estado convertido al Enum StatusCode.
                 - message: Mensaje descriptivo del resultado.
+                - prompt_tokens / completion_tokens, ttft, latency y model del DTO.
         """
         return LLMAppResponse(
             generated_text=dto.generated_text,
             status=StatusCode(status_code),
-            message=message
+            message=message,
+            prompt_tokens=dto.prompt_tokens,
+            completion_tokens=dto.completion_tokens,
+            ttft=dto.ttft,
+            latency=dto.latency,
+            model=dto.model,
         )
 
     @staticmethod
@@ -0,0 +1,48 @@
+from typing import Dict, List, Optional
+
+
+class LLMStudioChatRequestDTO:
+    """
+    Data Transfer Object (DTO) para las solicitudes a `/v1/chat/completions` de LLM Studio.
+
+    Attributes:
+        messages (List[Dict[str, str]]): Conversación en formato OpenAI ({"role", "content"}).
+        model (str): Modelo cargado en LLM Studio que debe responder.
+        max_tokens (int): Número máximo de tokens permitidos en la respuesta.
+        temperature (float, optional): Temperatura de muestreo (None = la del servidor).
+        stream (bool): Pedir la respuesta como eventos SSE, token a token.
+    """
+
+    def __init__(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        stream: bool = True,
+    ):
+        self.messages = messages
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.stream = stream
+
+    def to_json(self) -> dict:
+        """
+        Convierte el DTO en el cuerpo JSON de la petición.
+
+        Returns:
+            dict: Diccionario que representa la solicitud para LLM Studio.
+        """
+        payload = {
+            "model": self.model,
+            "messages": self.messages,
+            "max_tokens": self.max_tokens,
+            "stream": self.stream,
+        }
+        if self.temperature is not None:
+            payload["temperature"] = self.temperature
+        if self.stream:
+            # Último evento con el uso de tokens (servidores compatibles con OpenAI)
+            payload["stream_options"] = {"include_usage": True}
+        return payload
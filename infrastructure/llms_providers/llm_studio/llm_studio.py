@@ -1,12 +1,30 @@
+import asyncio
 import requests
+import httpx
 import logging
-from config.settings import LLM_STUDIO_API_URL, LLM_STUDIO_HEADERS, LLM_STUDIO_DEFAULT_NAME, LLM_STUDIO_API_KEY
+import time
+import weakref
+from typing import Optional
+from config.settings import (
+    LLM_STUDIO_API_URL,
+    LLM_STUDIO_HEADERS,
+    LLM_STUDIO_DEFAULT_NAME,
+    LLM_STUDIO_API_KEY,
+    LLM_STUDIO_API_MODE,
+    LLM_STUDIO_STREAM,
+    LLM_STUDIO_CONNECT_TIMEOUT,
+    LLM_STUDIO_READ_TIMEOUT,
+    LLM_STUDIO_POOL_MAXSIZE,
+    LLM_STUDIO_BATCH_CONCURRENCY,
+)
 from application.dtos.llm_app_request import LLMAppRequest
 from application.dtos.llm_app_response import LLMAppResponse
 from application.interfaces.llm_interface import LLMInterface
 from application.enums.status_code import StatusCode  # Importamos el Enum
 from infrastructure.llms_providers.llm_studio.dtos.llm_studio_response_dto import LLMStudioResponseDTO
 from infrastructure.llms_providers.llm_studio.mappers.llm_studio_mapper import LLMStudioMapper
+from infrastructure.llms_providers.llm_studio.services.chat_stream import AsyncChatStream, ChatStream
+from infrastructure.http.http_transport import HttpTransport
 
 logger = logging.getLogger(__name__)
 
@@ -19,30 +37,60 @@ class LLMStudio(LLMInterface):
     escenarios de error para asegurar que se devuelva una respuesta consistente.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        mode: str = LLM_STUDIO_API_MODE,
+        streaming: bool = LLM_STUDIO_STREAM,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+    ):
         """
         Inicializa la instancia de LLMStudio con la URL y las cabeceras definidas en settings.
 
         Los parámetros de configuración (API URL y API key) se obtienen del archivo de configuración.
+
+        Args:
+            transport (HttpTransport, optional): Sesión HTTP con pool; por defecto una propia del proveedor.
+            mode (str): "chat" (`/chat/completions`) o "completions" (endpoint heredado).
+            streaming (bool): En modo chat, recibir la respuesta por SSE token a token.
+            base_url (str, optional): URL de otra instancia de LLM Studio (por defecto LLM_STUDIO_API_URL).
+            model (str, optional): Modelo a usar (por defecto LLM_STUDIO_DEFAULT_NAME).
         """
-        self.api_url = LLM_STUDIO_API_URL
+        self.api_url = base_url or LLM_STUDIO_API_URL
         self.headers = LLM_STUDIO_HEADERS
-        self.default_model = LLM_STUDIO_DEFAULT_NAME
+        self.default_model = model or LLM_STUDIO_DEFAULT_NAME
         self.api_key = LLM_STUDIO_API_KEY
-        self.base_url = LLM_STUDIO_API_URL
+        self.base_url = base_url or LLM_STUDIO_API_URL
+        self.chat_url = f"{self.base_url.rstrip('/')}/chat/completions"
+        self.mode = mode
+        self.streaming = streaming
+
+        # Sesión propia: las cabeceras de autenticación no deben viajar a las tiendas del scraper
+        self._transport = transport or HttpTransport(
+            pool_connections=1,
+            pool_maxsize=LLM_STUDIO_POOL_MAXSIZE,
+            timeout=(LLM_STUDIO_CONNECT_TIMEOUT, LLM_STUDIO_READ_TIMEOUT),
+            headers=self.headers,
+        )
+        # Cliente asíncrono con pool, uno por bucle de eventos (sus conexiones no se pueden compartir entre bucles)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.batch_concurrency = LLM_STUDIO_BATCH_CONCURRENCY
 
     def send_data(self, app_request: LLMAppRequest) -> LLMAppResponse:
         """
         Envía una solicitud al servicio LLM Studio y devuelve la respuesta mapeada a un LLMAppResponse.
 
         Este método realiza lo siguiente:
-          1. Mapea la solicitud de la aplicación (LLMAppRequest) a un DTO específico para LLM Studio.
-          2. Realiza una petición HTTP POST a la API de LLM Studio con un timeout de 10 segundos.
-          3. Intenta decodificar la respuesta JSON; si falla, registra el error y retorna una respuesta de error.
-          4. Verifica que la respuesta JSON no esté vacía; de lo contrario, retorna un error.
-          5. Convierte la respuesta JSON en un DTO interno (LLMStudioResponseDTO) usando el mapper.
-          6. Verifica que se hayan recibido opciones válidas; si no, retorna un error.
-          7. Mapea el DTO interno a un LLMAppResponse y lo retorna.
+          1. Según `LLM_STUDIO_API_MODE`, usa `/chat/completions` (en streaming si
+             `LLM_STUDIO_STREAM`) o el endpoint de completions heredado.
+          2. Envía la petición por la sesión HTTP del proveedor (conexiones keep-alive reutilizadas),
+             con los timeouts de conexión y lectura de settings.
+          3. Convierte la respuesta en un DTO interno (LLMStudioResponseDTO) usando el mapper;
+             si el JSON no es válido, está vacío o no trae opciones, retorna una respuesta de error.
+          4. Mapea el DTO interno a un LLMAppResponse y lo retorna.
 
         Args:
             app_request (LLMAppRequest): Objeto DTO con la solicitud realizada por la aplicación.
@@ -50,41 +98,13 @@ class LLMStudio(LLMInterface):
         Returns:
             LLMAppResponse: Objeto que contiene el texto generado, el estado (SUCCESS o ERROR) y un mensaje descriptivo.
         """
-        # Mapear la petición de la aplicación al DTO requerido por la infraestructura.
-        mapped_request = LLMStudioMapper.map_request(app_request)
-        
         try:
-            # Realizar la petición HTTP POST con un timeout definido.
-            response = requests.post(
-                self.api_url,
-                json=mapped_request.to_json(),
-                headers=self.headers,
-                timeout=10  # Timeout de 10 segundos.
-            )
-            # Si el status code no es 200, se lanza una excepción HTTPError.
-            response.raise_for_status()
+            if self.mode == "chat":
+                dto = self._send_chat(app_request)
+            else:
+                dto = self._send_completion(app_request)
+            return self._to_app_response(dto)
 
-            # Intentar decodificar la respuesta JSON.
-            try:
-                response_json = response.json()
-            except ValueError as json_error:
-                logger.error("Error decodificando JSON: %s", json_error)
-                return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Error decodificando respuesta JSON")
-            
-            # Comprobar que la respuesta no esté vacía.
-            if not response_json:
-                logger.error("Respuesta JSON vacía recibida de LLM Studio")
-                return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Respuesta JSON vacía")
-            
-            dto = LLMStudioMapper.json_to_dto(response_json)
-            # Validar que se hayan recibido opciones en la respuesta.
-            if not dto.choices:
-                logger.warning("La respuesta de LLM Studio no contiene 'choices'")
-                return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Respuesta sin opciones válidas")
-
-            # Mapear el DTO interno a la respuesta de la aplicación.
-            return LLMStudioMapper.map_response(dto, StatusCode.SUCCESS, "OK")
-        
         except requests.exceptions.HTTPError as http_err:
             logger.error("Error HTTP: %s", http_err)
             return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=f"Error HTTP: {http_err}")
@@ -94,10 +114,162 @@ class LLMStudio(LLMInterface):
         except requests.exceptions.RequestException as req_err:
             logger.error("Error en la petición: %s", req_err)
             return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=str(req_err))
+        except ValueError as value_err:
+            logger.error("%s", value_err)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=str(value_err))
         except Exception as e:
             logger.exception("Error inesperado: %s", e)
             return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Error inesperado")
-    
+
+    async def async_send_data(self, app_request: LLMAppRequest) -> LLMAppResponse:
+        """
+        Versión asíncrona de send_data sobre un cliente httpx con pool de conexiones.
+
+        Mismo modo (chat/completions), streaming y timeouts que send_data; varias
+        llamadas concurrentes comparten las conexiones keep-alive del cliente.
+        """
+        try:
+            client = self._async_client()
+            if self.mode == "chat":
+                dto = await self._async_send_chat(client, app_request)
+            else:
+                mapped_request = LLMStudioMapper.map_request(app_request)
+                dto = await self._async_post_json(client, self.api_url, mapped_request.to_json())
+            return self._to_app_response(dto)
+
+        except httpx.HTTPStatusError as http_err:
+            logger.error("Error HTTP: %s", http_err)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=f"Error HTTP: {http_err}")
+        except httpx.TimeoutException as timeout_err:
+            logger.error("Tiempo de espera agotado: %s", timeout_err)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Tiempo de espera agotado")
+        except httpx.HTTPError as req_err:
+            logger.error("Error en la petición: %s", req_err)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=str(req_err) or type(req_err).__name__)
+        except ValueError as value_err:
+            logger.error("%s", value_err)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message=str(value_err))
+        except Exception as e:
+            logger.exception("Error inesperado: %s", e)
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Error inesperado")
+
+    async def aclose(self) -> None:
+        """Cierra el cliente asíncrono del bucle de eventos actual."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def stream(self, app_request: LLMAppRequest) -> ChatStream:
+        """
+        Abre una generación en streaming contra `/chat/completions`.
+
+        Devuelve en cuanto llegan las cabeceras; los tokens se leen iterando el
+        ChatStream, que además mide el tiempo hasta el primer token.
+
+        Raises:
+            requests.exceptions.RequestException: Error de conexión, timeout o estado HTTP no 2xx.
+        """
+        payload = LLMStudioMapper.map_chat_request(app_request, stream=True, model=self.default_model).to_json()
+        started_at = time.perf_counter()
+        response = self._transport.post(self.chat_url, json=payload, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        return ChatStream(response, started_at)
+
+    # ─────── MODOS ───────
+    @staticmethod
+    def _to_app_response(dto: LLMStudioResponseDTO) -> LLMAppResponse:
+        # Validar que se hayan recibido opciones en la respuesta.
+        if not dto.choices:
+            logger.warning("La respuesta de LLM Studio no contiene 'choices'")
+            return LLMStudioMapper.map_response(LLMStudioResponseDTO.empty(), StatusCode.ERROR, message="Respuesta sin opciones válidas")
+
+        # Mapear el DTO interno a la respuesta de la aplicación.
+        return LLMStudioMapper.map_response(dto, StatusCode.SUCCESS, "OK")
+
+    def _send_chat(self, app_request: LLMAppRequest) -> LLMStudioResponseDTO:
+        if self.streaming:
+            stream = self.stream(app_request)
+            stream.read_all()
+            logger.info(
+                "LLM Studio: TTFT %s | %d fragmentos en %.2fs",
+                f"{stream.ttft:.3f}s" if stream.ttft is not None else "-", stream.chunks, stream.total_time,
+            )
+            return LLMStudioMapper.stream_to_dto(stream)
+
+        payload = LLMStudioMapper.map_chat_request(app_request, stream=False, model=self.default_model).to_json()
+        return self._post_json(self.chat_url, payload)
+
+    def _send_completion(self, app_request: LLMAppRequest) -> LLMStudioResponseDTO:
+        # Endpoint heredado (prompt + max_tokens), ahora también por la sesión con pool
+        mapped_request = LLMStudioMapper.map_request(app_request)
+        return self._post_json(self.api_url, mapped_request.to_json())
+
+    def _post_json(self, url: str, payload: dict) -> LLMStudioResponseDTO:
+        started_at = time.perf_counter()
+        response = self._transport.post(url, json=payload)
+        # Si el status code no es 2xx, se lanza una excepción HTTPError.
+        response.raise_for_status()
+
+        # Intentar decodificar la respuesta JSON.
+        try:
+            response_json = response.json()
+        except ValueError as json_error:
+            raise ValueError(f"Error decodificando respuesta JSON: {json_error}") from json_error
+
+        # Comprobar que la respuesta no esté vacía.
+        if not response_json:
+            raise ValueError("Respuesta JSON vacía")
+
+        dto = LLMStudioMapper.json_to_dto(response_json)
+        dto.stats = {**dto.stats, "generation_time": time.perf_counter() - started_at}
+        return dto
+
+    # ─────── ASÍNCRONO ───────
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=httpx.Timeout(LLM_STUDIO_READ_TIMEOUT, connect=LLM_STUDIO_CONNECT_TIMEOUT),
+                # La concurrencia la limita el semáforo del lote; el pool solo conserva las keep-alive
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=LLM_STUDIO_POOL_MAXSIZE),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    async def _async_send_chat(self, client: httpx.AsyncClient, app_request: LLMAppRequest) -> LLMStudioResponseDTO:
+        if not self.streaming:
+            payload = LLMStudioMapper.map_chat_request(app_request, stream=False, model=self.default_model).to_json()
+            return await self._async_post_json(client, self.chat_url, payload)
+
+        payload = LLMStudioMapper.map_chat_request(app_request, stream=True, model=self.default_model).to_json()
+        started_at = time.perf_counter()
+        async with client.stream("POST", self.chat_url, json=payload) as response:
+            response.raise_for_status()
+            stream = AsyncChatStream(response, started_at)
+            await stream.read_all()
+        return LLMStudioMapper.stream_to_dto(stream)
+
+    async def _async_post_json(self, client: httpx.AsyncClient, url: str, payload: dict) -> LLMStudioResponseDTO:
+        started_at = time.perf_counter()
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        try:
+            response_json = response.json()
+        except ValueError as json_error:
+            raise ValueError(f"Error decodificando respuesta JSON: {json_error}") from json_error
+        if not response_json:
+            raise ValueError("Respuesta JSON vacía")
+
+        dto = LLMStudioMapper.json_to_dto(response_json)
+        dto.stats = {**dto.stats, "generation_time": time.perf_counter() - started_at}
+        return dto
+
     def get_model_name(self) -> str:
         return self.default_model
     
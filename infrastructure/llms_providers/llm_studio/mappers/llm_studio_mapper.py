@@ -1,13 +1,16 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from application.dtos.llm_app_response import LLMAppResponse
 from application.dtos.llm_app_request import LLMAppRequest
 from application.enums.status_code import StatusCode
+from config.settings import LLM_STUDIO_DEFAULT_NAME, LLM_STUDIO_MAX_TOKENS, LLM_STUDIO_TEMPERATURE
 from infrastructure.llms_providers.llm_studio.dtos.llm_studio_request_dto import LLMStudioRequestDTO
+from infrastructure.llms_providers.llm_studio.dtos.llm_studio_chat_request_dto import LLMStudioChatRequestDTO
 from infrastructure.llms_providers.llm_studio.dtos.llm_studio_response_dto import (
     LLMStudioChoiceDTO,
     LLMStudioResponseDTO,
     LLMStudioUsageDTO
 )
+from infrastructure.llms_providers.llm_studio.services.chat_stream import AsyncChatStream, ChatStream
 
 class LLMStudioMapper:
     """
@@ -27,7 +30,39 @@ class LLMStudioMapper:
         """
         return LLMStudioRequestDTO(
             prompt=app_request.user_input,
-            max_tokens=100
+            max_tokens=app_request.context.get("max_tokens", LLM_STUDIO_MAX_TOKENS)
+        )
+
+    @staticmethod
+    def map_chat_request(
+        app_request: LLMAppRequest, stream: bool, model: str = LLM_STUDIO_DEFAULT_NAME
+    ) -> LLMStudioChatRequestDTO:
+        """
+        Transforma una instancia de LLMAppRequest en una solicitud de chat.
+
+        El contexto puede traer la conversación completa (`messages`), un `system`
+        prompt, y `max_tokens` / `temperature` / `model` para esta llamada.
+
+        Args:
+            app_request (LLMAppRequest): La solicitud de la aplicación.
+            stream (bool): Pedir la respuesta en streaming.
+            model (str): Modelo si el contexto no indica otro.
+
+        Returns:
+            LLMStudioChatRequestDTO: La solicitud formateada para `/chat/completions`.
+        """
+        context = app_request.context
+        messages = list(context.get("messages") or [])
+        if not messages:
+            if context.get("system"):
+                messages.append({"role": "system", "content": context["system"]})
+            messages.append({"role": "user", "content": app_request.user_input})
+        return LLMStudioChatRequestDTO(
+            messages=messages,
+            model=context.get("model", model),
+            max_tokens=context.get("max_tokens", LLM_STUDIO_MAX_TOKENS),
+            temperature=context.get("temperature", LLM_STUDIO_TEMPERATURE),
+            stream=stream,
         )
 
     @staticmethod
@@ -41,14 +76,21 @@ class LLMStudioMapper:
             message (str): Mensaje descriptivo del estado de la respuesta.
 
         Returns:
-            LLMAppResponse: La respuesta mapeada para la aplicación.
+            LLMAppResponse: La respuesta mapeada para la aplicación, con el uso de tokens,
+                los tiempos de `stats` (`time_to_first_token`, `generation_time`) y el modelo.
         """
         # Validar que se haya recibido al menos una opción.
         generated_text = dto.choices[0].text if dto.choices and len(dto.choices) > 0 else ""
+        stats = dto.stats or {}
         return LLMAppResponse(
             generated_text=generated_text,
             status=StatusCode(status_code),  # Convertimos el int a StatusCode
-            message=message
+            message=message,
+            prompt_tokens=dto.usage.prompt_tokens or 0,
+            completion_tokens=dto.usage.completion_tokens or 0,
+            ttft=stats.get("time_to_first_token"),
+            latency=stats.get("generation_time"),
+            model=dto.model,
         )
     
     @staticmethod
@@ -70,7 +112,8 @@ class LLMStudioMapper:
             choices=[
                 LLMStudioChoiceDTO(
                     index=choice.get("index", 0),
-                    text=choice.get("text", ""),
+                    # completions → "text"; chat/completions → "message.content"
+                    text=choice.get("text") or (choice.get("message") or {}).get("content") or "",
                     logprobs=choice.get("logprobs", None),
                     finish_reason=choice.get("finish_reason", "")
                 )
@@ -83,3 +126,30 @@ class LLMStudioMapper:
             ),
             stats=response_json.get("stats", {})
         )
+
+    @staticmethod
+    def stream_to_dto(stream: Union[ChatStream, AsyncChatStream]) -> LLMStudioResponseDTO:
+        """
+        Construye el DTO de respuesta a partir de un stream ya consumido.
+
+        Los tiempos medidos en cliente se guardan en `stats` con las mismas claves
+        que usa LLM Studio (`time_to_first_token`, `generation_time`).
+        """
+        usage = stream.usage or {}
+        return LLMStudioResponseDTO(
+            id=stream.id,
+            object_="chat.completion",
+            created=stream.created,
+            model=stream.model,
+            choices=[LLMStudioChoiceDTO(index=0, text=stream.text, logprobs=None, finish_reason=stream.finish_reason)],
+            usage=LLMStudioUsageDTO(
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+                total_tokens=usage.get("total_tokens", 0)
+            ),
+            stats={
+                "time_to_first_token": stream.ttft,
+                "generation_time": stream.total_time,
+                "chunks": stream.chunks,
+            }
+        )
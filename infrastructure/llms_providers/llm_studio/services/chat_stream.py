@@ -0,0 +1,201 @@
+# infrastructure/llms_providers/llm_studio/services/chat_stream.py
+"""
+Lectura incremental de una respuesta SSE de `/v1/chat/completions`.
+
+✔  Itera los fragmentos de texto según llegan del servidor (sin esperar al cuerpo completo).
+✔  Mide el tiempo hasta el primer token (TTFT) y el tiempo total de generación.
+✔  Recoge modelo, motivo de fin y uso de tokens (último evento con `include_usage`).
+✔  Versión asíncrona (AsyncChatStream) sobre httpx para los lotes concurrentes.
+"""
+
+import json
+import logging
+import time
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+_DONE = "[DONE]"
+
+
+def _parse_sse_line(line: str) -> Optional[object]:
+    """Evento de una línea SSE: dict, _DONE, o None si la línea no trae datos."""
+    if not line or not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if data == _DONE:
+        return _DONE
+    try:
+        return json.loads(data)
+    except ValueError:
+        logger.warning("[ChatStream] Evento SSE no válido: %.200s", data)
+        return None
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Eventos JSON de un flujo SSE: cada línea `data: {...}` hasta `data: [DONE]`.
+    Se ignoran comentarios (`: ping`), líneas vacías y campos distintos de `data`.
+    Tras `[DONE]` se lee el resto del cuerpo para que la conexión vuelva al pool.
+    """
+    done = False
+    for line in lines:
+        event = None if done else _parse_sse_line(line)
+        if event is _DONE:
+            done = True
+        elif event is not None:
+            yield event
+
+
+async def aiter_sse_data(lines: AsyncIterable[str]) -> AsyncIterator[dict]:
+    """Como iter_sse_data, sobre un iterable asíncrono de líneas."""
+    done = False
+    async for line in lines:
+        event = None if done else _parse_sse_line(line)
+        if event is _DONE:
+            done = True
+        elif event is not None:
+            yield event
+
+
+class _StreamState:
+    """Texto, métricas y metadatos acumulados a partir de los eventos del stream."""
+
+    def __init__(self, started_at: float):
+        self._started_at = started_at
+        self._first_token_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._parts = []
+        self._consumed = False
+
+        self.id = ""
+        self.model = ""
+        self.created = 0
+        self.finish_reason = ""
+        self.usage: dict = {}
+        self.chunks = 0
+
+    def _start(self) -> None:
+        if self._consumed:
+            raise RuntimeError("El stream ya se ha consumido")
+        self._consumed = True
+
+    def _finish(self) -> None:
+        if self._finished_at is None:
+            self._finished_at = time.perf_counter()
+
+    def _on_event(self, event: dict) -> Iterator[str]:
+        """Actualiza el estado con un evento y devuelve sus fragmentos de texto."""
+        self.id = event.get("id") or self.id
+        self.model = event.get("model") or self.model
+        self.created = event.get("created") or self.created
+        if event.get("usage"):
+            self.usage = event["usage"]
+        for choice in event.get("choices") or []:
+            delta = choice.get("delta") or {}
+            if self._first_token_at is None and (delta.get("content") or delta.get("tool_calls")):
+                self._first_token_at = time.perf_counter()
+                logger.info("[ChatStream] Primer token en %.3fs", self.ttft)
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+            content = delta.get("content")
+            if content:
+                self.chunks += 1
+                self._parts.append(content)
+                yield content
+
+    # ─────── MÉTRICAS ───────
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    @property
+    def ttft(self) -> Optional[float]:
+        """Segundos desde la petición hasta el primer token (None si aún no ha llegado)."""
+        return None if self._first_token_at is None else self._first_token_at - self._started_at
+
+    @property
+    def total_time(self) -> Optional[float]:
+        """Segundos desde la petición hasta el final del stream (None si sigue abierto)."""
+        return None if self._finished_at is None else self._finished_at - self._started_at
+
+
+class ChatStream(_StreamState):
+    """
+    Iterador de tokens de una respuesta en streaming.
+
+    Uso:
+        stream = llm_studio.stream(request)
+        for token in stream:
+            print(token, end="", flush=True)
+        print(stream.ttft, stream.usage)
+    """
+
+    def __init__(self, response: requests.Response, started_at: float):
+        """
+        Args:
+            response (requests.Response): Respuesta abierta con `stream=True`.
+            started_at (float): Instante (`time.perf_counter`) en que se envió la petición.
+        """
+        super().__init__(started_at)
+        # SSE siempre va en UTF-8; sin charset, requests asumiría ISO-8859-1
+        response.encoding = "utf-8"
+        self._response = response
+
+    def __iter__(self) -> Iterator[str]:
+        self._start()
+        try:
+            # chunk_size=None: cada trozo chunked se entrega en cuanto llega
+            for event in iter_sse_data(self._response.iter_lines(chunk_size=None, decode_unicode=True)):
+                yield from self._on_event(event)
+        finally:
+            self._finish()
+            self._response.close()
+
+    def read_all(self) -> str:
+        """Consume lo que quede del stream y devuelve el texto completo."""
+        if not self._consumed:
+            for _ in self:
+                pass
+        return self.text
+
+    def close(self) -> None:
+        """Corta la generación (cierra la conexión) sin leer el resto."""
+        self._consumed = True
+        self._finish()
+        self._response.close()
+
+
+class AsyncChatStream(_StreamState):
+    """
+    Equivalente asíncrono de ChatStream sobre una respuesta de httpx.
+
+    Uso:
+        async with client.stream("POST", url, json=payload) as response:
+            stream = AsyncChatStream(response, started_at)
+            async for token in stream:
+                ...
+    """
+
+    def __init__(self, response: httpx.Response, started_at: float):
+        super().__init__(started_at)
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        self._start()
+        try:
+            async for event in aiter_sse_data(self._response.aiter_lines()):
+                for content in self._on_event(event):
+                    yield content
+        finally:
+            self._finish()
+
+    async def read_all(self) -> str:
+        """Consume lo que quede del stream y devuelve el texto completo."""
+        if not self._consumed:
+            async for _ in self:
+                pass
+        return self.text
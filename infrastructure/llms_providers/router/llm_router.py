@@ -0,0 +1,317 @@
+# infrastructure/llms_providers/router/llm_router.py
+"""
+Router de proveedores LLM con conmutación por error y peticiones duplicadas (hedging).
+
+✔  Implementa LLMInterface sobre varios proveedores (instancias de LLM Studio, Gemini...).
+✔  Cada petición va al proveedor sano más rápido (p50 de su ventana reciente);
+   los que aún no tienen datos cuentan con la espera de hedging por defecto y
+   los que tienen una llamada en curso más lenta, con lo que lleva esa llamada.
+✔  Si el elegido falla, se reintenta en el siguiente; tras varios errores seguidos
+   un proveedor queda en cuarentena y pasa al final de la lista.
+✔  Hedging opcional: si el primero tarda más que su percentil configurado,
+   se lanza la misma petición al segundo y gana la primera respuesta correcta.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from config.settings import (
+    LLM_ROUTER_BACKENDS,
+    LLM_ROUTER_HEDGE,
+    LLM_ROUTER_HEDGE_PERCENTILE,
+    LLM_ROUTER_HEDGE_MIN_DELAY,
+    LLM_ROUTER_HEDGE_DEFAULT_DELAY,
+    LLM_ROUTER_MAX_ERROR_RATE,
+    LLM_ROUTER_MIN_SAMPLES,
+    LLM_ROUTER_MAX_WORKERS,
+)
+from application.dtos.llm_app_request import LLMAppRequest
+from application.dtos.llm_app_response import LLMAppResponse
+from application.enums.status_code import StatusCode
+from application.interfaces.llm_interface import LLMInterface
+from infrastructure.llms_providers.router.services.provider_health import ProviderHealth, ProviderStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouterBackend:
+    name: str
+    provider: LLMInterface
+    health: ProviderHealth = field(default_factory=ProviderHealth)
+
+
+@dataclass
+class RouterStats:
+    requests: int = 0
+    hedged: int = 0        # peticiones duplicadas en un segundo proveedor
+    hedge_wins: int = 0    # ... en las que respondió antes el duplicado
+    failovers: int = 0     # reintentos en otro proveedor tras un error
+    failures: int = 0      # peticiones en las que fallaron todos
+    providers: List[ProviderStats] = field(default_factory=list)
+
+
+class LLMRouter(LLMInterface):
+    """
+    LLMInterface que reparte cada petición entre varios proveedores.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[Tuple[str, LLMInterface]],
+        hedge: bool = LLM_ROUTER_HEDGE,
+        hedge_percentile: float = LLM_ROUTER_HEDGE_PERCENTILE,
+        hedge_min_delay: float = LLM_ROUTER_HEDGE_MIN_DELAY,
+        hedge_default_delay: float = LLM_ROUTER_HEDGE_DEFAULT_DELAY,
+        max_error_rate: float = LLM_ROUTER_MAX_ERROR_RATE,
+        min_samples: int = LLM_ROUTER_MIN_SAMPLES,
+        max_workers: int = LLM_ROUTER_MAX_WORKERS,
+    ):
+        """
+        Args:
+            providers: Pares (nombre, proveedor), en orden de preferencia inicial.
+            hedge (bool): Duplicar en el segundo proveedor las peticiones lentas.
+            hedge_percentile (float): Percentil (0-1) de latencia del primero a partir del cual se duplica.
+            hedge_min_delay (float): Espera mínima (s) antes de duplicar.
+            hedge_default_delay (float): Espera (s) si el proveedor aún no tiene `min_samples` llamadas correctas.
+            max_error_rate (float): Proporción de errores a partir de la cual un proveedor deja de considerarse sano.
+            min_samples (int): Llamadas correctas necesarias para fiarse de su percentil.
+            max_workers (int): Hilos para las llamadas síncronas en paralelo (hedging).
+        """
+        if not providers:
+            raise ValueError("LLMRouter necesita al menos un proveedor")
+        self._backends = [RouterBackend(name, provider) for name, provider in providers]
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_default_delay = hedge_default_delay
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-router")
+        self._stats = RouterStats()
+        self._lock = threading.Lock()
+
+    # ─────── SELECCIÓN ───────
+    def ranked(self) -> List[RouterBackend]:
+        """Proveedores en orden de uso: sanos primero y, dentro de cada grupo, por latencia mediana."""
+        def key(backend: RouterBackend):
+            health = backend.health
+            healthy = health.available() and (health.error_rate() <= self.max_error_rate or health.idle())
+            p50 = health.latency(0.5)
+            # Sin datos se supone la espera por defecto (no 0: su primera llamada puede estar
+            # atascada); una llamada en curso más lenta que la mediana cuenta como su latencia
+            expected = p50 if p50 is not None else self.hedge_default_delay
+            return (not healthy, max(expected, health.oldest_in_flight()))
+
+        # sorted es estable: a igualdad se respeta el orden configurado
+        return sorted(self._backends, key=key)
+
+    def hedge_delay(self, backend: RouterBackend) -> float:
+        """Segundos que se espera al proveedor antes de duplicar la petición."""
+        if backend.health.successes() < self.min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, backend.health.latency(self.hedge_percentile) or 0.0)
+
+    # ─────── LLMInterface ───────
+    def send_data(self, request: LLMAppRequest) -> LLMAppResponse:
+        self._count("requests")
+        queue = deque(self.ranked())
+        primary = queue[0]
+        pending = {}
+        hedged = False
+        last: Optional[LLMAppResponse] = None
+
+        def launch() -> None:
+            backend = queue.popleft()
+            pending[self._executor.submit(self._call, backend, request)] = (backend, time.monotonic())
+
+        launch()
+        while pending:
+            timeout = None
+            if self.hedge and not hedged and queue and len(pending) == 1:
+                backend, started = next(iter(pending.values()))
+                timeout = max(0.0, self.hedge_delay(backend) - (time.monotonic() - started))
+
+            done, _ = concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                self._count("hedged")
+                logger.info("[LLMRouter] %s tarda más de %.2fs; se duplica en %s",
+                            backend.name, timeout, queue[0].name)
+                launch()
+                continue
+
+            for future in done:
+                backend, _ = pending.pop(future)
+                response = future.result()
+                if response.status == StatusCode.SUCCESS:
+                    # Las peticiones que sigan en curso terminan en segundo plano y cuentan para su latencia
+                    return self._won(backend, response, by_hedge=hedged and backend is not primary)
+                last = response
+            if queue and not pending:
+                self._count("failovers")
+                logger.warning("[LLMRouter] %s falló (%s); se prueba %s", backend.name, last.message, queue[0].name)
+                launch()
+
+        return self._all_failed(last)
+
+    async def async_send_data(self, request: LLMAppRequest) -> LLMAppResponse:
+        self._count("requests")
+        queue = deque(self.ranked())
+        primary = queue[0]
+        pending = {}
+        hedged = False
+        last: Optional[LLMAppResponse] = None
+
+        def launch() -> None:
+            backend = queue.popleft()
+            pending[asyncio.ensure_future(self._acall(backend, request))] = (backend, time.monotonic())
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if self.hedge and not hedged and queue and len(pending) == 1:
+                    backend, started = next(iter(pending.values()))
+                    timeout = max(0.0, self.hedge_delay(backend) - (time.monotonic() - started))
+
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self._count("hedged")
+                    launch()
+                    continue
+
+                for task in done:
+                    backend, _ = pending.pop(task)
+                    response = task.result()
+                    if response.status == StatusCode.SUCCESS:
+                        return self._won(backend, response, by_hedge=hedged and backend is not primary)
+                    last = response
+                if queue and not pending:
+                    self._count("failovers")
+                    launch()
+        finally:
+            # En asíncrono las perdedoras se cancelan: no deben sobrevivir al bucle de eventos
+            for task in pending:
+                task.cancel()
+
+        return self._all_failed(last)
+
+    async def aclose(self) -> None:
+        for backend in self._backends:
+            await backend.provider.aclose()
+
+    @property
+    def batch_concurrency(self) -> int:
+        return max(backend.provider.batch_concurrency for backend in self._backends)
+
+    def get_model_name(self) -> str:
+        # autogen usa un único endpoint: el del proveedor preferido en este momento
+        return self.ranked()[0].provider.get_model_name()
+
+    def get_base_url(self) -> str:
+        return self.ranked()[0].provider.get_base_url()
+
+    def get_api_key(self) -> str:
+        return self.ranked()[0].provider.get_api_key()
+
+    # ─────── MÉTRICAS ───────
+    def stats(self) -> RouterStats:
+        with self._lock:
+            stats = RouterStats(
+                requests=self._stats.requests,
+                hedged=self._stats.hedged,
+                hedge_wins=self._stats.hedge_wins,
+                failovers=self._stats.failovers,
+                failures=self._stats.failures,
+            )
+        stats.providers = [backend.health.snapshot(backend.name) for backend in self._backends]
+        return stats
+
+    # ─────── HELPERS ───────
+    @staticmethod
+    def _call(backend: RouterBackend, request: LLMAppRequest) -> LLMAppResponse:
+        call_id = backend.health.begin()
+        started = time.perf_counter()
+        try:
+            response = backend.provider.send_data(request)
+        except Exception as exc:
+            logger.exception("[LLMRouter] Error en %s", backend.name)
+            response = LLMAppResponse(generated_text="", status=StatusCode.ERROR, message=f"Error interno: {exc}")
+        finally:
+            backend.health.end(call_id)
+        backend.health.record(time.perf_counter() - started, response.status == StatusCode.SUCCESS)
+        return response
+
+    @staticmethod
+    async def _acall(backend: RouterBackend, request: LLMAppRequest) -> LLMAppResponse:
+        call_id = backend.health.begin()
+        started = time.perf_counter()
+        try:
+            response = await backend.provider.async_send_data(request)
+        except Exception as exc:
+            logger.exception("[LLMRouter] Error en %s", backend.name)
+            response = LLMAppResponse(generated_text="", status=StatusCode.ERROR, message=f"Error interno: {exc}")
+        finally:
+            backend.health.end(call_id)
+        # Una tarea cancelada (perdedora del hedging) no llega aquí y no cuenta como error
+        backend.health.record(time.perf_counter() - started, response.status == StatusCode.SUCCESS)
+        return response
+
+    def _won(self, backend: RouterBackend, response: LLMAppResponse, by_hedge: bool) -> LLMAppResponse:
+        backend.health.won()
+        if by_hedge:
+            self._count("hedge_wins")
+        return response
+
+    def _all_failed(self, last: Optional[LLMAppResponse]) -> LLMAppResponse:
+        self._count("failures")
+        detail = last.message if last is not None else "sin proveedores"
+        return LLMAppResponse(
+            generated_text="",
+            status=StatusCode.ERROR,
+            message=f"Todos los proveedores fallaron (último error: {detail})",
+        )
+
+    def _count(self, field_name: str) -> None:
+        with self._lock:
+            setattr(self._stats, field_name, getattr(self._stats, field_name) + 1)
+
+
+def build_router(specs: Sequence[dict] = LLM_ROUTER_BACKENDS) -> LLMRouter:
+    """
+    Crea el router a partir de LLM_ROUTER_BACKENDS, p. ej.:
+        [{"type": "llm_studio", "url": "http://gpu1:1234/v1", "model": "..."}, {"type": "gemini"}]
+
+    Los proveedores que no se pueden construir (p. ej. Gemini sin API key) se omiten con un aviso.
+    """
+    providers = []
+    for i, spec in enumerate(specs):
+        kind = spec.get("type", "llm_studio")
+        name = spec.get("name") or f"{kind}-{i}"
+        try:
+            # Cada SDK se importa solo si algún backend lo usa
+            if kind == "llm_studio":
+                from infrastructure.llms_providers.llm_studio.llm_studio import LLMStudio
+                provider = LLMStudio(base_url=spec.get("url"), model=spec.get("model"))
+            elif kind == "gemini":
+                from infrastructure.llms_providers.gemini.gemini import Gemini
+                provider = Gemini()
+            else:
+                raise ValueError(f"tipo de proveedor desconocido '{kind}'")
+        except Exception as exc:
+            logger.warning("[LLMRouter] Proveedor %s descartado: %s", name, exc)
+            continue
+        providers.append((name, provider))
+
+    if not providers:
+        raise ValueError("LLM_ROUTER_BACKENDS no define ningún proveedor utilizable")
+    logger.info("[LLMRouter] Proveedores: %s", ", ".join(name for name, _ in providers))
+    return LLMRouter(providers)
@@ -0,0 +1,166 @@
+# infrastructure/llms_providers/router/services/provider_health.py
+"""
+Salud de un proveedor LLM a partir de sus últimas llamadas.
+
+✔  Ventana deslizante de latencias y resultados (éxito / error).
+✔  Percentiles de latencia (p50 para ordenar, pXX para decidir cuándo duplicar).
+✔  Tras N errores seguidos el proveedor queda en cuarentena unos segundos;
+   pasado ese tiempo recibe una petición de prueba.
+✔  Un proveedor descartado por su tasa de errores vuelve a probarse cuando lleva
+   ese mismo tiempo sin tráfico (si no, su ventana no cambiaría nunca).
+✔  Llamadas en curso: una que lleva más que la mediana delata un proveedor atascado
+   antes de que termine (o aunque no haya terminado ninguna todavía).
+"""
+
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from config.settings import (
+    LLM_ROUTER_WINDOW,
+    LLM_ROUTER_FAILURE_THRESHOLD,
+    LLM_ROUTER_COOLDOWN,
+)
+
+
+@dataclass
+class ProviderStats:
+    """
+    Instantánea de la salud de un proveedor.
+
+    Attributes:
+        name (str): Nombre del proveedor en el router.
+        requests (int): Llamadas registradas desde el arranque.
+        errors (int): Llamadas fallidas desde el arranque.
+        error_rate (float): Proporción de errores en la ventana.
+        p50 (float, optional): Latencia mediana (s) de las llamadas correctas de la ventana.
+        p95 (float, optional): Percentil 95 de latencia (s).
+        available (bool): False mientras está en cuarentena.
+        wins (int): Peticiones que respondió este proveedor.
+    """
+    name: str
+    requests: int = 0
+    errors: int = 0
+    error_rate: float = 0.0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    available: bool = True
+    wins: int = 0
+
+
+def percentile(values, q: float) -> Optional[float]:
+    """Percentil `q` (0-1) por el método del rango más cercano; None si no hay datos."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(q * len(ordered)) - 1)
+    return ordered[index]
+
+
+class ProviderHealth:
+    """
+    Latencia y errores recientes de un proveedor (thread-safe).
+    """
+
+    def __init__(
+        self,
+        window: int = LLM_ROUTER_WINDOW,
+        failure_threshold: int = LLM_ROUTER_FAILURE_THRESHOLD,
+        cooldown: float = LLM_ROUTER_COOLDOWN,
+    ):
+        """
+        Args:
+            window (int): Llamadas que se recuerdan.
+            failure_threshold (int): Errores consecutivos que abren la cuarentena.
+            cooldown (float): Segundos de cuarentena.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._blocked_until = 0.0
+        self._last_at = time.monotonic()
+        self._requests = 0
+        self._errors = 0
+        self._wins = 0
+        self._in_flight: Dict[int, float] = {}  # id de llamada → inicio (monotonic)
+        self._call_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def begin(self) -> int:
+        """Anota una llamada en curso y devuelve su id para `end`."""
+        with self._lock:
+            call_id = next(self._call_ids)
+            self._in_flight[call_id] = time.monotonic()
+            return call_id
+
+    def end(self, call_id: int) -> None:
+        """Da por terminada (con o sin respuesta) la llamada `call_id`."""
+        with self._lock:
+            self._in_flight.pop(call_id, None)
+
+    def oldest_in_flight(self) -> float:
+        """Segundos que lleva la llamada en curso más antigua (0 si no hay ninguna)."""
+        with self._lock:
+            if not self._in_flight:
+                return 0.0
+            return time.monotonic() - min(self._in_flight.values())
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self._samples.append((latency, ok))
+            self._last_at = time.monotonic()
+            self._requests += 1
+            if ok:
+                self._consecutive_failures = 0
+                self._blocked_until = 0.0
+                return
+            self._errors += 1
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._blocked_until = time.monotonic() + self.cooldown
+
+    def won(self) -> None:
+        with self._lock:
+            self._wins += 1
+
+    def available(self) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._blocked_until
+
+    def idle(self) -> bool:
+        """True si lleva `cooldown` segundos sin ninguna llamada registrada."""
+        with self._lock:
+            return time.monotonic() - self._last_at >= self.cooldown
+
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._samples:
+                return 0.0
+            return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def latency(self, q: float) -> Optional[float]:
+        """Percentil `q` de la latencia de las llamadas correctas de la ventana."""
+        with self._lock:
+            latencies = [latency for latency, ok in self._samples if ok]
+        return percentile(latencies, q)
+
+    def successes(self) -> int:
+        with self._lock:
+            return sum(1 for _, ok in self._samples if ok)
+
+    def snapshot(self, name: str) -> ProviderStats:
+        return ProviderStats(
+            name=name,
+            requests=self._requests,
+            errors=self._errors,
+            error_rate=self.error_rate(),
+            p50=self.latency(0.5),
+            p95=self.latency(0.95),
+            available=self.available(),
+            wins=self._wins,
+        )
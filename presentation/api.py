@@ -1,8 +1,10 @@
 # presentation/api.py
 import logging
+from dataclasses import asdict
 from pathlib import Path
 
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 
 try:
     from flask_cors import CORS
@@ -16,11 +18,27 @@ logging.basicConfig(level=logging.ERROR, format="%(message)s")
 logging.getLogger("autogen.oai.client").setLevel(logging.CRITICAL)
 
 from application.enums.llm_provider import LLMProvider
+from application.dtos.llm_usage_summary import LLMUsageSummary
 from application.dependency_injection import DependencyInjector
 from application.use_cases.autogen_runtime import run_autogen_chat
+from infrastructure.agents.webscraper.dtos.product_batch import ProductBatch
+from infrastructure.agents.email.services.outbox_dispatcher import get_shared_outbox
+from infrastructure.llms_providers.cached.services.response_cache import get_shared_response_cache
+
+
+class ChatJSONProvider(DefaultJSONProvider):
+    """JSON de Flask que además sabe serializar los lotes de productos del scraper."""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, ProductBatch):
+            return o.to_records()
+        return DefaultJSONProvider.default(o)
+
 
 # ── flask ───────────────────────────────────────────────
 app = Flask(__name__, static_folder="./front_app", static_url_path="")
+app.json = ChatJSONProvider(app)
 CORS(app)
 
 
@@ -42,14 +60,16 @@ def chat():
 
     try:
         deps = DependencyInjector.get_autogen_user_and_manager(llm_type)
-        chat_result = run_autogen_chat(deps["user"], deps["manager"], prompt)
+        usage = LLMUsageSummary()
+        chat_result = run_autogen_chat(deps["user"], deps["manager"], prompt, cache=deps["cache"], usage=usage)
 
         print("API FLASK", chat_result)
 
         return (
             jsonify(
                 status="success",
-                data=chat_result   # <-- "data" es estándar y explícito
+                data=chat_result,   # <-- "data" es estándar y explícito
+                usage=usage.to_dict(),  # tokens, latencias y modelos de las llamadas al LLM del chat
             ),
             200,
         )
@@ -60,6 +80,42 @@ def chat():
             500,
         )
     
+@app.route("/email/outbox", methods=["GET"])
+def email_outbox():
+    """Resumen de la bandeja de salida: correos por estado, resúmenes abiertos y los últimos encolados."""
+    # Solo lectura: no arranca los workers de envío
+    outbox = get_shared_outbox()
+    status = request.args.get("status")
+    try:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return jsonify(status="error", message="'limit' debe ser un número entero"), 400
+    # Un LIMIT negativo en SQLite es "sin límite"
+    limit = max(1, min(limit, 200))
+    return jsonify(
+        status="success",
+        counts=outbox.counts(),
+        digests=outbox.digest_counts(),
+        messages=[m.to_dict() for m in outbox.recent(limit, status)],
+    )
+
+
+@app.route("/email/outbox/<message_id>", methods=["GET"])
+def email_status(message_id: str):
+    """Estado de entrega de un correo encolado por el EmailAgent."""
+    message = get_shared_outbox().get(message_id)
+    if message is None:
+        return jsonify(status="error", message=f"No existe el correo '{message_id}'"), 404
+    return jsonify(status="success", data=message.to_dict())
+
+
+@app.route("/llm/cache", methods=["GET"])
+def llm_cache_stats():
+    """Aciertos, fallos y tamaño de la caché de respuestas de LLM."""
+    stats = get_shared_response_cache().stats()
+    return jsonify(status="success", data={**asdict(stats), "hit_rate": stats.hit_rate})
+
+
 @app.route("/readme", methods=["GET"])
 def download_readme():
     """Devuelve el contenido del README.md en texto plano"""
@@ -16,6 +16,15 @@ logging.getLogger("autogen.oai.client").setLevel(logging.CRITICAL)
 from application.use_cases.autogen_runtime import run_autogen_chat
 from application.dependency_injection import DependencyInjector
 from application.enums.llm_provider import LLMProvider
+from application.dtos.llm_usage_summary import LLMUsageSummary
+from infrastructure.agents.webscraper.dtos.product_batch import ProductBatch
+
+
+def _printable(result):
+    """El resultado tal cual, salvo el lote de productos del scraper, que se muestra como registros."""
+    if isinstance(result, dict):
+        return {k: v.to_records() if isinstance(v, ProductBatch) else v for k, v in result.items()}
+    return result
 
 
 def main() -> None:
@@ -52,10 +61,16 @@ def main() -> None:
             manager.groupchat.messages = []
 
             # Ejecutar conversación
-            result = run_autogen_chat(user, manager, prompt)
+            usage = LLMUsageSummary()
+            result = run_autogen_chat(user, manager, prompt, cache=deps["cache"], usage=usage)
 
             print("\n--- RESULTADO EN CLI_APP ----------------------------------------")
-            print(result)
+            print(_printable(result))
+            print(
+                f"LLM: {usage.calls} llamadas ({usage.cached_calls} de caché) | "
+                f"tokens {usage.prompt_tokens} prompt + {usage.completion_tokens} generados | "
+                f"{usage.latency:.2f}s de modelo (máx. {usage.max_latency:.2f}s)"
+            )
             print("----------------------------------------------------\n")
 
         except ConnectionError: